@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Fake requests transport serving recorded fixtures
+
+Routes map absolute URLs to fixture files (fixtures/routes.json). Every
+response can be delayed to simulate network latency, and the transport keeps
+counters of requests, bytes read by the client and time spent "on the wire".
+"""
+
+import io
+import os
+import json
+import time
+import threading
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+class _CountingBody(io.BytesIO):
+    """Response body that adds the bytes the client actually reads to the transport"""
+
+    def __init__(self, body, transport):
+        super().__init__(body)
+        self.transport = transport
+
+    def read(self, size=-1):
+        data = super().read(size)
+        with self.transport._lock:
+            self.transport.bytes += len(data)
+        return data
+
+
+class FakeTransport(BaseAdapter):
+    """Transport adapter answering requests from recorded fixtures"""
+
+    def __init__(self, routes=None, latency_ms=0, fixtures_dir=FIXTURES_DIR):
+        super().__init__()
+        if routes is None:
+            with open(os.path.join(fixtures_dir, 'routes.json'), 'r', encoding='utf-8') as f:
+                routes = json.load(f)
+        self.routes = routes
+        self.latency_ms = latency_ms
+        self.fixtures_dir = fixtures_dir
+        self._bodies = {}
+        self._lock = threading.Lock()
+        self.reset_counters()
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests = 0
+            self.bytes = 0
+            self.wire_ms = 0.0
+            self.urls = []
+
+    def install(self, session):
+        """Mount the transport on a requests session for http and https"""
+        session.mount('http://', self)
+        session.mount('https://', self)
+        return self
+
+    def _body(self, filename):
+        if filename not in self._bodies:
+            with open(os.path.join(self.fixtures_dir, filename), 'rb') as f:
+                self._bodies[filename] = f.read()
+        return self._bodies[filename]
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        route = self.routes.get(request.url, {'status': 404})
+        latency = route.get('latency_ms', self.latency_ms) / 1000.0
+        if latency:
+            time.sleep(latency)
+
+        status = route.get('status', 200)
+        body = self._body(route['file']) if 'file' in route else b''
+
+        headers = CaseInsensitiveDict({
+            'Content-Type': route.get('content_type', 'text/html; charset=UTF-8')
+        })
+
+        range_header = request.headers.get('Range', '')
+        if status == 200 and range_header.startswith('bytes='):
+            start, _, end = range_header[6:].partition('-')
+            start = int(start or 0)
+            end = min(int(end), len(body) - 1) if end else len(body) - 1
+            headers['Content-Range'] = f'bytes {start}-{end}/{len(body)}'
+            body = body[start:end + 1]
+            status = 206
+
+        if request.method == 'HEAD':
+            headers['Content-Length'] = str(len(body))
+            body = b''
+        else:
+            headers['Content-Length'] = str(len(body))
+
+        with self._lock:
+            self.requests += 1
+            self.wire_ms += latency * 1000
+            self.urls.append(request.url)
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = 'OK' if status < 400 else 'Error'
+        response.headers = headers
+        response.raw = _CountingBody(body, self)
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
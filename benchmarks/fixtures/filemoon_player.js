@@ -0,0 +1,2002 @@
+/* player */
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var a=1;
+var src="https://be1.filemoon.com/hls2/01/00123/abc123xyz_,l,n,h,.urlset/master.m3u8?t=jstok&s=4102444800&e=10800";
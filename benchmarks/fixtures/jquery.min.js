@@ -0,0 +1,3001 @@
+/*! jQuery */
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
+!function(e,t){"use strict";}(window);
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Dora Bash listing store benchmark
+
+Compares the memory-mapped card snapshots of the listing store against the
+JSON files of parsed dictionaries it used before. Pages are built from the
+recorded listing records, with titles and URLs made unique per page.
+
+For each format it reports the time to write a page, to check whether a page
+is fresh (what prefetching does for every page), to render a whole page and
+to read only its first items, plus the file size and the Python memory held
+by a store of all pages. Mapped snapshot pages live in the OS page cache,
+which tracemalloc does not count.
+
+Usage:
+    python benchmarks/listing_bench.py [--pages N] [--runs N]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import tracemalloc
+
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+
+sys.path.insert(0, os.path.join(BENCH_DIR, 'stubs'))
+sys.path.insert(0, ROOT_DIR)
+
+from resources.lib import snapshot, utils  # noqa: E402
+
+
+FIXTURES_DIR = os.path.join(BENCH_DIR, 'fixtures')
+
+# Items the resolve ahead worker reads from the top of a listing
+TOP_ITEMS = 3
+
+
+def build_pages(count):
+    """Listing pages of recorded records, unique per page like the real site"""
+    with open(os.path.join(FIXTURES_DIR, 'listing.expected.json'), 'r', encoding='utf-8') as f:
+        records = json.load(f)
+    pages = []
+    for page in range(1, count + 1):
+        pages.append([dict(record, title=f"{record['title']} #{page}",
+                           url=f"{record['url']}?page={page}",
+                           thumbnail=f"{record['thumbnail']}?page={page}") for record in records])
+    return pages
+
+
+class JsonStore(object):
+    """The previous listing store: JSON entries of parsed dictionaries"""
+
+    name = 'json dicts'
+    extension = '.json'
+
+    def write(self, path, records, expires):
+        utils.write_json(path, {'stored': time.time(), 'expires': expires, 'records': records})
+
+    def load(self, path):
+        entry = utils.read_json(path, None)
+        return entry['expires'], entry['records']
+
+
+class SnapshotStore(object):
+    name = 'mmap snapshot'
+    extension = '.snap'
+
+    def write(self, path, records, expires):
+        snapshot.write(path, records, time.time(), expires)
+
+    def load(self, path):
+        records = snapshot.load(path)
+        return records.expires, records
+
+
+def render(records):
+    """Touch every field the way list_movies() does"""
+    for record in records:
+        record['title'], record['url'], record.get('thumbnail', ''), record.get('status', 'N/A'), record.get('type')
+
+
+def render_top(records):
+    render(records[:TOP_ITEMS])
+
+
+def time_ms(func, runs):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def measure(store, pages, runs):
+    directory = os.path.join(utils.get_profile_path('listing_bench', ''), store.name.replace(' ', '_'))
+    os.makedirs(directory, exist_ok=True)
+    paths = [os.path.join(directory, f'page-{index}{store.extension}') for index in range(len(pages))]
+    expires = time.time() + 3600
+
+    def write_all():
+        for path, records in zip(paths, pages):
+            store.write(path, records, expires)
+
+    def check_all():
+        for path in paths:
+            store.load(path)[0] > time.time()
+
+    def render_all():
+        for path in paths:
+            render(store.load(path)[1])
+
+    def top_all():
+        for path in paths:
+            render_top(store.load(path)[1])
+
+    per_page = float(len(pages))
+    metrics = {
+        'write_ms': time_ms(write_all, runs) / per_page,
+        'fresh_ms': time_ms(check_all, runs) / per_page,
+        'render_ms': time_ms(render_all, runs) / per_page,
+        'top_ms': time_ms(top_all, runs) / per_page,
+        'file_kb': sum(os.path.getsize(path) for path in paths) / per_page / 1024.0
+    }
+
+    # Python memory of a store holding every page, as the listing store does
+    tracemalloc.start()
+    held = [store.load(path)[1] for path in paths]
+    metrics['held_kb'] = tracemalloc.get_traced_memory()[0] / 1024.0
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    render_all()
+    metrics['render_peak_kb'] = tracemalloc.get_traced_memory()[1] / 1024.0
+    tracemalloc.stop()
+    del held
+    return metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dora Bash listing store benchmark')
+    parser.add_argument('--pages', type=int, default=50, help='listing pages in the store')
+    parser.add_argument('--runs', type=int, default=7, help='timed runs per measurement')
+    args = parser.parse_args()
+
+    pages = build_pages(args.pages)
+    print(f"{args.pages} pages of {len(pages[0])} records")
+
+    results = [(store.name, measure(store, pages, args.runs)) for store in (JsonStore(), SnapshotStore())]
+
+    header = (f"{'format':<16}{'write':>10}{'fresh?':>10}{'render':>10}{'top ' + str(TOP_ITEMS):>10}"
+              f"{'file KB':>9}{'held KB':>10}{'peak KB':>10}")
+    print(header)
+    print('-' * len(header))
+    for name, m in results:
+        print(f"{name:<16}{m['write_ms']:>8.3f}ms{m['fresh_ms']:>8.3f}ms{m['render_ms']:>8.3f}ms"
+              f"{m['top_ms']:>8.3f}ms{m['file_kb']:>9.1f}{m['held_kb']:>10.1f}{m['render_peak_kb']:>10.1f}")
+    print("Times are per page; held KB is the Python heap of a store of all pages, "
+          "peak KB the heap peak while rendering all of them.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
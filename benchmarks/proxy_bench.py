@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+Dora Bash read-ahead proxy benchmark
+
+Starts a local fixture server that throttles every connection (like the CDNs
+behind Blogspot and Filemoon), then plays an HLS stream and an MP4 file the
+way a player does: one request at a time, consuming data in real time.
+Each stream is played directly and through resources/lib/proxy.py, and the
+time the player spends waiting for data (stall time) is compared. The bytes
+received through the proxy are checked against the source, including a
+seek into the middle of the MP4.
+
+Usage:
+    python benchmarks/proxy_bench.py [--rate KBPS] [--latency MS] [--prefetch N]
+"""
+
+import os
+import sys
+import time
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+
+sys.path.insert(0, os.path.join(BENCH_DIR, 'stubs'))
+sys.path.insert(0, ROOT_DIR)
+
+import requests  # noqa: E402
+
+from resources.lib import proxy  # noqa: E402
+
+
+SEGMENTS = 12
+SEGMENT_BYTES = 256 * 1024
+MP4_BYTES = 6 * 1024 * 1024
+
+# Player consumption: seconds of playback per segment, and per MB of MP4
+SEGMENT_PLAY_SECONDS = 0.15
+MP4_PLAY_SECONDS_PER_MB = 0.15
+
+REFERER = 'https://dorabash.com/'
+
+
+def _make_payload(size, seed):
+    """Deterministic pseudo-random bytes"""
+    blocks = []
+    digest = seed.encode('utf-8')
+    while sum(len(b) for b in blocks) < size:
+        digest = hashlib.sha256(digest).digest()
+        blocks.append(digest * 128)
+    return b''.join(blocks)[:size]
+
+
+class FixtureServer(object):
+    """Local origin with per-connection throttling and Referer checks"""
+
+    def __init__(self, rate_kbps, latency_ms):
+        self.segments = [_make_payload(SEGMENT_BYTES, f'seg{i}') for i in range(SEGMENTS)]
+        self.mp4 = _make_payload(MP4_BYTES, 'mp4')
+        self.rate = rate_kbps * 1024.0
+        self.latency = latency_ms / 1000.0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        playlist = ['#EXTM3U', '#EXT-X-VERSION:3', '#EXT-X-TARGETDURATION:6', '#EXT-X-MEDIA-SEQUENCE:0']
+        for i in range(SEGMENTS):
+            playlist += ['#EXTINF:6.0,', f'seg{i}.ts']
+        playlist.append('#EXT-X-ENDLIST')
+        self.media_playlist = '\n'.join(playlist).encode('utf-8')
+        self.master_playlist = (
+            '#EXTM3U\n'
+            '#EXT-X-STREAM-INF:BANDWIDTH=1600000,RESOLUTION=1280x720\n'
+            'v720/index.m3u8\n'
+        ).encode('utf-8')
+
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                fixture.handle(self)
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def base(self):
+        return f'http://127.0.0.1:{self._server.server_address[1]}'
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def handle(self, request):
+        with self._lock:
+            self.requests += 1
+        time.sleep(self.latency)
+
+        if request.headers.get('Referer') != REFERER:
+            request.send_error(403)
+            return
+
+        path = request.path
+        status, content_type, body, extra = 200, 'application/octet-stream', None, {}
+        if path == '/hls/master.m3u8':
+            body, content_type = self.master_playlist, 'application/vnd.apple.mpegurl'
+        elif path == '/hls/v720/index.m3u8':
+            body, content_type = self.media_playlist, 'application/vnd.apple.mpegurl'
+        elif path.startswith('/hls/v720/seg'):
+            body, content_type = self.segments[int(path[len('/hls/v720/seg'):-3])], 'video/mp2t'
+        elif path == '/video.mp4':
+            body, content_type = self.mp4, 'video/mp4'
+            extra['Accept-Ranges'] = 'bytes'
+            range_header = request.headers.get('Range')
+            if range_header:
+                start, _, end = range_header[len('bytes='):].partition('-')
+                start = int(start)
+                end = min(int(end), len(self.mp4) - 1) if end else len(self.mp4) - 1
+                extra['Content-Range'] = f'bytes {start}-{end}/{len(self.mp4)}'
+                body, status = self.mp4[start:end + 1], 206
+        else:
+            request.send_error(404)
+            return
+
+        request.send_response(status)
+        request.send_header('Content-Type', content_type)
+        request.send_header('Content-Length', str(len(body)))
+        for name, value in extra.items():
+            request.send_header(name, value)
+        request.end_headers()
+
+        # Throttle this connection to the configured rate
+        block = 16 * 1024
+        try:
+            for offset in range(0, len(body), block):
+                request.wfile.write(body[offset:offset + block])
+                time.sleep(min(block, len(body) - offset) / self.rate)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def play_hls(session, playlist_url, headers):
+    """Play an HLS stream segment by segment
+
+    Returns:
+        tuple: (stall seconds, sha1 of all segment bytes)
+    """
+    stall = 0.0
+    digest = hashlib.sha1()
+
+    started = time.perf_counter()
+    response = session.get(playlist_url, headers=headers)
+    response.raise_for_status()
+    stall += time.perf_counter() - started
+
+    variant = [line for line in response.text.splitlines() if line and not line.startswith('#')][0]
+    started = time.perf_counter()
+    response = session.get(requests.compat.urljoin(response.url, variant), headers=headers)
+    response.raise_for_status()
+    stall += time.perf_counter() - started
+
+    media_url = response.url
+    for segment in [line for line in response.text.splitlines() if line and not line.startswith('#')]:
+        started = time.perf_counter()
+        data = session.get(requests.compat.urljoin(media_url, segment), headers=headers).content
+        stall += time.perf_counter() - started
+        digest.update(data)
+        time.sleep(SEGMENT_PLAY_SECONDS)
+
+    return stall, digest.hexdigest()
+
+
+def play_mp4(session, url, headers, start=0):
+    """Play an MP4 over one open-ended ranged request
+
+    Returns:
+        tuple: (stall seconds, sha1 of the bytes received)
+    """
+    stall = 0.0
+    digest = hashlib.sha1()
+    block = 256 * 1024
+
+    started = time.perf_counter()
+    response = session.get(url, headers=dict(headers, Range=f'bytes={start}-'), stream=True)
+    response.raise_for_status()
+    chunks = response.iter_content(block)
+    while True:
+        try:
+            data = next(chunks)
+        except StopIteration:
+            break
+        stall += time.perf_counter() - started
+        digest.update(data)
+        time.sleep(MP4_PLAY_SECONDS_PER_MB * len(data) / (1024 * 1024))
+        started = time.perf_counter()
+    response.close()
+
+    return stall, digest.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dora Bash read-ahead proxy benchmark')
+    parser.add_argument('--rate', type=float, default=2048, help='per-connection rate of the origin (KB/s)')
+    parser.add_argument('--latency', type=float, default=40, help='origin latency per request (ms)')
+    parser.add_argument('--prefetch', type=int, default=proxy.DEFAULT_PREFETCH, help='segments / chunks read ahead')
+    args = parser.parse_args()
+
+    origin = FixtureServer(args.rate, args.latency)
+    server = proxy.ProxyServer(prefetch=args.prefetch, buffer_bytes=32 * 1024 * 1024)
+    port = server.start()
+    headers = {'Referer': REFERER, 'User-Agent': 'DoraBashBench/1.0'}
+    session = requests.Session()
+
+    expected_hls = hashlib.sha1(b''.join(origin.segments)).hexdigest()
+    expected_mp4 = hashlib.sha1(origin.mp4).hexdigest()
+    seek = MP4_BYTES // 2 + 12345
+    expected_seek = hashlib.sha1(origin.mp4[seek:]).hexdigest()
+
+    master_url = origin.base + '/hls/master.m3u8'
+    mp4_url = origin.base + '/video.mp4'
+    cases = [
+        ('hls direct', lambda: play_hls(session, master_url, headers), expected_hls),
+        ('hls proxy', lambda: play_hls(session, proxy.proxy_url(port, master_url, headers), {}), expected_hls),
+        ('mp4 direct', lambda: play_mp4(session, mp4_url, headers), expected_mp4),
+        ('mp4 proxy', lambda: play_mp4(session, proxy.proxy_url(port, mp4_url, headers), {}), expected_mp4),
+        ('mp4 proxy seek', lambda: play_mp4(session, proxy.proxy_url(port, mp4_url, headers), {}, seek),
+         expected_seek),
+    ]
+
+    failures = 0
+    print(f"{'case':<16}{'stall':>10}{'origin reqs':>13}  bytes ok")
+    print('-' * 41)
+    for name, play, expected in cases:
+        before = origin.requests
+        stall, digest = play()
+        ok = digest == expected
+        failures += not ok
+        print(f"{name:<16}{stall * 1000:>8.0f}ms{origin.requests - before:>13}  {'yes' if ok else 'NO'}")
+
+    server.stop()
+    origin.stop()
+    stats = server.read_ahead.stats
+    print(f"Proxy: hits={stats['hits']} joined={stats['joined']} misses={stats['misses']} "
+          f"prefetched={stats['prefetched']} evictions={server.read_ahead.buffer.evictions}")
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Dora Bash repeat-navigation benchmark
+
+Compares listing navigation with a new interpreter per plugin call (Kodi's
+default) against a reused interpreter (reuselanguageinvoker). A local
+fixture server serves the recorded listing page and charges a delay for every
+new connection, standing in for the TCP and TLS handshake with dorabash.com.
+
+Each call runs default.py the way Kodi does, as __main__ with the plugin
+arguments in sys.argv.
+
+Usage:
+    python benchmarks/reuse_bench.py [--calls N] [--handshake MS] [--latency MS]
+"""
+
+import os
+import sys
+import json
+import time
+import runpy
+import argparse
+import statistics
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+FIXTURES_DIR = os.path.join(BENCH_DIR, 'fixtures')
+
+
+class FixtureServer(object):
+    """Serves listing.html for every /tag/ page, with a per-connection handshake delay"""
+
+    def __init__(self, handshake_ms, latency_ms):
+        with open(os.path.join(FIXTURES_DIR, 'listing.html'), 'rb') as f:
+            self.listing = f.read()
+        self.handshake = handshake_ms / 1000.0
+        self.latency = latency_ms / 1000.0
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def setup(self):
+                super().setup()
+                with fixture._lock:
+                    fixture.connections += 1
+                time.sleep(fixture.handshake)
+
+            def do_GET(self):
+                with fixture._lock:
+                    fixture.requests += 1
+                time.sleep(fixture.latency)
+                if not self.path.startswith('/tag/'):
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=UTF-8')
+                self.send_header('Content-Length', str(len(fixture.listing)))
+                self.end_headers()
+                self.wfile.write(fixture.listing)
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def base(self):
+        return f'http://127.0.0.1:{self._server.server_address[1]}'
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def child(base, calls, first_page):
+    """Run plugin calls in this interpreter and print their durations as JSON"""
+    sys.path.insert(0, os.path.join(BENCH_DIR, 'stubs'))
+    sys.path.insert(0, ROOT_DIR)
+
+    import xbmcaddon
+    # Every call has to reach the network: no page, listing or artwork caches
+    xbmcaddon.SETTINGS.update({
+        'cache_enabled': 'false',
+        'artwork_cache': 'false',
+        'prefetch_depth': '0'
+    })
+
+    from resources.lib import scraper
+    scraper.BASE_URL = base
+
+    durations = []
+    for page in range(first_page, first_page + calls):
+        sys.argv = ['plugin://plugin.video.dorabash/', '1', f'?mode=hindi_dubbed_movies&page={page}']
+        started = time.perf_counter()
+        runpy.run_path(os.path.join(ROOT_DIR, 'default.py'), run_name='__main__')
+        durations.append((time.perf_counter() - started) * 1000)
+
+    print(json.dumps(durations))
+
+
+def _spawn(base, calls, first_page):
+    output = subprocess.check_output([
+        sys.executable, os.path.abspath(__file__), '--child', '--base', base,
+        '--calls', str(calls), '--first-page', str(first_page)
+    ])
+    return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dora Bash repeat-navigation benchmark')
+    parser.add_argument('--calls', type=int, default=8, help='navigations per mode')
+    parser.add_argument('--handshake', type=float, default=120, help='connection setup delay (ms)')
+    parser.add_argument('--latency', type=float, default=30, help='server latency per request (ms)')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--base', help=argparse.SUPPRESS)
+    parser.add_argument('--first-page', type=int, default=1, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.base, args.calls, args.first_page)
+        return 0
+
+    server = FixtureServer(args.handshake, args.latency)
+    try:
+        # New interpreter per call: every call imports the addon and connects again
+        connections_before = server.connections
+        fresh = [_spawn(server.base, 1, page)[0] for page in range(1, args.calls + 1)]
+        fresh_connections = server.connections - connections_before
+
+        # Reused interpreter: the first call pays for imports and the handshake
+        connections_before = server.connections
+        reused = _spawn(server.base, args.calls + 1, 1)[1:]
+        reused_connections = server.connections - connections_before
+    finally:
+        server.stop()
+
+    print(f"{'mode':<22}{'median':>10}{'min':>10}{'max':>10}{'connections':>13}")
+    print('-' * 65)
+    for name, durations, connections in (('new interpreter', fresh, fresh_connections),
+                                         ('reused interpreter', reused, reused_connections)):
+        print(f"{name:<22}{statistics.median(durations):>8.1f}ms{min(durations):>8.1f}ms"
+              f"{max(durations):>8.1f}ms{connections:>13}")
+    print(f"Reused interpreter saves {statistics.median(fresh) - statistics.median(reused):.1f}ms per navigation "
+          f"(excluding interpreter start-up, which Kodi also saves)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+Dora Bash offline benchmarks
+
+Times scraper.py end to end against recorded fixtures, with stub Kodi modules
+and a fake transport instead of a Kodi instance and the live site.
+
+Usage:
+    python benchmarks/run.py [--runs N] [--latency MS] [--threshold PCT]
+                             [--save-baseline] [--only NAME]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import statistics
+import tracemalloc
+
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+
+sys.path.insert(0, os.path.join(BENCH_DIR, 'stubs'))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, ROOT_DIR)
+
+import xbmcaddon  # noqa: E402  (stub)
+
+from fake_transport import FakeTransport, FIXTURES_DIR  # noqa: E402
+from resources.lib import scraper, cards, extractors, pagescan, utils  # noqa: E402
+
+
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baseline.json')
+
+
+class PhaseTimer:
+    """Accumulates time spent in wrapped functions, per phase name"""
+
+    def __init__(self):
+        self.totals = {}
+
+    def wrap(self, module, name, phase):
+        original = getattr(module, name)
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                elapsed = (time.perf_counter() - started) * 1000
+                self.totals[phase] = self.totals.get(phase, 0.0) + elapsed
+
+        setattr(module, name, timed)
+
+    def reset(self):
+        self.totals = {}
+
+
+def _bench_cases():
+    """Benchmark name -> callable"""
+    return {
+        'get_movies': lambda: scraper.get_movies(1, 'hindi-dubbed-movies'),
+        'search': lambda: scraper.search('nobita'),
+        'resolve_direct': lambda: scraper.extract_video_url('https://dorabash.com/anime/nobita-direct/', '720', use_cache=False),
+        'resolve_blogspot': lambda: scraper.extract_video_url('https://dorabash.com/anime/nobita-blogspot/', '720', use_cache=False),
+        'resolve_filemoon': lambda: scraper.extract_video_url('https://dorabash.com/anime/nobita-filemoon/', '720', use_cache=False),
+        'filemoon_extractor': lambda: extractors.extract(extractors.ExtractionContext(
+            '//filemoon.in/e/abc123xyz', 'https://dorabash.com/nobita-filemoon/',
+            scraper.get_session(), 15, '720')),
+        'filemoon_packed': lambda: extractors.extract(extractors.ExtractionContext(
+            '//filemoon.in/e/packed456', 'https://dorabash.com/nobita-filemoon/',
+            scraper.get_session(), 15, '720')),
+    }
+
+
+def check_parity():
+    """Compare parsed cards with the records saved from the original parser"""
+    failures = []
+    for name, default_type in (('listing', 'Movie'), ('search', 'N/A')):
+        with open(os.path.join(FIXTURES_DIR, f'{name}.html'), 'rb') as f:
+            content = f.read()
+        with open(os.path.join(FIXTURES_DIR, f'{name}.expected.json'), 'r', encoding='utf-8') as f:
+            expected = json.load(f)
+        if cards.parse_cards(content, default_type=default_type) != expected:
+            failures.append(name)
+    return failures
+
+
+def settle(thread_count, timeout=5.0):
+    """Wait for background threads left by the previous run (e.g. cancelled probes)"""
+    deadline = time.time() + timeout
+    while threading.active_count() > thread_count and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def run_case(name, func, transport, phases, runs):
+    """Run one benchmark case and collect its metrics"""
+    timings = []
+    result = None
+    thread_count = threading.active_count()
+    for _ in range(runs):
+        settle(thread_count)
+        transport.reset_counters()
+        phases.reset()
+        started = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - started) * 1000)
+        # Drop the recorded spans, record_timings is off so nothing is written
+        utils.flush_spans(name)
+
+    settle(thread_count)
+    metrics = {
+        'ok': bool(result),
+        'median_ms': round(statistics.median(timings), 2),
+        'min_ms': round(min(timings), 2),
+        'requests': transport.requests,
+        'bytes': transport.bytes,
+        'wire_ms': round(transport.wire_ms, 2),
+        'parse_ms': round(phases.totals.get('parse', 0.0), 2)
+    }
+
+    # Separate run for memory, tracemalloc distorts timings
+    tracemalloc.start()
+    func()
+    metrics['peak_kb'] = round(tracemalloc.get_traced_memory()[1] / 1024.0, 1)
+    tracemalloc.stop()
+
+    return metrics
+
+
+def compare(results, baseline, threshold):
+    """Flag cases slower than baseline by more than threshold, or doing more requests"""
+    regressions = []
+    for name, metrics in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        limit = base['median_ms'] * (1 + threshold / 100.0)
+        if metrics['median_ms'] > limit and metrics['median_ms'] - base['median_ms'] > 2:
+            regressions.append(f"{name}: {metrics['median_ms']}ms vs baseline {base['median_ms']}ms")
+        if metrics['requests'] > base.get('requests', metrics['requests']):
+            regressions.append(f"{name}: {metrics['requests']} requests vs baseline {base['requests']}")
+        if not metrics['ok'] and base.get('ok', True):
+            regressions.append(f"{name}: no result")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Dora Bash offline benchmarks')
+    parser.add_argument('--runs', type=int, default=5, help='timed runs per case')
+    parser.add_argument('--latency', type=float, default=20, help='simulated latency per request (ms)')
+    parser.add_argument('--threshold', type=float, default=25, help='allowed slowdown vs baseline (%%)')
+    parser.add_argument('--save-baseline', action='store_true', help='write results as the new baseline')
+    parser.add_argument('--only', help='run only cases whose name contains this string')
+    args = parser.parse_args()
+
+    # Measure the work itself, not the caches in front of it
+    xbmcaddon.SETTINGS['cache_enabled'] = 'false'
+
+    transport = FakeTransport(latency_ms=args.latency).install(scraper.get_session())
+    transport.install(scraper.get_probe_session())
+
+    phases = PhaseTimer()
+    phases.wrap(cards, 'parse_cards', 'parse')
+    phases.wrap(scraper, 'BeautifulSoup', 'parse')
+    phases.wrap(pagescan._PlayerParser, 'feed', 'parse')
+
+    parity_failures = check_parity()
+    print(f"Card parser parity: {'FAIL ' + ', '.join(parity_failures) if parity_failures else 'ok'}")
+
+    results = {}
+    for name, func in _bench_cases().items():
+        if args.only and args.only not in name:
+            continue
+        results[name] = run_case(name, func, transport, phases, args.runs)
+
+    header = f"{'case':<20}{'median':>10}{'min':>10}{'reqs':>6}{'KB':>8}{'wire':>10}{'parse':>10}{'peak KB':>10}  ok"
+    print(header)
+    print('-' * len(header))
+    for name, m in results.items():
+        print(f"{name:<20}{m['median_ms']:>8.1f}ms{m['min_ms']:>8.1f}ms{m['requests']:>6}"
+              f"{m['bytes'] / 1024.0:>8.1f}{m['wire_ms']:>8.1f}ms{m['parse_ms']:>8.1f}ms"
+              f"{m['peak_kb']:>10.1f}  {'yes' if m['ok'] else 'NO'}")
+
+    if args.save_baseline:
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Baseline saved to {BASELINE_FILE}")
+        return 1 if parity_failures else 0
+
+    baseline = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+
+    return 1 if regressions or parity_failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Minimal xbmc stub for running the addon outside Kodi
+"""
+
+import os
+import sys
+import time
+
+
+LOGDEBUG = 0
+LOGINFO = 1
+LOGWARNING = 2
+LOGERROR = 3
+LOGFATAL = 4
+
+PLAYLIST_VIDEO = 1
+
+# Set DORABASH_BENCH_LOG=1 to see addon log output on stderr
+_verbose = os.environ.get('DORABASH_BENCH_LOG') == '1'
+
+_info_labels = {}
+
+
+def log(message, level=LOGDEBUG):
+    if _verbose:
+        sys.stderr.write(f'[{level}] {message}\n')
+
+
+def sleep(milliseconds):
+    time.sleep(milliseconds / 1000.0)
+
+
+def getGlobalIdleTime():
+    return 0
+
+
+def getInfoLabel(label):
+    return _info_labels.get(label, '')
+
+
+def getCondVisibility(condition):
+    return False
+
+
+def executebuiltin(command, wait=False):
+    pass
+
+
+class Monitor:
+    def abortRequested(self):
+        return False
+
+    def waitForAbort(self, timeout=0):
+        return True
+
+
+class Player:
+    def isPlaying(self):
+        return False
+
+    def play(self, item=None, listitem=None, windowed=False, startpos=-1):
+        pass
+
+
+class PlayList:
+    def __init__(self, playlist_id):
+        self._items = []
+
+    def clear(self):
+        self._items = []
+
+    def add(self, url, listitem=None, index=-1):
+        self._items.append(url)
+
+    def size(self):
+        return len(self._items)
+
+    def getposition(self):
+        return 0
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Minimal xbmcaddon stub for running the addon outside Kodi
+
+Settings default to the values declared in resources/settings.xml and can be
+overridden through ``SETTINGS``. The profile directory is a temporary
+directory unless DORABASH_BENCH_PROFILE is set.
+"""
+
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+
+
+ADDON_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PROFILE = os.environ.get('DORABASH_BENCH_PROFILE') or tempfile.mkdtemp(prefix='dorabash-bench-')
+
+
+def _load_defaults():
+    defaults = {}
+    tree = ET.parse(os.path.join(ADDON_PATH, 'resources', 'settings.xml'))
+    for setting in tree.iter('setting'):
+        if setting.get('id'):
+            defaults[setting.get('id')] = setting.get('default', '')
+    return defaults
+
+
+SETTINGS = _load_defaults()
+
+
+class Addon:
+    def __init__(self, addon_id=None):
+        pass
+
+    def getAddonInfo(self, key):
+        return {
+            'id': 'plugin.video.dorabash',
+            'name': 'Dora Bash',
+            'version': '1.0.0',
+            'path': ADDON_PATH,
+            'profile': PROFILE + os.sep,
+            'icon': os.path.join(ADDON_PATH, 'icon.png'),
+            'fanart': os.path.join(ADDON_PATH, 'fanart.jpg')
+        }.get(key, '')
+
+    def getSetting(self, setting_id):
+        return SETTINGS.get(setting_id, '')
+
+    def setSetting(self, setting_id, value):
+        SETTINGS[setting_id] = value
+
+    def getLocalizedString(self, string_id):
+        return ''
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Minimal xbmcgui stub for running the addon outside Kodi
+"""
+
+
+INPUT_ALPHANUM = 0
+
+
+class ListItem:
+    def __init__(self, label='', label2='', path='', offscreen=False):
+        self.label = label
+        self.path = path
+        self.art = {}
+        self.info = {}
+        self.properties = {}
+
+    def setArt(self, art):
+        self.art.update(art)
+
+    def setInfo(self, info_type, info):
+        self.info.update(info)
+
+    def setProperty(self, key, value):
+        self.properties[key] = value
+
+    def getProperty(self, key):
+        return self.properties.get(key, '')
+
+    def setPath(self, path):
+        self.path = path
+
+    def getPath(self):
+        return self.path
+
+    def setMimeType(self, mimetype):
+        pass
+
+    def setContentLookup(self, enable):
+        pass
+
+    def addContextMenuItems(self, items, replaceItems=False):
+        pass
+
+
+class Dialog:
+    def notification(self, heading, message, icon='', time=0, sound=True):
+        pass
+
+    def input(self, heading, defaultt='', type=INPUT_ALPHANUM, option=0, autoclose=0):
+        return ''
+
+    def textviewer(self, heading, text, usemono=False):
+        pass
+
+    def yesno(self, heading, message, nolabel='', yeslabel='', autoclose=0):
+        return False
+
+    def ok(self, heading, message):
+        return True
+
+
+class DialogProgress:
+    def create(self, heading, message=''):
+        pass
+
+    def update(self, percent, message=''):
+        pass
+
+    def iscanceled(self):
+        return False
+
+    def close(self):
+        pass
+
+
+class DialogProgressBG:
+    def create(self, heading, message=''):
+        pass
+
+    def update(self, percent=0, heading='', message=''):
+        pass
+
+    def isFinished(self):
+        return False
+
+    def close(self):
+        pass
+
+
+class Window:
+    _properties = {}
+
+    def __init__(self, window_id=-1):
+        pass
+
+    def getProperty(self, key):
+        return self._properties.get(key, '')
+
+    def setProperty(self, key, value):
+        self._properties[key] = value
+
+    def clearProperty(self, key):
+        self._properties.pop(key, None)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Minimal xbmcplugin stub for running the addon outside Kodi
+
+Directory items are recorded in ``items`` so benchmarks can inspect them.
+"""
+
+
+SORT_METHOD_NONE = 0
+
+items = []
+resolved = []
+
+
+def addDirectoryItem(handle, url, listitem, isFolder=False, totalItems=0):
+    items.append((url, listitem, isFolder))
+    return True
+
+
+def addDirectoryItems(handle, entries, totalItems=0):
+    items.extend(entries)
+    return True
+
+
+def endOfDirectory(handle, succeeded=True, updateListing=False, cacheToDisc=True):
+    pass
+
+
+def setResolvedUrl(handle, succeeded, listitem):
+    resolved.append((succeeded, listitem))
+
+
+def setContent(handle, content):
+    pass
+
+
+def addSortMethod(handle, sortMethod, label2Mask=''):
+    pass
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+Minimal xbmcvfs stub for running the addon outside Kodi
+"""
+
+import os
+
+
+def translatePath(path):
+    return path
+
+
+def exists(path):
+    return os.path.exists(path)
+
+
+def mkdirs(path):
+    os.makedirs(path, exist_ok=True)
+    return True
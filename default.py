@@ -4,22 +4,74 @@ Dora Bash Kodi Addon
 Main entry point for the addon
 """
 
+import time
+_start_time = time.perf_counter()
+
 import sys
-from urllib.parse import parse_qsl
+import threading
+from urllib.parse import parse_qsl, quote_plus
 import xbmc
 import xbmcgui
 import xbmcplugin
-import xbmcaddon
 
-# Import our scraper library
-from resources.lib import scraper
+# The scraper library (requests, urllib3, bs4) is imported lazily by the
+# modes that need network access, see _get_scraper()
 from resources.lib import utils
 
-# Get addon handle and info
-_addon = xbmcaddon.Addon()
+# Get addon info; the handle is set per call by run(), with
+# reuselanguageinvoker this module outlives a single plugin call
+_addon = utils.get_addon()
 _addon_id = _addon.getAddonInfo('id')
 _addon_name = _addon.getAddonInfo('name')
-_addon_handle = int(sys.argv[1])
+_addon_handle = -1
+
+# Plugin URL of this call (base URL and query), set per call by run()
+_call_url = ''
+
+# Startup timings in milliseconds, reported when startup_timing is enabled
+_timings = {}
+
+# Calls handled by this module instance
+_call_count = 0
+
+
+def _get_scraper():
+    """Import the scraper library on first use
+    
+    Returns:
+        module: resources.lib.scraper
+    """
+    started = time.perf_counter()
+    from resources.lib import scraper
+    _timings.setdefault('scraper_import', (time.perf_counter() - started) * 1000)
+    return scraper
+
+
+def _download_artwork(urls):
+    try:
+        _get_scraper().prefetch_artwork(urls)
+    except Exception as e:
+        utils.log(f"Artwork download failed: {e}", level=xbmc.LOGDEBUG)
+
+
+def _cache_artwork(items):
+    """Look up cached thumbnails and start downloading the missing ones
+    
+    Args:
+        items (list): Card records
+        
+    Returns:
+        tuple: (thumbnail URL -> art path dict, download thread or None)
+    """
+    from resources.lib import artwork
+    
+    paths = artwork.get_paths([item.get('thumbnail', '') for item in items])
+    missing = [url for url, path in paths.items() if path == url]
+    thread = None
+    if missing and artwork.is_enabled():
+        thread = threading.Thread(target=utils.bind_spans(_download_artwork), args=(missing,))
+        thread.start()
+    return paths, thread
 
 
 def list_categories():
@@ -44,8 +96,28 @@ def list_categories():
             'mode': 'search',
             'icon': 'DefaultAddonsSearch.png',
             'fanart': utils.get_fanart()
+        },
+        {
+            'name': 'Downloads',
+            'mode': 'downloads',
+            'icon': 'DefaultFolder.png',
+            'fanart': utils.get_fanart()
+        },
+        {
+            'name': 'Build Catalog',
+            'mode': 'build_catalog',
+            'icon': 'DefaultAddonsUpdates.png',
+            'fanart': utils.get_fanart()
         }
     ]
+    
+    if _addon.getSetting('record_timings') == 'true':
+        categories.append({
+            'name': 'Performance Stats',
+            'mode': 'timings',
+            'icon': 'DefaultAddonInfoProvider.png',
+            'fanart': utils.get_fanart()
+        })
 
     
     for category in categories:
@@ -62,24 +134,84 @@ def list_categories():
     xbmcplugin.endOfDirectory(_addon_handle)
 
 
+def _get_page_size():
+    """Number of site pages shown per directory page"""
+    try:
+        return max(1, int(_addon.getSetting('page_size') or 1))
+    except ValueError:
+        return 1
+
+
+def _site_pages(page, page_size):
+    """Site pages making up a directory page"""
+    return range((page - 1) * page_size + 1, page * page_size + 1)
+
+
+def _get_listing(page, category, page_size):
+    """Get the cards of a directory page
+    
+    Returns:
+        tuple: (cards, whether more pages follow)
+    """
+    if page_size == 1:
+        return _get_scraper().get_movies(page, category), True
+    return _get_scraper().get_movies_pages(_site_pages(page, page_size), category)
+
+
+def _add_context_menu(list_item, item, **source):
+    """Add the "Play from here" and "Download" context actions to a directory item
+    
+    Args:
+        list_item (xbmcgui.ListItem): Directory item
+        item (dict): Card record of the item
+        **source: Parameters play_from() needs to rebuild the directory
+    """
+    query = {'mode': 'play_from', 'url': item['url']}
+    query.update(source)
+    download_url = utils.build_url({
+        'mode': 'download',
+        'url': item['url'],
+        'title': quote_plus(item['title']),
+        'thumbnail': quote_plus(item.get('thumbnail', ''))
+    })
+    list_item.addContextMenuItems([
+        ('Play from here', f'RunPlugin({utils.build_url(query)})'),
+        ('Download', f'RunPlugin({download_url})')
+    ])
+
+
+def _resolve_ahead(items):
+    """Let the service speculatively resolve the top items of the rendered directory
+    
+    Called last, once this call's own artwork and prefetch work is done.
+    """
+    from resources.lib import resolve_ahead
+    if resolve_ahead.is_enabled():
+        resolve_ahead.publish(_call_url, items)
+
+
 def list_movies(page=1, category='hindi-dubbed-movies'):
     """List movies from DoraBash by category"""
     utils.log(f"Listing {category} - Page {page}")
+    page_size = _get_page_size()
     
     try:
-        movies = scraper.get_movies(page, category)
+        movies, has_more = _get_listing(page, category, page_size)
         
         if not movies:
             utils.notify("No movies found")
             xbmcplugin.endOfDirectory(_addon_handle)
             return
         
+        art_paths, art_thread = _cache_artwork(movies)
+        
         for movie in movies:
             list_item = xbmcgui.ListItem(label=movie['title'])
+            thumbnail = art_paths.get(movie.get('thumbnail', ''), '')
             
             list_item.setArt({
-                'thumb': movie.get('thumbnail', ''),
-                'poster': movie.get('thumbnail', ''),
+                'thumb': thumbnail,
+                'poster': thumbnail,
                 'fanart': utils.get_fanart()
             })
             
@@ -90,6 +222,7 @@ def list_movies(page=1, category='hindi-dubbed-movies'):
             })
             
             list_item.setProperty('IsPlayable', 'true')
+            _add_context_menu(list_item, movie, category=category, page=str(page))
             
             url = utils.build_url({
                 'mode': 'play',
@@ -99,10 +232,11 @@ def list_movies(page=1, category='hindi-dubbed-movies'):
             xbmcplugin.addDirectoryItem(_addon_handle, url, list_item, isFolder=False)
         
         # Add "Next Page" option
-        next_item = xbmcgui.ListItem(label='Next Page >>')
-        mode_name = 'hindi_dubbed_movies' if category == 'hindi-dubbed-movies' else 'english_subbed_movies'
-        next_url = utils.build_url({'mode': mode_name, 'page': str(page + 1)})
-        xbmcplugin.addDirectoryItem(_addon_handle, next_url, next_item, isFolder=True)
+        if has_more:
+            next_item = xbmcgui.ListItem(label='Next Page >>')
+            mode_name = 'hindi_dubbed_movies' if category == 'hindi-dubbed-movies' else 'english_subbed_movies'
+            next_url = utils.build_url({'mode': mode_name, 'page': str(page + 1)})
+            xbmcplugin.addDirectoryItem(_addon_handle, next_url, next_item, isFolder=True)
         
         xbmcplugin.addSortMethod(_addon_handle, xbmcplugin.SORT_METHOD_NONE)
         xbmcplugin.setContent(_addon_handle, 'movies')
@@ -112,57 +246,171 @@ def list_movies(page=1, category='hindi-dubbed-movies'):
         utils.log(f"Error listing movies: {e}", level=xbmc.LOGERROR)
         utils.notify(f"Error loading movies: {str(e)}")
         xbmcplugin.endOfDirectory(_addon_handle, succeeded=False)
+        return
+    
+    # Thumbnails missing from the artwork cache were downloading meanwhile
+    if art_thread is not None:
+        art_thread.join()
+    
+    # The directory is already shown, speculatively load the following pages
+    if has_more:
+        _prefetch_next_pages(page, category, page_size)
+    
+    _resolve_ahead(movies)
 
 
-def search():
-    """Search for content"""
-    utils.log("Opening search dialog")
+def _prefetch_next_pages(page, category, page_size=1):
+    """Prefetch the next listing pages after the current one has been rendered"""
+    try:
+        depth = int(_addon.getSetting('prefetch_depth') or 0)
+    except ValueError:
+        depth = 0
+    
+    if depth <= 0:
+        return
+    
+    if utils.is_metered() and _addon.getSetting('prefetch_on_metered') != 'true':
+        utils.log("Skipping prefetch on metered connection", level=xbmc.LOGDEBUG)
+        return
+    
+    site_pages = range(page * page_size + 1, (page + depth) * page_size + 1)
+    _get_scraper().prefetch_movies(site_pages, category)
+
+
+def _get_search_results(query, online=False):
+    """Search the local catalog, or the site if the catalog has no match
+    
+    Returns:
+        tuple: (cards, whether they came from the catalog)
+    """
+    if not online and _addon.getSetting('catalog_search') != 'false':
+        from resources.lib import catalog
+        results = catalog.search(query)
+        utils.log(f"Catalog returned {len(results)} results")
+        if results:
+            return results, True
+    
+    return _get_scraper().search(query), False
+
+
+def search(query=None, online=False):
+    """Search for content
+    
+    The local catalog answers first; the site is only queried when the catalog
+    has no match or the user picks "Search dorabash.com".
+    
+    Args:
+        query (str): Search query (asks with the keyboard if not given)
+        online (bool): Skip the local catalog and search the site
+    """
+    if not query:
+        utils.log("Opening search dialog")
+        query = xbmcgui.Dialog().input('Search Doraemon', type=xbmcgui.INPUT_ALPHANUM)
     
-    keyboard = xbmcgui.Dialog().input('Search Doraemon', type=xbmcgui.INPUT_ALPHANUM)
+    if not query:
+        xbmcplugin.endOfDirectory(_addon_handle)
+        return
     
-    if keyboard:
-        utils.log(f"Searching for: {keyboard}")
-        try:
-            results = scraper.search(keyboard)
+    utils.log(f"Searching for: {query}")
+    try:
+        results, from_catalog = _get_search_results(query, online)
+        
+        if not results:
+            utils.notify("No results found")
+            xbmcplugin.endOfDirectory(_addon_handle)
+            return
+        
+        art_paths, art_thread = _cache_artwork(results)
+        
+        for result in results:
+            list_item = xbmcgui.ListItem(label=result['title'])
+            thumbnail = art_paths.get(result.get('thumbnail', ''), '')
             
-            if not results:
-                utils.notify("No results found")
-                xbmcplugin.endOfDirectory(_addon_handle)
-                return
+            list_item.setArt({
+                'thumb': thumbnail,
+                'poster': thumbnail,
+                'fanart': utils.get_fanart()
+            })
             
-            for result in results:
-                list_item = xbmcgui.ListItem(label=result['title'])
-                
-                list_item.setArt({
-                    'thumb': result.get('thumbnail', ''),
-                    'poster': result.get('thumbnail', ''),
-                    'fanart': utils.get_fanart()
-                })
-                
-                list_item.setInfo('video', {
-                    'title': result['title'],
-                    'plot': f"Status: {result.get('status', 'N/A')}\nType: {result.get('type', 'N/A')}",
-                    'mediatype': 'video'
-                })
-                
-                list_item.setProperty('IsPlayable', 'true')
-                
-                url = utils.build_url({
-                    'mode': 'play',
-                    'url': result['url']
-                })
-                
-                xbmcplugin.addDirectoryItem(_addon_handle, url, list_item, isFolder=False)
+            list_item.setInfo('video', {
+                'title': result['title'],
+                'plot': f"Status: {result.get('status', 'N/A')}\nType: {result.get('type', 'N/A')}",
+                'mediatype': 'video'
+            })
             
-            xbmcplugin.setContent(_addon_handle, 'videos')
-            xbmcplugin.endOfDirectory(_addon_handle, cacheToDisc=False)
+            list_item.setProperty('IsPlayable', 'true')
+            _add_context_menu(list_item, result, query=quote_plus(query), online='1' if online else '0')
             
-        except Exception as e:
-            utils.log(f"Error searching: {e}", level=xbmc.LOGERROR)
-            utils.notify(f"Error searching: {str(e)}")
-            xbmcplugin.endOfDirectory(_addon_handle, succeeded=False)
-    else:
-        xbmcplugin.endOfDirectory(_addon_handle)
+            url = utils.build_url({
+                'mode': 'play',
+                'url': result['url']
+            })
+            
+            xbmcplugin.addDirectoryItem(_addon_handle, url, list_item, isFolder=False)
+        
+        if from_catalog:
+            online_item = xbmcgui.ListItem(label=f'Search dorabash.com for "{query}" >>')
+            online_item.setArt({'icon': 'DefaultAddonsSearch.png', 'fanart': utils.get_fanart()})
+            online_url = utils.build_url({'mode': 'search_online', 'query': quote_plus(query)})
+            xbmcplugin.addDirectoryItem(_addon_handle, online_url, online_item, isFolder=True)
+        
+        xbmcplugin.setContent(_addon_handle, 'videos')
+        xbmcplugin.endOfDirectory(_addon_handle, cacheToDisc=False)
+        
+        if art_thread is not None:
+            art_thread.join()
+        
+        _resolve_ahead(results)
+        
+    except Exception as e:
+        utils.log(f"Error searching: {e}", level=xbmc.LOGERROR)
+        utils.notify(f"Error searching: {str(e)}")
+        xbmcplugin.endOfDirectory(_addon_handle, succeeded=False)
+
+
+def build_catalog():
+    """Crawl every listing page of both categories into the local catalog"""
+    from resources.lib import catalog, crawler
+    
+    progress = xbmcgui.DialogProgress()
+    progress.create('Dora Bash', 'Building catalog...')
+    categories = crawler.CATEGORIES
+    
+    def report(stats):
+        percent = int(categories.index(stats.category) * 100 / len(categories))
+        progress.update(
+            percent,
+            f"{stats.category}: page {stats.page}\n"
+            f"{stats.pages} pages, {stats.pages_per_sec:.1f} pages/s, {stats.new_items} new titles"
+        )
+        return not progress.iscanceled()
+    
+    try:
+        stats = crawler.crawl(categories, progress=report)
+    finally:
+        progress.close()
+    
+    utils.notify(f"Catalog: {stats.pages} pages, {stats.new_items} new titles, {catalog.count()} in total")
+    xbmcplugin.endOfDirectory(_addon_handle, succeeded=False)
+
+
+def _get_proxy_port():
+    """Get the port of the service's read-ahead proxy, or None if it is not in use"""
+    if _addon.getSetting('proxy_enabled') != 'true':
+        return None
+    from resources.lib import proxy
+    port = xbmcgui.Window(10000).getProperty(proxy.PORT_PROPERTY)
+    return int(port) if port.isdigit() else None
+
+
+def _get_proxy_path(port, video_url, stream_type=None):
+    """Build the proxy URL for a stream, moving any '|' headers into it"""
+    from resources.lib import proxy, scraper
+    headers = {'User-Agent': scraper.HEADERS['User-Agent'], 'Referer': 'https://dorabash.com/'}
+    if '|' in video_url:
+        video_url, header_string = video_url.split('|', 1)
+        headers.update(parse_qsl(header_string))
+    return proxy.proxy_url(port, video_url, headers, kind='hls' if stream_type == 'hls' else None)
 
 
 def play_video(url):
@@ -183,7 +431,7 @@ def play_video(url):
         
         # ===== CRITICAL: ALL SCRAPING MUST HAPPEN BEFORE PLAYBACK =====
         # Extract video URLs - this does all network requests and parsing
-        video_urls = scraper.extract_video_url(url, preferred_quality)
+        video_urls = _get_scraper().extract_video_url(url, preferred_quality)
         
         if not video_urls:
             utils.log("Failed to extract video URL", level=xbmc.LOGERROR)
@@ -209,8 +457,12 @@ def play_video(url):
         play_item.setProperty('inputstream', 'inputstream.ffmpegdirect')
         play_item.setProperty('mimetype', 'video/mp4')
         
+        proxy_port = _get_proxy_port()
+        if proxy_port:
+            # Read-ahead through the local proxy run by the service
+            play_item.setPath(_get_proxy_path(proxy_port, video_url, video_urls.get('type')))
         # Add HTTP headers to URL if not already present
-        if '|' not in video_url:
+        elif '|' not in video_url:
             headers = 'User-Agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36&Referer=https://dorabash.com/'
             video_url_with_headers = f"{video_url}|{headers}"
             play_item.setPath(video_url_with_headers)
@@ -243,8 +495,173 @@ def play_video(url):
                 pass
 
 
+def play_from(params):
+    """Queue the items of a directory from the chosen one on and start playing
+    
+    The directory is rebuilt from the same source (listing store, catalog or
+    page cache). Each queue item is resolved by play_video() when Kodi
+    reaches it; the service resolves the next one ahead while the current
+    one plays.
+    
+    Args:
+        params (dict): Plugin parameters: url of the first item, plus category
+            and page of a listing or query and online of a search
+    """
+    from resources.lib import playqueue
+    
+    try:
+        if 'query' in params:
+            items, _ = _get_search_results(params['query'], params.get('online') == '1')
+        else:
+            items, _ = _get_listing(int(params.get('page', 1)), params.get('category', 'hindi-dubbed-movies'),
+                                    _get_page_size())
+    except Exception as e:
+        utils.log(f"Error building play queue: {e}", level=xbmc.LOGERROR)
+        utils.notify(f"Error building play queue: {str(e)}")
+        return
+    
+    playlist = playqueue.build(items or [], params.get('url'))
+    if not playlist.size():
+        utils.notify("Nothing to play")
+        return
+    
+    utils.log(f"Queued {playlist.size()} item(s)")
+    xbmc.Player().play(playlist)
+
+
+def download(params):
+    """Queue a title for download by the service"""
+    from resources.lib import downloads
+    
+    if downloads.add(params['url'], params.get('title', ''), params.get('thumbnail', '')):
+        utils.notify(f"Queued for download: {params.get('title', '')}")
+    else:
+        utils.notify("Already in downloads")
+
+
+def list_downloads():
+    """List downloads: finished ones play the local file, unfinished ones show their progress
+    
+    Selecting an unfinished download pauses or resumes it.
+    """
+    from resources.lib import downloads
+    
+    for job in downloads.get_jobs():
+        delete_url = utils.build_url({'mode': 'download_delete', 'id': job['id']})
+        list_item = xbmcgui.ListItem(label=job['title'] if job['status'] == downloads.DONE
+                                     else f"[{job['status'].capitalize()} {job['percent']}%] {job['title']}")
+        list_item.setArt({
+            'thumb': job.get('thumbnail', ''),
+            'poster': job.get('thumbnail', ''),
+            'fanart': utils.get_fanart()
+        })
+        list_item.addContextMenuItems([('Delete download', f'RunPlugin({delete_url})')])
+        
+        if job['status'] == downloads.DONE:
+            # A local file: nothing to resolve when it is played
+            list_item.setInfo('video', {'title': job['title'], 'mediatype': 'video'})
+            list_item.setProperty('IsPlayable', 'true')
+            url = job['file']
+        else:
+            plot = job['error'] or f"{job['bytes_done'] // (1024 * 1024)} MB downloaded"
+            list_item.setInfo('video', {'title': job['title'], 'plot': plot})
+            url = utils.build_url({'mode': 'download_toggle', 'id': job['id']})
+        
+        xbmcplugin.addDirectoryItem(_addon_handle, url, list_item, isFolder=False)
+    
+    xbmcplugin.setContent(_addon_handle, 'videos')
+    xbmcplugin.endOfDirectory(_addon_handle, cacheToDisc=False)
+
+
+def change_download(params):
+    """Pause, resume or delete a download, then refresh the Downloads directory"""
+    from resources.lib import downloads
+    
+    job_id = params['id']
+    if params['mode'] == 'download_delete':
+        if not xbmcgui.Dialog().yesno('Dora Bash', 'Delete this download and its files?'):
+            return
+        downloads.delete(job_id)
+    elif any(job['id'] == job_id and job['status'] in (downloads.PAUSED, downloads.FAILED)
+             for job in downloads.get_jobs()):
+        downloads.resume(job_id)
+    else:
+        downloads.pause(job_id)
+    xbmc.executebuiltin('Container.Refresh')
+
+
+def show_timings():
+    """Show p50/p95 per stage from the recorded timings"""
+    from resources.lib import artwork, cache, extractors, health
+    
+    summary = utils.get_timing_summary()
+    
+    lines = [f"{'Stage':<24}{'Count':>7}{'p50 ms':>10}{'p95 ms':>10}{'Avg KB':>9}{'Cache':>8}"]
+    for row in summary:
+        hit_rate = f"{row['hit_rate']:.0f}%" if row['hit_rate'] is not None else '-'
+        lines.append(
+            f"{row['stage']:<24}{row['count']:>7}{row['p50']:>10.1f}{row['p95']:>10.1f}"
+            f"{row['avg_bytes'] / 1024.0:>9.1f}{hit_rate:>8}"
+        )
+    if not summary:
+        lines.append('No timings recorded yet.')
+    
+    stats = cache.get_stats()
+    lines.append('')
+    lines.append(
+        f"Page cache: {stats['hits']} hits, {stats['revalidated']} revalidated, "
+        f"{stats['misses']} misses, {stats['entries']} entries ({stats['size'] // 1024} KB)"
+    )
+    
+    stats = artwork.get_stats()
+    lines.append(
+        f"Artwork cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0f}% hit rate), "
+        f"{stats['downloads']} downloads, {stats['entries']} entries ({stats['size'] // 1024} KB)"
+    )
+    
+    summary = health.get_summary()
+    lines.append(f"Known bad URLs skipped: {summary['negative']}")
+    for host in summary['hosts']:
+        remaining = f", {host['remaining']}s left" if host['state'] == 'open' else ''
+        lines.append(
+            f"Host {host['host']}: breaker {host['state']}{remaining}, "
+            f"{host['failures']} failure(s), last: {host['last_error']}"
+        )
+    
+    strategies = extractors.get_stats()
+    if strategies:
+        lines.append('')
+        lines.append(f"{'Extractor strategy':<32}{'Tries':>7}{'Success':>9}{'Avg ms':>9}")
+        for extractor_name, entries in sorted(strategies.items()):
+            for strategy_name, entry in sorted(entries.items()):
+                avg_ms = f"{entry['avg_ms']:.0f}" if entry.get('avg_ms') is not None else '-'
+                lines.append(
+                    f"{extractor_name + '.' + strategy_name:<32}{entry.get('attempts', 0):>7}"
+                    f"{entry.get('success_rate', 0) * 100:>8.0f}%{avg_ms:>9}"
+                )
+    
+    xbmcgui.Dialog().textviewer('Dora Bash - Performance Stats', '\n'.join(lines), usemono=True)
+    xbmcplugin.endOfDirectory(_addon_handle, succeeded=False)
+
+
+def _log_startup_timing(mode, router_start):
+    """Log import and first-render time for this invocation"""
+    if utils.get_setting('startup_timing') != 'true':
+        return
+    
+    now = time.perf_counter()
+    utils.log(
+        f"Startup timing [{mode or 'main'}]: "
+        f"imports={(router_start - _start_time) * 1000:.1f}ms "
+        f"scraper_import={_timings.get('scraper_import', 0):.1f}ms "
+        f"render={(now - router_start) * 1000:.1f}ms "
+        f"total={(now - _start_time) * 1000:.1f}ms"
+    )
+
+
 def router(paramstring):
     """Route to appropriate function based on parameters"""
+    router_start = time.perf_counter()
     params = dict(parse_qsl(paramstring))
     
     try:
@@ -262,6 +679,20 @@ def router(paramstring):
                 list_movies(page, 'english-subbed-movies')
             elif mode == 'search':
                 search()
+            elif mode == 'search_online':
+                search(params.get('query'), online=True)
+            elif mode == 'build_catalog':
+                build_catalog()
+            elif mode == 'timings':
+                show_timings()
+            elif mode == 'play_from':
+                play_from(params)
+            elif mode == 'download':
+                download(params)
+            elif mode == 'downloads':
+                list_downloads()
+            elif mode in ('download_toggle', 'download_delete'):
+                change_download(params)
             elif mode == 'play':
                 # CRITICAL: play_video will handle playback and exit
                 play_video(params['url'])
@@ -272,8 +703,37 @@ def router(paramstring):
     except Exception as e:
         utils.log(f"Router error: {e}", level=xbmc.LOGERROR)
         xbmcplugin.endOfDirectory(_addon_handle, succeeded=False)
+    finally:
+        _log_startup_timing(params.get('mode'), router_start)
+        utils.flush_spans(params.get('mode') or 'main')
+
+
+def run(argv=None):
+    """Handle one plugin call
+    
+    Everything that belongs to the call (handle, arguments, settings, startup
+    timings) is read here rather than at import time, so that the interpreter
+    and the scraper's connection pool can be reused between calls.
+    
+    Args:
+        argv (list): Plugin arguments, defaults to sys.argv
+    """
+    global _addon, _addon_handle, _call_url, _start_time, _call_count
+    if argv is None:
+        argv = sys.argv
+    
+    if _call_count:
+        # Module reused: this call started here, not at the imports
+        _start_time = time.perf_counter()
+        _timings.clear()
+    _call_count += 1
+    
+    _addon = utils.refresh_addon()
+    _addon_handle = int(argv[1])
+    _call_url = argv[0] + (argv[2] if len(argv) > 2 else '')
+    router(argv[2][1:] if len(argv) > 2 else '')
 
 
 if __name__ == '__main__':
-    router(sys.argv[2][1:])
+    run(sys.argv)
     # Script ends here - no code should run after router completes
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash Artwork Cache Module
+Downloads listing thumbnails concurrently into a size-bounded local cache
+"""
+
+
+import os
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from . import utils
+
+
+ARTWORK_DIR = 'artwork'
+INDEX_FILE = 'index.json'
+
+DEFAULT_MAX_MB = 100
+DEFAULT_WORKERS = 4
+
+# Thumbnails are small, anything bigger is not artwork
+MAX_IMAGE_BYTES = 5 * 1024 * 1024
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+
+
+_lock = threading.Lock()
+_index = None
+_index_mtime = 0
+
+
+
+def is_enabled():
+    """Check whether the artwork cache is enabled in settings"""
+    return utils.get_setting('artwork_cache') != 'false'
+
+
+
+def get_max_bytes():
+    """Get maximum total artwork cache size in bytes from settings"""
+    try:
+        megabytes = int(utils.get_setting('artwork_max_mb'))
+    except ValueError:
+        megabytes = DEFAULT_MAX_MB
+    return megabytes * 1024 * 1024
+
+
+
+def get_workers():
+    """Get the number of concurrent thumbnail downloads from settings"""
+    try:
+        return max(1, int(utils.get_setting('artwork_workers')))
+    except ValueError:
+        return DEFAULT_WORKERS
+
+
+
+def _load_index():
+    """Load the artwork index from disk, again whenever another process rewrote it"""
+    global _index, _index_mtime
+    path = utils.get_profile_path(ARTWORK_DIR, INDEX_FILE)
+    mtime = utils.get_mtime(path)
+    if _index is None or mtime != _index_mtime:
+        _index_mtime = mtime
+        _index = utils.read_json(path, None)
+        if not isinstance(_index, dict):
+            _index = {}
+        _index.setdefault('entries', {})
+        _index.setdefault('stats', {'hits': 0, 'misses': 0, 'downloads': 0, 'failures': 0, 'evictions': 0})
+    return _index
+
+
+
+def _save_index():
+    global _index_mtime
+    path = utils.get_profile_path(ARTWORK_DIR, INDEX_FILE)
+    try:
+        utils.write_json(path, _index)
+        _index_mtime = utils.get_mtime(path)
+    except OSError as e:
+        utils.log(f"Error saving artwork index: {e}", level=utils.LOGERROR)
+
+
+
+def _key(url):
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+
+def _file_path(key, entry):
+    return utils.get_profile_path(ARTWORK_DIR, key + entry.get('ext', '.jpg'))
+
+
+
+def get_paths(urls):
+    """Map thumbnail URLs to local files where they are cached
+
+    Args:
+        urls (list): Thumbnail URLs
+
+    Returns:
+        dict: URL -> local file path for cached thumbnails, URL -> URL otherwise
+    """
+    paths = {}
+    urls = [url for url in urls if url]
+    if not urls or not is_enabled():
+        return dict((url, url) for url in urls)
+
+    now = time.time()
+    with _lock:
+        index = _load_index()
+        for url in urls:
+            key = _key(url)
+            entry = index['entries'].get(key)
+            path = _file_path(key, entry) if entry else None
+            if path and os.path.exists(path):
+                entry['accessed'] = now
+                index['stats']['hits'] += 1
+                paths[url] = path
+            else:
+                if entry:
+                    del index['entries'][key]
+                index['stats']['misses'] += 1
+                paths[url] = url
+        _save_index()
+
+    return paths
+
+
+
+def _download_one(session, url, timeout):
+    """Download one thumbnail into the cache
+
+    Returns:
+        bool: True if the thumbnail was stored
+    """
+    ext = os.path.splitext(urlparse(url).path)[1].lower()
+    if ext not in IMAGE_EXTENSIONS:
+        ext = '.jpg'
+    key = _key(url)
+    path = utils.get_profile_path(ARTWORK_DIR, key + ext)
+
+    try:
+        response = session.get(url, timeout=timeout)
+        try:
+            response.raise_for_status()
+            if not response.headers.get('Content-Type', 'image/').startswith('image/'):
+                raise ValueError(f"not an image: {response.headers.get('Content-Type')}")
+            data = response.content
+        finally:
+            response.close()
+        if len(data) > MAX_IMAGE_BYTES:
+            raise ValueError(f"too large: {len(data)} bytes")
+
+        temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except Exception as e:
+        utils.log(f"Artwork download failed for {url}: {e}", level=utils.LOGDEBUG)
+        with _lock:
+            _load_index()['stats']['failures'] += 1
+        return False
+
+    now = time.time()
+    with _lock:
+        index = _load_index()
+        index['entries'][key] = {'url': url, 'ext': ext, 'size': len(data), 'stored': now, 'accessed': now}
+        index['stats']['downloads'] += 1
+    return True
+
+
+
+def _evict(entries, stats):
+    """Evict least recently used thumbnails until the cache fits its size limit"""
+    max_bytes = get_max_bytes()
+    total = sum(entry.get('size', 0) for entry in entries.values())
+    if total <= max_bytes:
+        return
+
+    for key, entry in sorted(entries.items(), key=lambda item: item[1].get('accessed', 0)):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(_file_path(key, entry))
+        except OSError:
+            pass
+        total -= entry.get('size', 0)
+        del entries[key]
+        stats['evictions'] += 1
+
+
+
+def download(urls, session, timeout=10):
+    """Download the thumbnails that are not cached yet, concurrently
+
+    Args:
+        urls (list): Thumbnail URLs
+        session: Requests session
+        timeout (int): Request timeout per thumbnail
+
+    Returns:
+        int: Number of thumbnails downloaded
+    """
+    if not is_enabled():
+        return 0
+
+    with _lock:
+        entries = _load_index()['entries']
+        missing = []
+        for url in urls:
+            if url and url not in missing:
+                entry = entries.get(_key(url))
+                if not entry or not os.path.exists(_file_path(_key(url), entry)):
+                    missing.append(url)
+
+    if not missing:
+        return 0
+
+    started = time.time()
+    with ThreadPoolExecutor(max_workers=min(get_workers(), len(missing))) as executor:
+        downloaded = sum(executor.map(lambda url: _download_one(session, url, timeout), missing))
+
+    with _lock:
+        index = _load_index()
+        _evict(index['entries'], index['stats'])
+        _save_index()
+
+    utils.log(f"Artwork: downloaded {downloaded}/{len(missing)} thumbnails in {time.time() - started:.2f}s",
+              level=utils.LOGDEBUG)
+    return downloaded
+
+
+
+def get_stats():
+    """Get artwork cache counters
+
+    Returns:
+        dict: Counters for hits, misses, downloads, failures and evictions,
+        plus the current number of entries and total size in bytes
+    """
+    with _lock:
+        index = _load_index()
+        stats = dict(index['stats'])
+        stats['entries'] = len(index['entries'])
+        stats['size'] = sum(entry.get('size', 0) for entry in index['entries'].values())
+    lookups = stats['hits'] + stats['misses']
+    stats['hit_rate'] = stats['hits'] * 100.0 / lookups if lookups else 0.0
+    return stats
+
+
+
+def log_stats():
+    """Log artwork cache counters at debug level"""
+    stats = get_stats()
+    utils.log(
+        f"Artwork stats: hits={stats['hits']} misses={stats['misses']} downloads={stats['downloads']} "
+        f"failures={stats['failures']} evictions={stats['evictions']} entries={stats['entries']} "
+        f"size={stats['size'] // 1024}KB hit_rate={stats['hit_rate']:.1f}%",
+        level=utils.LOGDEBUG
+    )
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash HTTP Cache Module
+Persistent on-disk cache for listing and search pages
+"""
+
+
+import os
+import time
+import hashlib
+import threading
+from . import utils
+
+
+CACHE_DIR = 'http_cache'
+INDEX_FILE = 'index.json'
+
+# Setting holding the time-to-live (in minutes) for each kind of route
+TTL_SETTINGS = {
+    'listing': 'cache_ttl_listing',
+    'search': 'cache_ttl_search'
+}
+
+DEFAULT_TTL = {
+    'listing': 60,
+    'search': 15
+}
+
+DEFAULT_MAX_MB = 50
+
+# Fresh hits only update the index in memory; they are written with the next
+# miss or revalidation, or by a hit once the oldest unsaved one is this old
+ACCESS_SAVE_AGE = 5 * 60
+
+
+_lock = threading.Lock()
+_index = None
+_index_mtime = 0
+
+# Hits not written to disk yet: access times by key, and the hit count
+_pending = {'accessed': {}, 'hits': 0, 'since': None}
+
+
+
+def is_enabled():
+    """Check whether the page cache is enabled in settings"""
+    return utils.get_setting('cache_enabled') != 'false'
+
+
+
+def get_ttl(kind):
+    """Get time-to-live in seconds for a route kind
+
+    Args:
+        kind (str): Route kind ('listing' or 'search')
+
+    Returns:
+        int: TTL in seconds
+    """
+    try:
+        minutes = int(utils.get_setting(TTL_SETTINGS[kind]))
+    except (KeyError, ValueError):
+        minutes = DEFAULT_TTL.get(kind, 0)
+    return minutes * 60
+
+
+
+def get_max_bytes():
+    """Get maximum total cache size in bytes from settings"""
+    try:
+        megabytes = int(utils.get_setting('cache_max_mb'))
+    except ValueError:
+        megabytes = DEFAULT_MAX_MB
+    return megabytes * 1024 * 1024
+
+
+
+def _load_index():
+    """Load the cache index from disk, again whenever another process rewrote it"""
+    global _index, _index_mtime
+    path = utils.get_profile_path(CACHE_DIR, INDEX_FILE)
+    mtime = utils.get_mtime(path)
+    if _index is None or mtime != _index_mtime:
+        _index_mtime = mtime
+        _index = utils.read_json(path, None)
+        if not isinstance(_index, dict):
+            _index = {}
+        _index.setdefault('entries', {})
+        _index.setdefault('stats', {'hits': 0, 'misses': 0, 'revalidated': 0, 'evictions': 0})
+        # Another process rewrote the index: keep this one's unsaved hits
+        for key, accessed in _pending['accessed'].items():
+            entry = _index['entries'].get(key)
+            if entry:
+                entry['accessed'] = max(entry.get('accessed', 0), accessed)
+        _index['stats']['hits'] += _pending['hits']
+    return _index
+
+
+
+def _save_index():
+    """Write the cache index to disk"""
+    global _index_mtime
+    path = utils.get_profile_path(CACHE_DIR, INDEX_FILE)
+    try:
+        utils.write_json(path, _index)
+        _index_mtime = utils.get_mtime(path)
+        _pending['accessed'].clear()
+        _pending['hits'] = 0
+        _pending['since'] = None
+    except OSError as e:
+        utils.log(f"Error saving cache index: {e}", level=utils.LOGERROR)
+
+
+
+def _body_path(key):
+    return utils.get_profile_path(CACHE_DIR, f'{key}.html')
+
+
+
+def _read_body(key):
+    try:
+        with open(_body_path(key), 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+
+def _evict(entries, stats):
+    """Evict least recently used entries until the cache fits its size limit"""
+    max_bytes = get_max_bytes()
+    total = sum(entry.get('size', 0) for entry in entries.values())
+    if total <= max_bytes:
+        return
+
+    for key, entry in sorted(entries.items(), key=lambda item: item[1].get('accessed', 0)):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(_body_path(key))
+        except OSError:
+            pass
+        total -= entry.get('size', 0)
+        del entries[key]
+        stats['evictions'] += 1
+
+
+
+def _store(key, url, kind, response, body, now):
+    """Store a response body and its validators"""
+    with open(_body_path(key), 'wb') as f:
+        f.write(body)
+
+    index = _load_index()
+    index['entries'][key] = {
+        'url': url,
+        'kind': kind,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'stored': now,
+        'accessed': now,
+        'size': len(body)
+    }
+    _evict(index['entries'], index['stats'])
+
+
+
+def _mark(result):
+    """Record the cache outcome on the current timing span"""
+    current = utils.current_span()
+    if current is not None:
+        current.set(cache=result)
+
+
+
+def fetch(session, url, kind, timeout, revalidate=False):
+    """Fetch a page body through the cache
+
+    Fresh entries are served without touching the network, and their access
+    times are written to the index in batches (see ACCESS_SAVE_AGE). Stale
+    entries are revalidated with a conditional GET (ETag / Last-Modified).
+
+    Args:
+        session: Requests session
+        url (str): Page URL
+        kind (str): Route kind ('listing' or 'search'), selects the TTL
+        timeout (int): Request timeout
+        revalidate (bool): Revalidate the entry even if it is still fresh
+
+    Returns:
+        bytes: Response body
+    """
+    if not is_enabled():
+        response = session.get(url, timeout=timeout)
+        try:
+            response.raise_for_status()
+            return response.content
+        finally:
+            response.close()
+
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    now = time.time()
+
+    with _lock:
+        index = _load_index()
+        entry = index['entries'].get(key)
+        body = _read_body(key) if entry else None
+        if body is None:
+            entry = None
+
+        if entry and not revalidate and now - entry.get('stored', 0) < get_ttl(kind):
+            entry['accessed'] = now
+            index['stats']['hits'] += 1
+            _pending['accessed'][key] = now
+            _pending['hits'] += 1
+            if _pending['since'] is None:
+                _pending['since'] = now
+            elif now - _pending['since'] >= ACCESS_SAVE_AGE:
+                _save_index()
+            _mark('hit')
+            utils.log(f"Cache hit: {url}", level=utils.LOGDEBUG)
+            return body
+
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    response = session.get(url, headers=headers, timeout=timeout)
+    try:
+        with _lock:
+            index = _load_index()
+            if entry and response.status_code == 304:
+                entry['stored'] = now
+                entry['accessed'] = now
+                index['entries'][key] = entry
+                index['stats']['revalidated'] += 1
+                _mark('revalidated')
+                utils.log(f"Cache revalidated: {url}", level=utils.LOGDEBUG)
+            else:
+                response.raise_for_status()
+                body = response.content
+                index['stats']['misses'] += 1
+                _mark('miss')
+                _store(key, url, kind, response, body, now)
+                utils.log(f"Cache miss: {url}", level=utils.LOGDEBUG)
+            _save_index()
+        return body
+    finally:
+        response.close()
+
+
+
+def get_stats():
+    """Get cache hit/miss counters
+
+    Returns:
+        dict: Counters for hits, misses, revalidated and evictions, plus
+        the current number of entries and total size in bytes
+    """
+    with _lock:
+        index = _load_index()
+        stats = dict(index['stats'])
+        stats['entries'] = len(index['entries'])
+        stats['size'] = sum(entry.get('size', 0) for entry in index['entries'].values())
+    return stats
+
+
+
+def log_stats():
+    """Log cache counters at debug level"""
+    stats = get_stats()
+    requests_seen = stats['hits'] + stats['misses'] + stats['revalidated']
+    hit_rate = (stats['hits'] + stats['revalidated']) * 100.0 / requests_seen if requests_seen else 0.0
+    utils.log(
+        f"Cache stats: hits={stats['hits']} revalidated={stats['revalidated']} "
+        f"misses={stats['misses']} evictions={stats['evictions']} "
+        f"entries={stats['entries']} size={stats['size'] // 1024}KB hit_rate={hit_rate:.1f}%",
+        level=utils.LOGDEBUG
+    )
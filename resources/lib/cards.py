@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash Card Parser Module
+Extracts movie cards (article.bs) from listing and search pages
+"""
+
+
+import time
+from bs4 import BeautifulSoup, SoupStrainer
+from . import utils
+
+
+# Prefer lxml when it is installed, it is considerably faster than html.parser
+try:
+    import lxml  # noqa: F401
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
+
+# Only article.bs subtrees are turned into a tree, the rest of the page is skipped
+_CARD_STRAINER = SoupStrainer('article', class_='bs')
+
+
+
+def parse_cards(content, default_type='Movie'):
+    """Parse all movie cards from a listing or search page
+
+    Args:
+        content (bytes): Page HTML
+        default_type (str): Type used when a card has no div.typez
+
+    Returns:
+        list: List of dictionaries with title, url, thumbnail, status and type
+    """
+    started = time.perf_counter()
+    soup = BeautifulSoup(content, PARSER, parse_only=_CARD_STRAINER)
+
+    records = []
+    for card in soup.find_all('article', class_='bs'):
+        try:
+            record = _parse_card(card, default_type)
+            if record:
+                records.append(record)
+        except Exception as e:
+            utils.log(f"Error parsing card: {e}", level=utils.LOGERROR)
+            continue
+
+    elapsed = (time.perf_counter() - started) * 1000
+    utils.log(f"Parsed {len(records)} cards in {elapsed:.1f}ms ({PARSER})", level=utils.LOGDEBUG)
+    return records
+
+
+
+def _parse_card(card, default_type):
+    """Extract a record from one card with a single walk of its subtree
+
+    Args:
+        card: BeautifulSoup article.bs tag
+        default_type (str): Type used when the card has no div.typez
+
+    Returns:
+        dict: Card record or None if the card has no link
+    """
+    link_tag = title_tag = img_tag = status_tag = type_tag = None
+
+    for tag in card.find_all(True):
+        name = tag.name
+        if name == 'a':
+            if link_tag is None and 'tip' in tag.get('class', ()):
+                link_tag = tag
+        elif name == 'h2':
+            if title_tag is None and tag.get('itemprop') == 'headline':
+                title_tag = tag
+        elif name == 'img':
+            if img_tag is None and 'ts-post-image' in tag.get('class', ()):
+                img_tag = tag
+        elif name == 'span':
+            if status_tag is None and 'epx' in tag.get('class', ()):
+                status_tag = tag
+        elif name == 'div':
+            if type_tag is None and 'typez' in tag.get('class', ()):
+                type_tag = tag
+
+    if not link_tag:
+        return None
+
+    url = link_tag.get('href', '')
+    if not url:
+        return None
+
+    return {
+        'title': title_tag.get_text(strip=True) if title_tag else 'Unknown',
+        'url': url,
+        'thumbnail': img_tag.get('src', '') if img_tag else '',
+        'status': status_tag.get_text(strip=True) if status_tag else 'N/A',
+        'type': type_tag.get_text(strip=True) if type_tag else default_type
+    }
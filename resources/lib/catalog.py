@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash Catalog Module
+Local SQLite index of every card parsed from listing and search pages
+"""
+
+
+import re
+import time
+import sqlite3
+import threading
+from . import utils
+
+
+CATALOG_FILE = 'catalog.db'
+
+MAX_RESULTS = 100
+
+
+_lock = threading.Lock()
+_has_fts = None
+
+
+
+def _connect():
+    """Open the catalog database, creating the schema on first use"""
+    global _has_fts
+    connection = sqlite3.connect(utils.get_profile_path(CATALOG_FILE), timeout=10)
+    connection.row_factory = sqlite3.Row
+
+    if _has_fts is None:
+        with _lock:
+            connection.executescript('''
+                CREATE TABLE IF NOT EXISTS cards (
+                    id INTEGER PRIMARY KEY,
+                    url TEXT NOT NULL UNIQUE,
+                    title TEXT NOT NULL,
+                    thumbnail TEXT,
+                    status TEXT,
+                    type TEXT,
+                    category TEXT,
+                    updated REAL
+                );
+            ''')
+            try:
+                connection.executescript('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS cards_fts
+                        USING fts5(title, content='cards', content_rowid='id');
+                    CREATE TRIGGER IF NOT EXISTS cards_ai AFTER INSERT ON cards BEGIN
+                        INSERT INTO cards_fts(rowid, title) VALUES (new.id, new.title);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS cards_ad AFTER DELETE ON cards BEGIN
+                        INSERT INTO cards_fts(cards_fts, rowid, title) VALUES ('delete', old.id, old.title);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS cards_au AFTER UPDATE OF title ON cards BEGIN
+                        INSERT INTO cards_fts(cards_fts, rowid, title) VALUES ('delete', old.id, old.title);
+                        INSERT INTO cards_fts(rowid, title) VALUES (new.id, new.title);
+                    END;
+                ''')
+                _has_fts = True
+            except sqlite3.OperationalError as e:
+                utils.log(f"FTS5 not available, catalog search falls back to LIKE: {e}", level=utils.LOGWARNING)
+                _has_fts = False
+            connection.commit()
+
+    return connection
+
+
+
+def add_cards(records, category=''):
+    """Insert or update card records
+
+    Args:
+        records (list): Card records (title, url, thumbnail, status, type)
+        category (str): Category the records were listed under ('' if unknown)
+
+    Returns:
+        int: Number of records that were not in the catalog before
+    """
+    if not records:
+        return 0
+
+    now = time.time()
+    connection = _connect()
+    try:
+        with connection:
+            before = connection.execute('SELECT COUNT(*) FROM cards').fetchone()[0]
+            connection.executemany('''
+                INSERT INTO cards (url, title, thumbnail, status, type, category, updated)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    title = excluded.title,
+                    thumbnail = excluded.thumbnail,
+                    status = excluded.status,
+                    type = CASE WHEN excluded.category != '' THEN excluded.type ELSE cards.type END,
+                    category = CASE WHEN excluded.category != '' THEN excluded.category ELSE cards.category END,
+                    updated = excluded.updated
+            ''', [
+                (r['url'], r['title'], r.get('thumbnail', ''), r.get('status', ''),
+                 r.get('type', ''), category, now)
+                for r in records
+            ])
+            after = connection.execute('SELECT COUNT(*) FROM cards').fetchone()[0]
+        return after - before
+    except sqlite3.Error as e:
+        utils.log(f"Error updating catalog: {e}", level=utils.LOGERROR)
+        return 0
+    finally:
+        connection.close()
+
+
+
+def _row_to_record(row):
+    return {
+        'title': row['title'],
+        'url': row['url'],
+        'thumbnail': row['thumbnail'] or '',
+        'status': row['status'] or 'N/A',
+        'type': row['type'] or 'N/A'
+    }
+
+
+
+def search(query, limit=MAX_RESULTS):
+    """Search the catalog by title
+
+    Every word of the query must match (as a prefix), results are ranked by
+    relevance when FTS5 is available.
+
+    Args:
+        query (str): Search query
+        limit (int): Maximum number of results
+
+    Returns:
+        list: Card records, best match first
+    """
+    words = re.findall(r'\w+', query.lower())
+    if not words:
+        return []
+
+    connection = _connect()
+    try:
+        if _has_fts:
+            match = ' '.join(f'"{word}"*' for word in words)
+            rows = connection.execute('''
+                SELECT cards.* FROM cards_fts
+                JOIN cards ON cards.id = cards_fts.rowid
+                WHERE cards_fts MATCH ?
+                ORDER BY bm25(cards_fts), cards.title
+                LIMIT ?
+            ''', (match, limit)).fetchall()
+        else:
+            conditions = ' AND '.join('LOWER(title) LIKE ?' for _ in words)
+            rows = connection.execute(
+                f'SELECT * FROM cards WHERE {conditions} ORDER BY title LIMIT ?',
+                [f'%{word}%' for word in words] + [limit]
+            ).fetchall()
+        return [_row_to_record(row) for row in rows]
+    except sqlite3.Error as e:
+        utils.log(f"Error searching catalog: {e}", level=utils.LOGERROR)
+        return []
+    finally:
+        connection.close()
+
+
+
+def count():
+    """Get the number of cards in the catalog"""
+    connection = _connect()
+    try:
+        return connection.execute('SELECT COUNT(*) FROM cards').fetchone()[0]
+    except sqlite3.Error as e:
+        utils.log(f"Error counting catalog: {e}", level=utils.LOGERROR)
+        return 0
+    finally:
+        connection.close()
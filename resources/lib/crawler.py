@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash Catalog Crawler Module
+Fetches listing pages concurrently into the catalog, stopping at known content
+"""
+
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import requests
+from . import utils
+from . import scraper
+from . import catalog
+from . import listings
+
+
+CATEGORIES = ('hindi-dubbed-movies', 'english-subbed-movies')
+
+STATE_FILE = 'crawler.json'
+
+CRAWL_WORKERS = 4
+
+# Safety net against sites that serve content for any page number
+MAX_PAGES = 500
+
+# Minimum delay between two requests to the same host
+MIN_REQUEST_INTERVAL = 0.25
+
+
+class RateLimiter(object):
+    """Spaces out request starts per host"""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = {}
+
+    def wait(self, url):
+        """Block until a request to the URL's host may start"""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class CrawlStats(object):
+    """Progress counters of a crawl"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.pages = 0
+        self.new_items = 0
+        self.category = None
+        self.page = 0
+
+    @property
+    def pages_per_sec(self):
+        elapsed = time.time() - self.started
+        return self.pages / elapsed if elapsed > 0 else 0.0
+
+
+
+def _load_state():
+    state = utils.read_json(utils.get_profile_path(STATE_FILE), {})
+    return state if isinstance(state, dict) else {}
+
+
+
+def _save_state(state):
+    try:
+        utils.write_json(utils.get_profile_path(STATE_FILE), state)
+    except OSError as e:
+        utils.log(f"Error saving crawler state: {e}", level=utils.LOGERROR)
+
+
+
+def _fetch_page(limiter, page, category):
+    """Fetch one listing page
+
+    Returns:
+        list: Card records, or None past the last page
+    """
+    limiter.wait(scraper.BASE_URL)
+    try:
+        return scraper.fetch_movies(page, category)
+    except requests.exceptions.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            return None
+        raise
+
+
+
+def crawl(categories=CATEGORIES, progress=None, workers=CRAWL_WORKERS):
+    """Crawl listing pages into the catalog
+
+    The first run walks every page. Its position is saved after each batch, so
+    an interrupted run resumes where it stopped. Once a category has been
+    crawled completely, later runs start from page 1 and stop at the first page
+    whose cards are all already in the catalog.
+
+    Args:
+        categories (tuple): Categories to crawl
+        progress (callable): Called with a CrawlStats after every page; return
+            False to cancel
+        workers (int): Listing pages fetched at once
+
+    Returns:
+        CrawlStats: Final counters
+    """
+    state = _load_state()
+    stats = CrawlStats()
+    limiter = RateLimiter(MIN_REQUEST_INTERVAL)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for category in categories:
+            category_state = state.setdefault(category, {'next_page': 1, 'complete': False})
+            incremental = category_state['complete']
+            page = 1 if incremental else category_state['next_page']
+            stats.category = category
+
+            utils.log(f"Crawling {category} from page {page} ({'incremental' if incremental else 'full'})")
+
+            done = False
+            while not done and page <= MAX_PAGES:
+                batch = list(range(page, page + workers))
+                futures = [executor.submit(utils.bind_spans(_fetch_page), limiter, p, category) for p in batch]
+
+                for batch_page, future in zip(batch, futures):
+                    try:
+                        records = future.result()
+                    except Exception as e:
+                        # Leave the category resumable from this page
+                        utils.log(f"Crawl of {category} page {batch_page} failed: {e}", level=utils.LOGWARNING)
+                        _save_state(state)
+                        return stats
+
+                    if not records:
+                        category_state.update({'next_page': 1, 'complete': True, 'finished': time.time()})
+                        done = True
+                        break
+
+                    new_items = catalog.add_cards(records, category)
+                    listings.put(category, batch_page, records)
+
+                    stats.pages += 1
+                    stats.new_items += new_items
+                    stats.page = batch_page
+
+                    if not incremental:
+                        category_state['next_page'] = batch_page + 1
+
+                    if progress is not None and progress(stats) is False:
+                        for pending in futures:
+                            pending.cancel()
+                        _save_state(state)
+                        return stats
+
+                    if incremental and new_items == 0:
+                        utils.log(f"Reached known content at {category} page {batch_page}")
+                        category_state['finished'] = time.time()
+                        done = True
+                        break
+
+                for pending in futures:
+                    pending.cancel()
+                _save_state(state)
+                page += workers
+
+    utils.log(f"Crawl finished: {stats.pages} pages, {stats.new_items} new, {stats.pages_per_sec:.1f} pages/s")
+    return stats
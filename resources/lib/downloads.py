@@ -0,0 +1,599 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash Downloads Module
+Resumable offline downloads: multi-connection ranged MP4s and parallel HLS segments
+"""
+
+
+import os
+import re
+import time
+import shutil
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin, parse_qsl
+import xbmcvfs
+from . import utils
+
+
+# Job state files and markers live in the profile, next to partial HLS segments
+STATE_DIR = 'downloads'
+
+QUEUED = 'queued'
+DOWNLOADING = 'downloading'
+PAUSED = 'paused'
+DONE = 'done'
+FAILED = 'failed'
+
+# Markers the plugin drops for the service, which is the only writer of job files
+PAUSE_MARKER = '.pause'
+DELETE_MARKER = '.delete'
+
+DEFAULT_CONNECTIONS = 4
+
+# MP4s are fetched in ranges of this size, several at a time
+PART_SIZE = 4 * 1024 * 1024
+BLOCK_SIZE = 64 * 1024
+
+# Seconds between progress saves, and between checks for new jobs
+SAVE_INTERVAL = 2
+POLL_INTERVAL = 2
+
+REFERER = 'https://dorabash.com/'
+
+
+class Stopped(Exception):
+    """Raised inside a transfer when the job was paused or deleted, or Kodi is exiting"""
+
+
+
+def get_download_dir():
+    """Get the directory finished downloads are stored in (setting, or the profile)"""
+    path = utils.get_setting('download_path')
+    if path:
+        path = xbmcvfs.translatePath(path)
+    else:
+        path = utils.get_profile_path(STATE_DIR, 'files', '')
+    if not os.path.isdir(path):
+        os.makedirs(path, exist_ok=True)
+    return path
+
+
+
+def get_connections():
+    """Get the number of concurrent connections per download from settings"""
+    try:
+        return max(1, int(utils.get_setting('download_connections')))
+    except ValueError:
+        return DEFAULT_CONNECTIONS
+
+
+
+def get_rate_limit():
+    """Get the download bandwidth cap in bytes per second from settings (0: none)"""
+    try:
+        return max(0, int(utils.get_setting('download_rate_kbps'))) * 1024
+    except ValueError:
+        return 0
+
+
+
+def _job_id(content_url):
+    return hashlib.sha1(content_url.encode('utf-8')).hexdigest()[:16]
+
+
+
+def _state_path(job_id, suffix='.json'):
+    return utils.get_profile_path(STATE_DIR, job_id + suffix)
+
+
+
+def _save_job(job):
+    utils.write_json(_state_path(job['id']), job)
+
+
+
+def add(content_url, title, thumbnail=''):
+    """Queue a title for download
+
+    Args:
+        content_url (str): Content page URL
+        title (str): Title shown in the Downloads menu
+        thumbnail (str): Thumbnail URL
+
+    Returns:
+        bool: False if the title is already in the downloads
+    """
+    job_id = _job_id(content_url)
+    if os.path.exists(_state_path(job_id)):
+        # Also while a deletion is pending, the service still owns the old files
+        return False
+
+    _save_job({
+        'id': job_id,
+        'content_url': content_url,
+        'title': title,
+        'thumbnail': thumbnail,
+        'status': QUEUED,
+        'created': time.time(),
+        'percent': 0,
+        'bytes_done': 0,
+        'bytes_total': 0,
+        'file': None,
+        'error': ''
+    })
+    return True
+
+
+
+def get_jobs():
+    """Get all downloads, oldest first
+
+    Returns:
+        list: Job dictionaries. Unfinished jobs with a pause marker report PAUSED.
+    """
+    directory = os.path.dirname(_state_path('x'))
+    jobs = []
+    for name in os.listdir(directory):
+        if not name.endswith('.json'):
+            continue
+        job_id = name[:-len('.json')]
+        if os.path.exists(_state_path(job_id, DELETE_MARKER)):
+            continue
+        job = utils.read_json(os.path.join(directory, name), None)
+        if not isinstance(job, dict):
+            continue
+        if job['status'] != DONE and os.path.exists(_state_path(job_id, PAUSE_MARKER)):
+            job['status'] = PAUSED
+        jobs.append(job)
+    return sorted(jobs, key=lambda job: job.get('created', 0))
+
+
+
+def pause(job_id):
+    """Ask the service to stop a download, keeping what it has fetched"""
+    with open(_state_path(job_id, PAUSE_MARKER), 'w'):
+        pass
+
+
+
+def resume(job_id):
+    """Let the service continue a paused or failed download"""
+    if os.path.exists(_state_path(job_id, PAUSE_MARKER)):
+        os.remove(_state_path(job_id, PAUSE_MARKER))
+    job = utils.read_json(_state_path(job_id), None)
+    if isinstance(job, dict) and job['status'] == FAILED:
+        # The service does not touch failed jobs, so this write cannot race it
+        job['status'] = QUEUED
+        job['error'] = ''
+        _save_job(job)
+
+
+
+def delete(job_id):
+    """Ask the service to stop a download and delete its files"""
+    with open(_state_path(job_id, DELETE_MARKER), 'w'):
+        pass
+
+
+class RateLimiter(object):
+    """Token bucket shared by all connections of a download"""
+
+    def __init__(self, bytes_per_second):
+        self.rate = bytes_per_second
+        self._lock = threading.Lock()
+        self._allowance = float(bytes_per_second)
+        self._last = time.monotonic()
+
+    def consume(self, size):
+        """Account for bytes received, sleeping when over the rate"""
+        if not self.rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(self.rate, self._allowance + (now - self._last) * self.rate)
+            self._last = now
+            self._allowance -= size
+            wait = -self._allowance / self.rate if self._allowance < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+class _Transfer(object):
+    """One running download: shared session, headers, limiter and progress"""
+
+    def __init__(self, job, session, headers, timeout, limiter, should_stop, meter=None):
+        self.job = job
+        self.session = session
+        self.headers = headers
+        self.timeout = timeout
+        self.limiter = limiter
+        self.should_stop = should_stop
+        self.meter = meter
+        self._lock = threading.Lock()
+        self._saved = 0.0
+
+    def get(self, url, **kwargs):
+        headers = dict(self.headers)
+        headers.update(kwargs.pop('headers', {}))
+        response = self.session.get(url, headers=headers, timeout=self.timeout, **kwargs)
+        response.raise_for_status()
+        return response
+
+    def copy(self, response, f):
+        """Write a response body to a file, honouring the rate limit and stop requests
+
+        Returns:
+            int: Bytes written
+        """
+        written = 0
+        if self.meter:
+            self.meter.begin()
+        try:
+            for block in response.iter_content(chunk_size=BLOCK_SIZE):
+                if self.should_stop():
+                    raise Stopped()
+                f.write(block)
+                written += len(block)
+                self.limiter.consume(len(block))
+                self.add_progress(len(block))
+        finally:
+            if self.meter:
+                self.meter.end(written)
+        return written
+
+    def add_progress(self, size, percent=None):
+        with self._lock:
+            self.job['bytes_done'] += size
+            if percent is not None:
+                self.job['percent'] = percent
+            elif self.job['bytes_total']:
+                self.job['percent'] = min(99, self.job['bytes_done'] * 100 // self.job['bytes_total'])
+            if time.time() - self._saved >= SAVE_INTERVAL:
+                self.save()
+
+    def save(self):
+        self._saved = time.time()
+        _save_job(self.job)
+
+
+
+def _run_parallel(transfer, func, tasks):
+    """Run tasks on the download's connections, stopping them all on the first error"""
+    executor = ThreadPoolExecutor(max_workers=max(1, min(get_connections(), len(tasks))))
+    stop = threading.Event()
+    should_stop = transfer.should_stop
+    transfer.should_stop = lambda: stop.is_set() or should_stop()
+    try:
+        futures = [executor.submit(func, task) for task in tasks]
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except BaseException:
+                stop.set()
+                raise
+    finally:
+        stop.set()
+        executor.shutdown(wait=True)
+        transfer.should_stop = should_stop
+
+
+
+def _probe_size(transfer, url):
+    """Get the size of a file and whether the server serves byte ranges
+
+    Returns:
+        tuple: (size in bytes or 0 if unknown, ranges supported)
+    """
+    response = transfer.get(url, headers={'Range': 'bytes=0-0'}, stream=True)
+    try:
+        content_range = response.headers.get('Content-Range', '')
+        if response.status_code == 206 and '/' in content_range:
+            total = content_range.rsplit('/', 1)[1]
+            return (int(total), True) if total.isdigit() else (0, False)
+        return int(response.headers.get('Content-Length') or 0), False
+    finally:
+        response.close()
+
+
+
+def _download_mp4(transfer, url, target):
+    """Download an MP4 with several concurrent range requests
+
+    Parts are written in place into target.part. Finished parts are kept in
+    the job, so a resumed download only fetches the rest.
+    """
+    job = transfer.job
+    part_path = target + '.part'
+    total, ranged = _probe_size(transfer, url)
+
+    if not ranged or not total:
+        # One stream from the start, nothing to resume from
+        utils.log(f"Download: no range support, single connection for {url[:100]}", level=utils.LOGDEBUG)
+        job.update(bytes_total=total, bytes_done=0, parts_done=[])
+        response = transfer.get(url, stream=True)
+        try:
+            with open(part_path, 'wb') as f:
+                transfer.copy(response, f)
+        finally:
+            response.close()
+        os.replace(part_path, target)
+        return
+
+    if job.get('bytes_total') != total or not os.path.exists(part_path):
+        job.update(bytes_total=total, parts_done=[])
+        with open(part_path, 'wb') as f:
+            f.truncate(total)
+
+    parts = [(index, start, min(start + PART_SIZE, total) - 1)
+             for index, start in enumerate(range(0, total, PART_SIZE))]
+
+    def count_done():
+        # Bytes of unfinished parts are fetched again, so they do not count
+        done = set(job['parts_done'])
+        job['bytes_done'] = sum(end - start + 1 for index, start, end in parts if index in done)
+        job['percent'] = min(99, job['bytes_done'] * 100 // total)
+        return done
+
+    done = count_done()
+
+    def fetch_part(part):
+        index, start, end = part
+        response = transfer.get(url, headers={'Range': f'bytes={start}-{end}'}, stream=True)
+        try:
+            if response.status_code != 206 or not response.headers.get('Content-Range', '').startswith(f'bytes {start}-'):
+                raise IOError(f"range {start}-{end} not honoured (status {response.status_code})")
+            with open(part_path, 'r+b') as f:
+                f.seek(start)
+                written = transfer.copy(response, f)
+        finally:
+            response.close()
+        if written != end - start + 1:
+            raise IOError(f"range {start}-{end} incomplete ({written} bytes)")
+        with transfer._lock:
+            job['parts_done'].append(index)
+
+    pending = [part for part in parts if part[0] not in done]
+    utils.log(f"Download: {len(pending)}/{len(parts)} parts of {total // 1024}KB to fetch", level=utils.LOGDEBUG)
+    try:
+        _run_parallel(transfer, fetch_part, pending)
+    finally:
+        count_done()
+        transfer.save()
+    os.replace(part_path, target)
+
+
+
+def _media_playlist(transfer, url):
+    """Fetch the media playlist of an HLS stream, picking a variant from a master playlist
+
+    Returns:
+        tuple: (playlist URL, playlist text)
+    """
+    from . import hls
+    text = transfer.get(url).text
+    if '#EXT-X-STREAM-INF' not in text:
+        return url, text
+
+    variant = hls.select_variant(hls.parse_master(text, url), utils.get_setting('preferred_quality'))
+    if variant is None:
+        raise IOError("master playlist without variants")
+    return variant['url'], transfer.get(variant['url']).text
+
+
+
+def _segment_urls(playlist_url, text):
+    """List the segment URLs of a media playlist, the initialisation segment first"""
+    urls = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith('#EXT-X-KEY') and 'METHOD=NONE' not in line:
+            raise IOError("encrypted HLS streams cannot be downloaded")
+        if line.startswith('#EXT-X-MAP'):
+            match = re.search(r'URI="([^"]+)"', line)
+            if match:
+                urls.insert(0, urljoin(playlist_url, match.group(1)))
+        elif line and not line.startswith('#'):
+            urls.append(urljoin(playlist_url, line))
+    return urls
+
+
+
+def _download_hls(transfer, url, target):
+    """Download the segments of an HLS stream in parallel and concatenate them
+
+    Finished segments are kept as files until the end, so a resumed download
+    only fetches the missing ones.
+    """
+    job = transfer.job
+    playlist_url, text = _media_playlist(transfer, url)
+    segments = _segment_urls(playlist_url, text)
+    if not segments:
+        raise IOError("empty media playlist")
+
+    segment_dir = _state_path(job['id'], '.segments')
+    if job.get('segments_total') != len(segments) and os.path.isdir(segment_dir):
+        # A different rendition than the one started with
+        shutil.rmtree(segment_dir)
+    os.makedirs(segment_dir, exist_ok=True)
+    job['segments_total'] = len(segments)
+
+    def segment_path(index):
+        return os.path.join(segment_dir, f'{index:05d}.ts')
+
+    finished = [index for index in range(len(segments)) if os.path.exists(segment_path(index))]
+    job['bytes_done'] = sum(os.path.getsize(segment_path(index)) for index in finished)
+    counter = {'done': len(finished)}
+
+    def fetch_segment(index):
+        response = transfer.get(segments[index], stream=True)
+        temp_path = segment_path(index) + '.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                transfer.copy(response, f)
+        finally:
+            response.close()
+        os.replace(temp_path, segment_path(index))
+        with transfer._lock:
+            counter['done'] += 1
+            done = counter['done']
+        transfer.add_progress(0, percent=min(99, done * 100 // len(segments)))
+
+    pending = [index for index in range(len(segments)) if index not in finished]
+    utils.log(f"Download: {len(pending)}/{len(segments)} segments to fetch", level=utils.LOGDEBUG)
+    try:
+        _run_parallel(transfer, fetch_segment, pending)
+    finally:
+        transfer.save()
+
+    part_path = target + '.part'
+    with open(part_path, 'wb') as output:
+        for index in range(len(segments)):
+            with open(segment_path(index), 'rb') as segment:
+                shutil.copyfileobj(segment, output)
+    os.replace(part_path, target)
+    shutil.rmtree(segment_dir, ignore_errors=True)
+
+
+
+def _split_headers(video_url):
+    """Split Kodi's 'url|headers' form into the URL and request headers"""
+    from . import scraper
+    headers = {'User-Agent': scraper.HEADERS['User-Agent'], 'Referer': REFERER}
+    if '|' in video_url:
+        video_url, header_string = video_url.split('|', 1)
+        headers.update(parse_qsl(header_string))
+    return video_url, headers
+
+
+
+def _file_name(job, extension):
+    title = re.sub(r'[^\w\s\-\.\(\)]', '', job['title'], flags=re.UNICODE).strip()[:80] or 'video'
+    return f"{title} [{job['id'][:6]}]{extension}"
+
+
+
+def _remove(job_id):
+    """Delete a job's state, partial data and downloaded file"""
+    job = utils.read_json(_state_path(job_id), None)
+    paths = [_state_path(job_id), _state_path(job_id, PAUSE_MARKER), _state_path(job_id, DELETE_MARKER)]
+    if isinstance(job, dict):
+        for name in (job.get('file'), job.get('target')):
+            if name:
+                paths += [name, name + '.part']
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    shutil.rmtree(_state_path(job_id, '.segments'), ignore_errors=True)
+    utils.log(f"Download {job_id} deleted", level=utils.LOGDEBUG)
+
+
+class DownloadWorker(object):
+    """Service worker running queued downloads one at a time
+
+    The plugin only creates job files and drops pause/delete markers; this
+    worker is the only writer of job progress. Jobs interrupted by a Kodi
+    exit are still DOWNLOADING and are resumed on the next start.
+    """
+
+    def __init__(self, monitor):
+        self.monitor = monitor
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stopped.is_set() and not self.monitor.abortRequested():
+            try:
+                self._poll()
+            except Exception as e:
+                utils.log(f"Download worker: {e}", level=utils.LOGERROR)
+            if self.monitor.waitForAbort(POLL_INTERVAL):
+                break
+
+    def _poll(self):
+        directory = os.path.dirname(_state_path('x'))
+        for name in os.listdir(directory):
+            if name.endswith(DELETE_MARKER):
+                _remove(name[:-len(DELETE_MARKER)])
+
+        for job in get_jobs():
+            # Paused jobs whose marker was removed are resumed as well
+            if job['status'] in (QUEUED, DOWNLOADING, PAUSED) and not self._should_stop(job['id']):
+                self._download(job)
+                return
+
+    def _should_stop(self, job_id):
+        return (self._stopped.is_set() or self.monitor.abortRequested()
+                or os.path.exists(_state_path(job_id, PAUSE_MARKER))
+                or os.path.exists(_state_path(job_id, DELETE_MARKER)))
+
+    def _download(self, job):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from . import hls, scraper
+
+        job['status'] = DOWNLOADING
+        _save_job(job)
+        utils.log(f"Download: starting {job['title']}")
+
+        result = scraper.extract_video_url(job['content_url'], utils.get_setting('preferred_quality'))
+        utils.flush_spans('download')
+        if not result:
+            job.update(status=FAILED, error='Could not resolve the video')
+            _save_job(job)
+            return
+
+        video_url, headers = _split_headers(result['url'])
+        is_hls = result.get('type') == 'hls' or '.m3u8' in video_url
+        target = os.path.join(get_download_dir(), _file_name(job, '.ts' if is_hls else '.mp4'))
+        job['target'] = target
+
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=get_connections())
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        limiter = RateLimiter(get_rate_limit())
+        # A capped download would report the cap as the link's bandwidth
+        meter = None if limiter.rate else hls.ThroughputMeter()
+        transfer = _Transfer(job, session, headers, scraper.get_timeout(), limiter,
+                             lambda: self._should_stop(job['id']), meter)
+
+        started = time.time()
+        try:
+            if is_hls:
+                _download_hls(transfer, video_url, target)
+            else:
+                _download_mp4(transfer, video_url, target)
+        except Stopped:
+            utils.log(f"Download: stopped {job['title']} at {job['percent']}%")
+            if not self.monitor.abortRequested() and not self._stopped.is_set():
+                job['status'] = PAUSED
+            _save_job(job)
+            return
+        except Exception as e:
+            utils.log(f"Download: {job['title']} failed: {e}", level=utils.LOGERROR)
+            job.update(status=FAILED, error=str(e))
+            _save_job(job)
+            return
+        finally:
+            session.close()
+
+        size = os.path.getsize(target)
+        job.update(status=DONE, file=target, percent=100, bytes_done=size, bytes_total=size, finished=time.time())
+        _save_job(job)
+        elapsed = max(time.time() - started, 0.001)
+        utils.log(f"Download: finished {job['title']}, {size // 1024}KB in {elapsed:.1f}s "
+                  f"({size / 1024 / elapsed:.0f}KB/s)")
+        utils.notify(f"Downloaded: {job['title']}")
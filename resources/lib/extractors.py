@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash Extractors Module
+Registry of host extractors, with strategies ordered by their track record
+"""
+
+
+import time
+import threading
+from . import utils
+
+
+STATS_FILE = 'extractors.json'
+
+# Weight of the latest attempt in the success rate and latency averages, so
+# a strategy that stops working drops back within a few attempts
+SAMPLE_WEIGHT = 0.3
+
+
+_registry = []
+_lock = threading.Lock()
+_stats = None
+_stats_mtime = 0
+
+
+class ExtractionContext(object):
+    """Inputs of one extraction, plus whatever prepare() adds for the strategies"""
+
+    def __init__(self, iframe_src, player_url, session, timeout, preferred_quality):
+        if iframe_src.startswith('//'):
+            iframe_src = 'https:' + iframe_src
+        self.iframe_src = iframe_src
+        self.player_url = player_url
+        self.session = session
+        self.timeout = timeout
+        self.preferred_quality = preferred_quality
+
+
+class Extractor(object):
+    """Base class of host extractors
+
+    Subclasses set a name and the host names they handle, and return their
+    strategies in preferred order for hosts without a track record yet.
+    Register them with the @register decorator.
+    """
+
+    name = ''
+    hosts = ()
+
+    def matches(self, iframe_src):
+        """Check whether this extractor handles an embed URL"""
+        url = iframe_src.lower()
+        return any(host in url for host in self.hosts)
+
+    def prepare(self, context):
+        """Do the work shared by all strategies (e.g. fetch the embed page)
+
+        Raises on failure, which ends the extraction.
+        """
+
+    def strategies(self):
+        """Get the strategies of this extractor
+
+        Returns:
+            list: (name, callable) pairs; the callable takes the context and
+            returns the video URL info dict, or None
+        """
+        raise NotImplementedError
+
+
+
+def register(cls):
+    """Class decorator adding an extractor to the registry"""
+    _registry.append(cls())
+    return cls
+
+
+
+def find(iframe_src):
+    """Get the registered extractor for an embed URL, or None"""
+    for extractor in _registry:
+        if extractor.matches(iframe_src):
+            return extractor
+    return None
+
+
+
+def _load_stats():
+    """Load strategy statistics from disk, again whenever another process rewrote them"""
+    global _stats, _stats_mtime
+    path = utils.get_profile_path(STATS_FILE)
+    mtime = utils.get_mtime(path)
+    if _stats is None or mtime != _stats_mtime:
+        _stats_mtime = mtime
+        _stats = utils.read_json(path, None)
+        if not isinstance(_stats, dict):
+            _stats = {}
+    return _stats
+
+
+
+def _save_stats():
+    global _stats_mtime
+    path = utils.get_profile_path(STATS_FILE)
+    utils.write_json(path, _stats)
+    _stats_mtime = utils.get_mtime(path)
+
+
+
+def record(extractor_name, strategy_name, success, elapsed_ms):
+    """Add an attempt to a strategy's success rate and latency
+
+    Args:
+        extractor_name (str): Extractor name
+        strategy_name (str): Strategy name
+        success (bool): Whether the strategy found a stream
+        elapsed_ms (float): Time the attempt took
+    """
+    with _lock:
+        stats = _load_stats().setdefault(extractor_name, {}).setdefault(strategy_name, {})
+        outcome = 1.0 if success else 0.0
+        if not stats.get('attempts'):
+            stats['success_rate'] = outcome
+        else:
+            stats['success_rate'] = stats['success_rate'] * (1 - SAMPLE_WEIGHT) + outcome * SAMPLE_WEIGHT
+        if success:
+            previous = stats.get('avg_ms')
+            stats['avg_ms'] = elapsed_ms if previous is None else previous * (1 - SAMPLE_WEIGHT) + elapsed_ms * SAMPLE_WEIGHT
+        stats['attempts'] = stats.get('attempts', 0) + 1
+        stats['successes'] = stats.get('successes', 0) + (1 if success else 0)
+        stats['last_used'] = time.time()
+        try:
+            _save_stats()
+        except OSError as e:
+            utils.log(f"Error saving extractor stats: {e}", level=utils.LOGERROR)
+
+
+
+def order_strategies(extractor):
+    """Order an extractor's strategies by expected time to a working stream
+
+    Strategies that have worked before come first, by average latency divided
+    by success rate. The rest follow in the extractor's own order.
+
+    Returns:
+        list: (name, callable) pairs
+    """
+    with _lock:
+        stats = dict(_load_stats().get(extractor.name, {}))
+
+    proven = []
+    unproven = []
+    for position, (name, strategy) in enumerate(extractor.strategies()):
+        entry = stats.get(name, {})
+        if entry.get('success_rate') and entry.get('avg_ms') is not None:
+            proven.append((entry['avg_ms'] / entry['success_rate'], position, name, strategy))
+        else:
+            unproven.append((name, strategy))
+
+    return [(name, strategy) for _, _, name, strategy in sorted(proven)] + unproven
+
+
+
+def extract(context):
+    """Resolve an embed with the matching extractor, trying its strategies in order
+
+    Args:
+        context (ExtractionContext): Extraction inputs
+
+    Returns:
+        dict: Video URL info, or None if no extractor or strategy worked
+    """
+    extractor = find(context.iframe_src)
+    if extractor is None:
+        utils.log(f"ERROR: Unsupported iframe provider: {context.iframe_src}", level=utils.LOGERROR)
+        return None
+
+    utils.log(f">>> ROUTING TO {extractor.name.upper()} EXTRACTOR", level=utils.LOGERROR)
+
+    with utils.span(extractor.name) as extractor_span:
+        try:
+            extractor.prepare(context)
+        except Exception as e:
+            utils.log(f"{extractor.name}: preparation failed: {e}", level=utils.LOGERROR)
+            extractor_span.set(strategy=None)
+            return None
+
+        strategies = order_strategies(extractor)
+        utils.log(f"{extractor.name}: strategy order {[name for name, _ in strategies]}", level=utils.LOGDEBUG)
+
+        for name, strategy in strategies:
+            started = time.perf_counter()
+            try:
+                with utils.span(f'{extractor.name}.{name}'):
+                    result = strategy(context)
+            except Exception as e:
+                utils.log(f"{extractor.name}: strategy {name} failed: {e}", level=utils.LOGERROR)
+                result = None
+            record(extractor.name, name, bool(result), (time.perf_counter() - started) * 1000)
+
+            if result:
+                extractor_span.set(strategy=name)
+                return result
+
+        extractor_span.set(strategy=None)
+        utils.log(f"{extractor.name}: no strategy found a stream", level=utils.LOGERROR)
+        return None
+
+
+
+def get_stats():
+    """Get the recorded statistics of every extractor strategy
+
+    Returns:
+        dict: Extractor name -> strategy name -> statistics
+    """
+    with _lock:
+        return dict((name, dict(strategies)) for name, strategies in _load_stats().items())
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash Host Health Module
+Negative cache for dead URLs and per-host circuit breakers
+"""
+
+
+import time
+import threading
+from urllib.parse import urlparse
+import requests
+from . import utils
+
+
+STATE_FILE = 'hosts.json'
+
+# Consecutive failures (connection errors, timeouts, 5xx, 408, 429) that open a breaker
+FAILURE_THRESHOLD = 3
+
+# Answers asking to retry later (request timeout, rate limit): a failure of
+# the host, not a sign that the URL is dead
+RETRY_LATER = (408, 429)
+
+# Cool-down of an open breaker, doubled every time it re-opens
+BASE_COOLDOWN = 60
+MAX_COOLDOWN = 15 * 60
+
+# Timeout of the trial requests let through once the cool-down is over
+TRIAL_TIMEOUT = 3
+
+# How long a URL that answered a dead status (see is_dead_status) or an invalid playlist is skipped
+NEGATIVE_TTL = 30 * 60
+MAX_NEGATIVE_ENTRIES = 500
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+_lock = threading.Lock()
+_state = None
+_state_mtime = 0
+
+
+class HostUnavailable(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to a host whose breaker is open"""
+
+
+
+def _host(url):
+    return urlparse(url).netloc.lower()
+
+
+
+def _load_state():
+    """Load breaker and negative cache state from disk, again whenever another process rewrote it"""
+    global _state, _state_mtime
+    path = utils.get_profile_path(STATE_FILE)
+    mtime = utils.get_mtime(path)
+    if _state is None or mtime != _state_mtime:
+        _state_mtime = mtime
+        _state = utils.read_json(path, None)
+        if not isinstance(_state, dict):
+            _state = {}
+        _state.setdefault('breakers', {})
+        _state.setdefault('negative', {})
+        now = time.time()
+        _state['negative'] = dict(
+            (url, entry) for url, entry in _state['negative'].items() if entry.get('until', 0) > now
+        )
+    return _state
+
+
+
+def _save_state():
+    global _state_mtime
+    path = utils.get_profile_path(STATE_FILE)
+    try:
+        utils.write_json(path, _state)
+        _state_mtime = utils.get_mtime(path)
+    except OSError as e:
+        utils.log(f"Error saving host health: {e}", level=utils.LOGERROR)
+
+
+
+def _mark(**fields):
+    """Record health decisions on the current timing span"""
+    current = utils.current_span()
+    if current is not None:
+        current.set(**fields)
+
+
+
+def get_state(url):
+    """Get the breaker state of a URL's host
+
+    Returns:
+        str: CLOSED, OPEN or HALF_OPEN (cool-down over, trial requests allowed)
+    """
+    with _lock:
+        breaker = _load_state()['breakers'].get(_host(url))
+    if not breaker or not breaker.get('open_until'):
+        return CLOSED
+    return OPEN if time.time() < breaker['open_until'] else HALF_OPEN
+
+
+
+def record_success(url):
+    """Close the breaker of a URL's host after a successful request"""
+    host = _host(url)
+    with _lock:
+        breakers = _load_state()['breakers']
+        breaker = breakers.get(host)
+        if not breaker:
+            return
+        del breakers[host]
+        _save_state()
+    if breaker.get('open_until'):
+        utils.log(f"Circuit breaker for {host} closed", level=utils.LOGDEBUG)
+
+
+
+def record_failure(url, reason=''):
+    """Count a failed request against a URL's host, opening its breaker at the threshold"""
+    host = _host(url)
+    now = time.time()
+    with _lock:
+        breaker = _load_state()['breakers'].setdefault(host, {'failures': 0, 'opened': 0})
+        breaker['failures'] += 1
+        breaker['last_error'] = reason
+        reopening = breaker.get('open_until') and now >= breaker['open_until']
+        if reopening or (not breaker.get('open_until') and breaker['failures'] >= FAILURE_THRESHOLD):
+            cooldown = min(BASE_COOLDOWN * 2 ** breaker['opened'], MAX_COOLDOWN)
+            breaker['opened'] += 1
+            breaker['open_until'] = now + cooldown
+        else:
+            cooldown = None
+        _save_state()
+
+    if cooldown:
+        utils.log(f"Circuit breaker for {host} opened for {cooldown}s after {breaker['failures']} "
+                  f"failure(s): {reason}", level=utils.LOGDEBUG)
+        _mark(breaker=OPEN, breaker_host=host)
+
+
+
+def is_dead_status(status):
+    """Check whether an HTTP status means the URL itself is dead (4xx but 408 and 429)"""
+    return 400 <= status < 500 and status not in RETRY_LATER
+
+
+
+def is_negative(url):
+    """Check whether a URL recently answered 4xx or an invalid response"""
+    with _lock:
+        entry = _load_state()['negative'].get(url)
+    if entry and entry['until'] > time.time():
+        utils.log(f"Skipping known bad URL ({entry.get('reason')}): {url[:100]}", level=utils.LOGDEBUG)
+        _mark(negative=True)
+        return True
+    return False
+
+
+
+def add_negative(url, reason, ttl=NEGATIVE_TTL):
+    """Remember that a URL is dead
+
+    Args:
+        url (str): URL
+        reason (str): Why, e.g. 'status 403' or 'invalid playlist'
+        ttl (int): Seconds to skip the URL
+    """
+    with _lock:
+        negative = _load_state()['negative']
+        negative[url] = {'until': time.time() + ttl, 'reason': reason}
+        if len(negative) > MAX_NEGATIVE_ENTRIES:
+            for stale in sorted(negative, key=lambda key: negative[key]['until'])[:len(negative) - MAX_NEGATIVE_ENTRIES]:
+                del negative[stale]
+        _save_state()
+
+
+
+def get_summary():
+    """Get the hosts with failures and the size of the negative cache
+
+    Returns:
+        dict: 'hosts' (list of dicts with host, state, failures, seconds left,
+        last error) and 'negative' (number of URLs being skipped)
+    """
+    now = time.time()
+    with _lock:
+        state = _load_state()
+        hosts = []
+        for host, breaker in sorted(state['breakers'].items()):
+            open_until = breaker.get('open_until')
+            hosts.append({
+                'host': host,
+                'state': CLOSED if not open_until else (OPEN if now < open_until else HALF_OPEN),
+                'failures': breaker.get('failures', 0),
+                'remaining': max(0, int(open_until - now)) if open_until else 0,
+                'last_error': breaker.get('last_error', '')
+            })
+        negative = sum(1 for entry in state['negative'].values() if entry['until'] > now)
+    return {'hosts': hosts, 'negative': negative}
+
+
+class GuardedSession(requests.Session):
+    """Requests session that honours the host circuit breakers
+
+    Requests to an open host fail at once with HostUnavailable. Once the
+    cool-down is over, requests go out with a short timeout as trials.
+    Connection errors, timeouts, 5xx, 408 and 429 answers count as failures.
+    """
+
+    def send(self, request, **kwargs):
+        url = request.url
+        state = get_state(url)
+        if state == OPEN:
+            _mark(breaker=OPEN, breaker_host=_host(url))
+            utils.log(f"Circuit breaker open, skipping {url[:100]}", level=utils.LOGDEBUG)
+            raise HostUnavailable(f"{_host(url)} is unavailable (circuit breaker open)", request=request)
+        if state == HALF_OPEN:
+            _mark(breaker=HALF_OPEN, breaker_host=_host(url))
+            kwargs['timeout'] = TRIAL_TIMEOUT
+
+        try:
+            response = super().send(request, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            record_failure(url, type(e).__name__)
+            raise
+
+        if response.status_code >= 500 or response.status_code in RETRY_LATER:
+            record_failure(url, f'status {response.status_code}')
+        else:
+            record_success(url)
+        return response
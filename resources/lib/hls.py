@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash HLS Module
+Parses HLS master playlists and picks the variant to hand to Kodi
+"""
+
+
+import re
+import time
+import threading
+from urllib.parse import urljoin
+from . import utils
+
+
+BANDWIDTH_FILE = 'bandwidth.json'
+
+# Samples smaller than this mostly measure latency, not throughput
+MIN_SAMPLE_BYTES = 1024 * 1024
+
+# A busy period of media transfers is recorded as a sample at least this often
+MAX_SAMPLE_SECONDS = 10
+
+# Weight of a new sample in the moving average
+SAMPLE_WEIGHT = 0.3
+
+# Only pick variants whose bitrate fits in this share of the measured bandwidth
+BANDWIDTH_HEADROOM = 0.8
+
+_ATTRIBUTE_PATTERN = re.compile(r'([A-Z0-9\-]+)=("[^"]*"|[^,]*)')
+
+_lock = threading.Lock()
+
+
+
+def parse_master(text, master_url):
+    """Parse the variants of an HLS master playlist
+
+    Args:
+        text (str): Playlist text
+        master_url (str): Playlist URL, used to resolve relative variant URIs
+
+    Returns:
+        list: Variant dictionaries with url, bandwidth, resolution, height and
+        codecs, in playlist order. Empty if the playlist has no variants.
+    """
+    variants = []
+    attributes = None
+
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith('#EXT-X-STREAM-INF:'):
+            attributes = dict(
+                (key, value.strip('"'))
+                for key, value in _ATTRIBUTE_PATTERN.findall(line[len('#EXT-X-STREAM-INF:'):])
+            )
+        elif attributes is not None and line and not line.startswith('#'):
+            resolution = attributes.get('RESOLUTION', '')
+            height = 0
+            if 'x' in resolution:
+                try:
+                    height = int(resolution.split('x')[1])
+                except ValueError:
+                    pass
+            try:
+                bandwidth = int(attributes.get('BANDWIDTH', 0))
+            except ValueError:
+                bandwidth = 0
+
+            variants.append({
+                'url': urljoin(master_url, line),
+                'bandwidth': bandwidth,
+                'resolution': resolution,
+                'height': height,
+                'codecs': attributes.get('CODECS', '')
+            })
+            attributes = None
+
+    return variants
+
+
+
+def select_variant(variants, preferred_quality, bandwidth_bps=None):
+    """Pick the variant closest to the preferred quality that the connection can carry
+
+    Args:
+        variants (list): Variants from parse_master()
+        preferred_quality (str): Preferred height, e.g. '720'
+        bandwidth_bps (float): Measured bandwidth in bits per second, if known
+
+    Returns:
+        dict: Selected variant, or None if there are no variants
+    """
+    if not variants:
+        return None
+
+    try:
+        target = int(preferred_quality)
+    except (TypeError, ValueError):
+        target = 720
+
+    eligible = [v for v in variants if v['height'] and v['height'] <= target]
+    if not eligible:
+        # Nothing at or below the preferred height: take the smallest one
+        eligible = [min(variants, key=lambda v: (v['height'] or 0, v['bandwidth']))]
+
+    if bandwidth_bps:
+        # Only measured on media transfers (see ThroughputMeter)
+        affordable = [v for v in eligible if v['bandwidth'] <= bandwidth_bps * BANDWIDTH_HEADROOM]
+        eligible = affordable or [min(eligible, key=lambda v: v['bandwidth'])]
+
+    return max(eligible, key=lambda v: (v['height'], v['bandwidth']))
+
+
+
+def record_throughput(size, seconds):
+    """Add a media transfer to the bandwidth estimate
+
+    Args:
+        size (int): Bytes downloaded
+        seconds (float): Time taken
+    """
+    if size < MIN_SAMPLE_BYTES or seconds <= 0:
+        return
+
+    sample = size * 8 / seconds
+    path = utils.get_profile_path(BANDWIDTH_FILE)
+    with _lock:
+        state = utils.read_json(path, {})
+        previous = state.get('media_bps')
+        state['media_bps'] = sample if not previous else previous * (1 - SAMPLE_WEIGHT) + sample * SAMPLE_WEIGHT
+        state['updated'] = time.time()
+        try:
+            utils.write_json(path, state)
+        except OSError:
+            pass
+
+
+
+def get_throughput():
+    """Get the measured bandwidth estimate
+
+    Returns:
+        float: Bits per second, or None if no media transfer has been measured yet
+    """
+    return utils.read_json(utils.get_profile_path(BANDWIDTH_FILE), {}).get('media_bps')
+
+
+class ThroughputMeter(object):
+    """Measures the combined throughput of concurrent media transfers
+
+    Transfers call begin() once the response headers have arrived and end()
+    when the body has been read, so time to first byte is not counted. While
+    any transfer is running the link is busy; the bytes of a busy period over
+    its duration make one sample, recorded when the period ends (or every
+    MAX_SAMPLE_SECONDS). Parallel connections then add up instead of each
+    reporting a share of the link.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = 0
+        self._started = 0.0
+        self._bytes = 0
+
+    def begin(self):
+        with self._lock:
+            if not self._active:
+                self._started = time.perf_counter()
+                self._bytes = 0
+            self._active += 1
+
+    def end(self, size):
+        sample = None
+        with self._lock:
+            self._active -= 1
+            self._bytes += size
+            now = time.perf_counter()
+            if not self._active or now - self._started >= MAX_SAMPLE_SECONDS:
+                sample = (self._bytes, now - self._started)
+                self._started = now
+                self._bytes = 0
+        if sample:
+            record_throughput(*sample)
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash Listing Store Module
+Keeps parsed listing pages (card records) as memory-mapped snapshots
+"""
+
+
+import os
+import time
+import threading
+from . import utils
+from . import cache
+from . import snapshot
+
+
+LISTINGS_DIR = 'listings'
+
+
+_lock = threading.Lock()
+
+# (category, page) -> (expires, records); records are a mapped Snapshot, or
+# the parsed list when the snapshot could not be written
+_memory = {}
+
+
+
+def _path(category, page, extension='.snap'):
+    return utils.get_profile_path(LISTINGS_DIR, f'{category}-{page}{extension}')
+
+
+
+def get(category, page):
+    """Get parsed card records for a listing page if they have not expired
+
+    Only the snapshot header is read here; records are decoded as they are
+    indexed.
+
+    Args:
+        category (str): Movie category
+        page (int): Page number
+
+    Returns:
+        Sequence: Card records (snapshot.Card) or None
+    """
+    if not cache.is_enabled():
+        return None
+
+    key = (category, page)
+    now = time.time()
+    with _lock:
+        entry = _memory.get(key)
+        if entry is None or entry[0] <= now:
+            # Another process (e.g. the service) may have refreshed it on disk
+            _memory.pop(key, None)
+            records = snapshot.load(_path(category, page))
+            if records is None or records.expires <= now:
+                return None
+            entry = _memory[key] = (records.expires, records)
+
+    return entry[1]
+
+
+
+def put(category, page, records, ttl=None):
+    """Store parsed card records for a listing page
+
+    Args:
+        category (str): Movie category
+        page (int): Page number
+        records (list): Card records
+        ttl (int): Lifetime in seconds (default: listing cache TTL)
+    """
+    if not cache.is_enabled():
+        return
+    if ttl is None:
+        ttl = cache.get_ttl('listing')
+
+    now = time.time()
+    key = (category, page)
+    path = _path(category, page)
+    with _lock:
+        # Release our mapping of the old snapshot before it is replaced
+        _memory[key] = (now + ttl, records)
+        try:
+            snapshot.write(path, records, now, now + ttl)
+            # Pages stored before snapshots were introduced
+            legacy_path = _path(category, page, '.json')
+            if os.path.exists(legacy_path):
+                os.remove(legacy_path)
+        except OSError as e:
+            utils.log(f"Error saving listing: {e}", level=utils.LOGERROR)
+            return
+
+        # Keep the compact mapped copy rather than the parsed dictionaries
+        stored = snapshot.load(path)
+        if stored is not None:
+            _memory[key] = (stored.expires, stored)
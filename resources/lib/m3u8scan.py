@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash M3U8 Scan Module
+Finds HLS playlist URLs in embed pages and scripts, ranked by how likely they play
+"""
+
+
+import re
+import time
+from urllib.parse import urlparse, parse_qs
+from . import health
+
+
+# Candidate kinds, in order of preference
+MASTER = 0
+TOKENIZED = 1
+
+# One pattern for every playlist URL; escapes are undone before scanning
+_M3U8_PATTERN = re.compile(r'https?://[^\s"\'<>\\`]+\.m3u8[^\s"\'<>\\`]*', re.IGNORECASE)
+
+# Dean Edwards' packer: eval(function(p,a,c,k,e,d){...}('payload',base,count,'words'.split('|')...))
+_PACKED_PATTERN = re.compile(
+    r"}\s*\(\s*'((?:[^'\\]|\\.)*)'\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*'((?:[^'\\]|\\.)*)'\s*\.split\(\s*'\|'\s*\)"
+)
+_WORD_PATTERN = re.compile(r'\b\w+\b')
+_DIGITS = '0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+# JSON and JavaScript string escapes seen around playlist URLs
+_ESCAPES = (('\\/', '/'), ('\\u002F', '/'), ('\\u002f', '/'), ('\\u0026', '&'), ('\\x26', '&'))
+
+_HOST_RANK = {health.CLOSED: 0, health.HALF_OPEN: 1, health.OPEN: 2}
+
+
+
+def _unescape(text):
+    if '\\' not in text:
+        return text
+    for escaped, plain in _ESCAPES:
+        text = text.replace(escaped, plain)
+    return text
+
+
+
+def _unbase(word, base):
+    if base <= 36:
+        return int(word, base)
+    value = 0
+    for char in word:
+        value = value * base + _DIGITS.index(char)
+    return value
+
+
+
+def unpack(text):
+    """Unpack the packer-obfuscated scripts in a page or script
+
+    Args:
+        text (str): Page or script text
+
+    Returns:
+        list: Unpacked script texts (empty if nothing is packed)
+    """
+    if "split('|')" not in text:
+        return []
+
+    unpacked = []
+    for match in _PACKED_PATTERN.finditer(text):
+        payload, base, _, words = match.groups()
+        base = int(base)
+        if not 2 <= base <= len(_DIGITS):
+            continue
+        words = words.split('|')
+        payload = payload.replace("\\'", "'").replace('\\\\', '\\')
+
+        def lookup(word_match):
+            word = word_match.group(0)
+            try:
+                index = _unbase(word, base)
+            except ValueError:
+                return word
+            return words[index] if index < len(words) and words[index] else word
+
+        unpacked.append(_WORD_PATTERN.sub(lookup, payload))
+    return unpacked
+
+
+
+def is_expired(url, now=None):
+    """Check the issue time (s) and lifetime (e) parameters of a tokenized URL
+
+    Args:
+        url (str): Playlist URL
+        now (float): Current time, defaults to time.time()
+
+    Returns:
+        bool: True if the token has expired, False if it has not or the URL has no such parameters
+    """
+    if now is None:
+        now = time.time()
+    params = parse_qs(urlparse(url).query)
+    try:
+        return int(params['s'][0]) + int(params['e'][0]) < now
+    except (KeyError, ValueError, IndexError):
+        return False
+
+
+
+def find_candidates(text, kinds=(MASTER, TOKENIZED), exclude=()):
+    """Find the playlist URLs in a page or script, best candidate first
+
+    Plain, escaped (https:\\/\\/...) and packed URLs are found in a single
+    scan of the text and of each unpacked script. Master playlists are
+    MASTER candidates. Other playlists are TOKENIZED candidates if they carry
+    a query string; playlists without one are ignored. Duplicates, excluded
+    URLs and URLs in the negative cache are dropped.
+
+    Candidates are ranked by:
+    - whether the token has expired (issue time plus lifetime is past)
+    - kind (master before tokenized)
+    - health of the host (closed breaker first)
+    - position in the text
+
+    Args:
+        text (str): Page or script text
+        kinds (tuple): Candidate kinds to return
+        exclude (set): URLs already probed
+
+    Returns:
+        list: (kind, url) tuples, best first
+    """
+    found = {}
+    for source in [text] + unpack(text):
+        for match in _M3U8_PATTERN.finditer(_unescape(source)):
+            url = match.group(0).rstrip(');,')
+            if url in found or url in exclude:
+                continue
+            path = urlparse(url).path.lower()
+            if path.endswith('/master.m3u8'):
+                kind = MASTER
+            elif '?' in url:
+                kind = TOKENIZED
+            else:
+                continue
+            if kind in kinds:
+                found[url] = (kind, len(found))
+
+    now = time.time()
+    ranked = []
+    for url, (kind, position) in found.items():
+        if health.is_negative(url):
+            continue
+        host_rank = _HOST_RANK.get(health.get_state(url), 0)
+        ranked.append(((is_expired(url, now), kind, host_rank, position), kind, url))
+
+    return [(kind, url) for _, kind, url in sorted(ranked)]
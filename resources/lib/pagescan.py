@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash Page Scan Module
+Streams player pages and stops reading once the player elements have been seen
+"""
+
+
+import codecs
+import threading
+from html.parser import HTMLParser
+from . import utils
+
+
+CHUNK_SIZE = 8 * 1024
+
+# Pages are never read beyond this, whatever they contain
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# A rest of the body up to this size is still read, so the connection can go
+# back to the pool instead of being closed (a new TLS handshake costs more)
+DRAIN_BYTES = 16 * 1024
+
+
+_lock = threading.Lock()
+_counters = {'read': 0, 'saved': 0}
+
+
+class PlayerPage(object):
+    """Player elements of a page: the first <video> with its <source> tags and the first <iframe>"""
+
+    def __init__(self):
+        self.has_video = False
+        self.sources = []
+        self.iframe_src = None
+        self.bytes_read = 0
+        self.bytes_total = None
+
+    @property
+    def has_player(self):
+        return self.has_video or self.iframe_src is not None
+
+    @property
+    def bytes_saved(self):
+        """Bytes of the page that were never downloaded (0 if the size is unknown)"""
+        if self.bytes_total is None:
+            return 0
+        return max(0, self.bytes_total - self.bytes_read)
+
+    def get_video_urls(self):
+        """Get the video URLs of the <source> tags by quality
+
+        Returns:
+            dict: Quality (the size attribute) -> URL
+        """
+        video_urls = {}
+        for source in self.sources:
+            src = source.get('src')
+            quality = source.get('size', 'unknown')
+            if src and quality != 'unknown':
+                if src.startswith('//'):
+                    src = 'https:' + src
+                video_urls[quality] = src
+        return video_urls
+
+    @classmethod
+    def from_soup(cls, soup):
+        """Build a PlayerPage from a page already parsed with BeautifulSoup"""
+        page = cls()
+        video_tag = soup.find('video')
+        if video_tag is not None:
+            page.has_video = True
+            page.sources = [dict(source.attrs) for source in video_tag.find_all('source')]
+        iframe = soup.find('iframe')
+        if iframe is not None:
+            page.iframe_src = iframe.get('src', '')
+        return page
+
+
+class _PlayerParser(HTMLParser):
+    """Incremental parser collecting the player elements into a PlayerPage
+
+    Like PlayerPage.from_soup(), it keeps the first <video> and the first
+    <iframe>, and a video anywhere in the page is preferred over the iframe.
+    It is done at the end of the first <video> if that has usable sources,
+    or once both the video and an iframe have been seen. A page with only an
+    iframe is read to the end (or up to the size cap), since a video may
+    still follow it.
+    """
+
+    def __init__(self, page):
+        super().__init__(convert_charrefs=True)
+        self.page = page
+        self.in_video = False
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == 'video' and not self.page.has_video:
+            self.page.has_video = True
+            self.in_video = True
+        elif tag == 'source' and self.in_video:
+            self.page.sources.append(dict((name, value or '') for name, value in attrs))
+        elif tag == 'iframe' and self.page.iframe_src is None:
+            self.page.iframe_src = dict(attrs).get('src') or ''
+            if self.page.has_video and not self.in_video:
+                self.done = True
+
+    def handle_endtag(self, tag):
+        if tag == 'video' and self.in_video:
+            self.in_video = False
+            if self.page.get_video_urls() or self.page.iframe_src is not None:
+                self.done = True
+
+
+
+def _get_decoder(response):
+    """Incremental decoder for the charset the server declared (UTF-8 otherwise)"""
+    encoding = 'utf-8'
+    if 'charset=' in response.headers.get('Content-Type', '').lower() and response.encoding:
+        encoding = response.encoding
+    try:
+        return codecs.getincrementaldecoder(encoding)(errors='replace')
+    except LookupError:
+        return codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+
+
+def _wire_bytes(response, decoded):
+    """Bytes received from the server so far (before content decoding if possible)"""
+    try:
+        return response.raw.tell()
+    except (AttributeError, OSError, ValueError):
+        return decoded
+
+
+
+def fetch(session, url, timeout, headers=None, max_bytes=MAX_PAGE_BYTES):
+    """Fetch a page, reading only as far as its player elements
+
+    The body is streamed in chunks into an incremental parser. Once the
+    player elements have been seen, the rest of the page is not downloaded.
+
+    Args:
+        session: Requests session
+        url (str): Page URL
+        timeout (int): Request timeout
+        headers (dict): Extra request headers
+        max_bytes (int): Never read more than this
+
+    Returns:
+        tuple: (status code, PlayerPage), the page is None for error statuses
+    """
+    response = session.get(url, headers=headers, timeout=timeout, allow_redirects=True, stream=True)
+    try:
+        if response.status_code >= 400:
+            return response.status_code, None
+
+        page = PlayerPage()
+        try:
+            page.bytes_total = int(response.headers['Content-Length'])
+        except (KeyError, ValueError):
+            pass
+
+        parser = _PlayerParser(page)
+        decoder = _get_decoder(response)
+        decoded = 0
+        chunks = response.iter_content(chunk_size=CHUNK_SIZE)
+        for chunk in chunks:
+            decoded += len(chunk)
+            parser.feed(decoder.decode(chunk))
+            if parser.done:
+                break
+            if decoded >= max_bytes:
+                utils.log(f"Page scan stopped at {max_bytes // 1024}KB: {url}", level=utils.LOGDEBUG)
+                break
+        else:
+            parser.feed(decoder.decode(b'', final=True))
+            parser.close()
+
+        page.bytes_read = _wire_bytes(response, decoded)
+        if 0 < page.bytes_saved <= DRAIN_BYTES:
+            for chunk in chunks:
+                pass
+            page.bytes_read = page.bytes_total
+    finally:
+        response.close()
+
+    with _lock:
+        _counters['read'] += page.bytes_read
+        _counters['saved'] += page.bytes_saved
+
+    current = utils.current_span()
+    if current is not None:
+        current.set(bytes_read=page.bytes_read, bytes_saved=page.bytes_saved)
+
+    utils.log(f"Page scan read {page.bytes_read} of {page.bytes_total or '?'} bytes: {url}", level=utils.LOGDEBUG)
+    return response.status_code, page
+
+
+
+def get_counters():
+    """Get the bytes read and saved by page scans so far
+
+    Returns:
+        dict: 'read' and 'saved' byte counts
+    """
+    with _lock:
+        return dict(_counters)
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash Play Queue Module
+"Play from here" queues: builds the playlist and resolves the next item ahead
+"""
+
+
+import threading
+from urllib.parse import urlparse, parse_qsl
+import xbmc
+import xbmcgui
+from . import utils
+
+
+# Resolve the next item this long before the current one ends. Streams
+# without an expiry in their URL are only reused for 30 minutes, so one
+# resolved at the start of a long movie would be stale by its end.
+RESOLVE_LEAD = 3 * 60
+
+# Seconds between checks of the playback position
+POLL_INTERVAL = 5
+
+
+
+def queue_url(content_url):
+    """Plugin URL of a queue item, resolved by play_video() when Kodi reaches it"""
+    return utils.build_url({'mode': 'play', 'url': content_url, 'queue': '1'})
+
+
+
+def get_content_url(path):
+    """Get the content URL of a queue item
+
+    Args:
+        path (str): Playlist item path
+
+    Returns:
+        str: Content page URL, or None if the path is not a queue item
+    """
+    params = dict(parse_qsl(urlparse(path).query))
+    if params.get('mode') != 'play' or params.get('queue') != '1':
+        return None
+    return params.get('url')
+
+
+
+def build(items, start_url):
+    """Fill the video playlist with the items of a directory from one item on
+
+    Args:
+        items (list): Card records of the directory
+        start_url (str): URL of the item to start from
+
+    Returns:
+        xbmc.PlayList: Video playlist, empty if start_url is not in items
+    """
+    playlist = xbmc.PlayList(xbmc.PLAYLIST_VIDEO)
+    playlist.clear()
+
+    urls = [item['url'] for item in items]
+    if start_url not in urls:
+        return playlist
+
+    for item in items[urls.index(start_url):]:
+        list_item = xbmcgui.ListItem(label=item['title'])
+        list_item.setArt({
+            'thumb': item.get('thumbnail', ''),
+            'poster': item.get('thumbnail', ''),
+            'fanart': utils.get_fanart()
+        })
+        list_item.setInfo('video', {'title': item['title'], 'mediatype': 'video'})
+        list_item.setProperty('IsPlayable', 'true')
+        playlist.add(queue_url(item['url']), list_item)
+
+    return playlist
+
+
+class QueuePlayer(xbmc.Player):
+    """Player events of the service: resolves the next queue item ahead
+
+    When a queue item starts, a background thread waits until it is
+    RESOLVE_LEAD seconds from its end, then resolves the next item into the
+    resolved stream cache. When Kodi reaches that item, its plugin call
+    finds the stream there. An item that does not resolve is removed from
+    the playlist, and the one after it is tried instead.
+    """
+
+    def __init__(self, monitor):
+        super().__init__()
+        self.monitor = monitor
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def _next_generation(self):
+        with self._lock:
+            self._generation += 1
+            return self._generation
+
+    def _is_current(self, generation):
+        with self._lock:
+            return generation == self._generation and not self.monitor.abortRequested()
+
+    def onAVStarted(self):
+        generation = self._next_generation()
+        playlist = xbmc.PlayList(xbmc.PLAYLIST_VIDEO)
+        position = playlist.getposition()
+        if position < 0 or get_content_url(playlist[position].getPath()) is None:
+            return
+        threading.Thread(target=self._resolve_ahead, args=(generation,)).start()
+
+    def onPlayBackStopped(self):
+        self._next_generation()
+
+    def onPlayBackError(self):
+        self._next_generation()
+
+    def _wait_for_lead(self, generation):
+        """Wait until the current item is close to its end
+
+        Returns:
+            bool: False if playback moved on or stopped meanwhile
+        """
+        while self._is_current(generation):
+            try:
+                remaining = self.getTotalTime() - self.getTime()
+            except RuntimeError:
+                # Nothing is playing any more
+                return False
+            if remaining <= RESOLVE_LEAD:
+                return True
+            if self.monitor.waitForAbort(POLL_INTERVAL):
+                return False
+        return False
+
+    def _resolve_ahead(self, generation):
+        if not self._wait_for_lead(generation):
+            return
+
+        from . import scraper
+        preferred_quality = utils.get_setting('preferred_quality')
+        playlist = xbmc.PlayList(xbmc.PLAYLIST_VIDEO)
+
+        try:
+            while self._is_current(generation):
+                position = playlist.getposition() + 1
+                if position <= 0 or position >= playlist.size():
+                    return
+                path = playlist[position].getPath()
+                content_url = get_content_url(path)
+                if content_url is None:
+                    return
+
+                if scraper.extract_video_url(content_url, preferred_quality):
+                    utils.log(f"Queue: resolved next item {content_url}", level=utils.LOGDEBUG)
+                    return
+
+                utils.log(f"Queue: could not resolve {content_url}, skipping it", level=utils.LOGWARNING)
+                utils.notify(f"Skipping unavailable item: {playlist[position].getLabel()}")
+                playlist.remove(path)
+        except Exception as e:
+            utils.log(f"Queue: error resolving ahead: {e}", level=utils.LOGERROR)
+        finally:
+            utils.flush_spans('queue')
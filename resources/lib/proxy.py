@@ -0,0 +1,564 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash Proxy Module
+Local read-ahead proxy for HLS and MP4 streams, run by the service
+"""
+
+
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, urlencode, urljoin
+import requests
+from requests.adapters import HTTPAdapter
+from . import hls, utils
+
+
+# Home window property holding the port of the running proxy
+PORT_PROPERTY = 'dorabash.proxy_port'
+
+DEFAULT_PREFETCH = 3
+DEFAULT_BUFFER_MB = 64
+
+# MP4 read-ahead granularity
+CHUNK_SIZE = 1024 * 1024
+
+# Media playlists whose segment lists are kept for prefetching
+MAX_PLAYLISTS = 8
+
+UPSTREAM_TIMEOUT = 15
+
+WRITE_BLOCK = 64 * 1024
+
+_URI_ATTRIBUTE = re.compile(r'URI="([^"]+)"')
+_RANGE_HEADER = re.compile(r'bytes=(\d*)-(\d*)')
+_CONTENT_RANGE = re.compile(r'bytes \d+-\d+/(\d+)')
+
+
+class RangeNotSupported(Exception):
+    """Upstream answered a ranged request with the whole file"""
+
+
+class ByteBuffer(object):
+    """Least recently used store of downloaded data, bounded in bytes"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None:
+                self._items.move_to_end(key)
+            return item
+
+    def put(self, key, item):
+        """Store an item, a (data, content_type) tuple"""
+        size = len(item[0])
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous[0])
+            self._items[key] = item
+            self.size += size
+            while self.size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted[0])
+                self.evictions += 1
+
+
+class ReadAhead(object):
+    """Downloads HLS segments and MP4 chunks once, ahead of the player"""
+
+    def __init__(self, prefetch=DEFAULT_PREFETCH, buffer_bytes=DEFAULT_BUFFER_MB * 1024 * 1024):
+        self.prefetch = prefetch
+        self.buffer = ByteBuffer(buffer_bytes)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=prefetch + 4)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._executor = ThreadPoolExecutor(max_workers=max(1, prefetch))
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._playlists = OrderedDict()
+        self._files = {}
+        self._no_ranges = set()
+        self._meter = hls.ThroughputMeter()
+        self.stats = {'hits': 0, 'joined': 0, 'misses': 0, 'prefetched': 0, 'bytes': 0}
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    def _download(self, url, headers, byte_range=None):
+        """Download a resource, or one byte range of it
+
+        Returns:
+            tuple: (data, content_type)
+        """
+        request_headers = dict(headers)
+        if byte_range is not None:
+            request_headers['Range'] = f'bytes={byte_range[0]}-{byte_range[1]}'
+
+        # Streamed, so the body is timed apart from the wait for the headers
+        response = self.session.get(url, headers=request_headers, timeout=UPSTREAM_TIMEOUT, stream=True)
+        try:
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type', 'application/octet-stream')
+
+            if byte_range is not None:
+                if response.status_code != 206:
+                    with self._lock:
+                        self._no_ranges.add(url)
+                    raise RangeNotSupported(url)
+                match = _CONTENT_RANGE.match(response.headers.get('Content-Range', ''))
+                if match:
+                    with self._lock:
+                        self._files[url] = (int(match.group(1)), content_type)
+
+            self._meter.begin()
+            data = b''
+            try:
+                data = response.content
+            finally:
+                self._meter.end(len(data))
+        finally:
+            response.close()
+
+        with self._lock:
+            self.stats['bytes'] += len(data)
+        return data, content_type
+
+    def _fetch(self, key, url, headers, byte_range=None, prefetch=False):
+        """Get a resource from the buffer, an in-flight download, or upstream
+
+        Concurrent requests for the same key share one download. Prefetches
+        never wait on a download already in flight.
+        """
+        item = self.buffer.get(key)
+        if item is not None:
+            if not prefetch:
+                with self._lock:
+                    self.stats['hits'] += 1
+            return item
+
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+            elif not prefetch:
+                self.stats['joined'] += 1
+
+        if not owner:
+            return None if prefetch else future.result()
+
+        try:
+            item = self._download(url, headers, byte_range)
+            self.buffer.put(key, item)
+            future.set_result(item)
+            with self._lock:
+                self.stats['prefetched' if prefetch else 'misses'] += 1
+            return item
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _prefetch(self, key, url, headers, byte_range=None):
+        try:
+            self._fetch(key, url, headers, byte_range, prefetch=True)
+        except Exception as e:
+            utils.log(f"Proxy: prefetch of {url} failed: {e}", level=utils.LOGDEBUG)
+
+    def _schedule(self, key, url, headers, byte_range=None):
+        if key in self.buffer:
+            return
+        with self._lock:
+            if key in self._inflight:
+                return
+        self._executor.submit(self._prefetch, key, url, headers, byte_range)
+
+    # HLS
+
+    def get_playlist(self, url, headers):
+        """Download a playlist (never buffered, live playlists change)
+
+        Returns:
+            tuple: (text, final URL after redirects)
+        """
+        response = self.session.get(url, headers=headers, timeout=UPSTREAM_TIMEOUT)
+        try:
+            response.raise_for_status()
+            return response.text, response.url
+        finally:
+            response.close()
+
+    def set_segments(self, playlist_key, segments):
+        with self._lock:
+            self._playlists[playlist_key] = segments
+            self._playlists.move_to_end(playlist_key)
+            while len(self._playlists) > MAX_PLAYLISTS:
+                self._playlists.popitem(last=False)
+
+    def prefetch_segments(self, playlist_key, headers, start):
+        """Start downloading the next segments of a media playlist"""
+        with self._lock:
+            segments = self._playlists.get(playlist_key, [])[start:start + self.prefetch]
+        for url in segments:
+            self._schedule(('seg', url), url, headers)
+
+    def get_segment(self, url, headers):
+        return self._fetch(('seg', url), url, headers)
+
+    # MP4
+
+    def supports_ranges(self, url):
+        with self._lock:
+            return url not in self._no_ranges
+
+    def get_chunk(self, url, headers, index):
+        byte_range = (index * CHUNK_SIZE, (index + 1) * CHUNK_SIZE - 1)
+        return self._fetch(('mp4', url, index), url, headers, byte_range)
+
+    def get_file_info(self, url, headers):
+        """Get (size, content_type) of an MP4, downloading its first chunk if unknown"""
+        with self._lock:
+            info = self._files.get(url)
+        if info is None:
+            self.get_chunk(url, headers, 0)
+            with self._lock:
+                info = self._files.get(url)
+        if info is None:
+            raise RangeNotSupported(url)
+        return info
+
+    def prefetch_chunks(self, url, headers, first, last):
+        for index in range(first, min(first + self.prefetch, last + 1)):
+            byte_range = (index * CHUNK_SIZE, (index + 1) * CHUNK_SIZE - 1)
+            self._schedule(('mp4', url, index), url, headers, byte_range)
+
+
+
+def _encode(url, headers):
+    query = {'u': url}
+    if headers.get('Referer'):
+        query['r'] = headers['Referer']
+    if headers.get('User-Agent'):
+        query['a'] = headers['User-Agent']
+    return urlencode(query)
+
+
+
+def _decode_headers(query):
+    headers = {}
+    if query.get('r'):
+        headers['Referer'] = query['r'][0]
+    if query.get('a'):
+        headers['User-Agent'] = query['a'][0]
+    return headers
+
+
+
+def proxy_url(port, url, headers=None, kind=None):
+    """Build the URL that plays a stream through the local proxy
+
+    Args:
+        port (int): Proxy port
+        url (str): Stream URL
+        headers (dict): Upstream headers, Referer and User-Agent are forwarded
+        kind (str): 'hls' or 'mp4', guessed from the URL if not given
+
+    Returns:
+        str: Proxy URL
+    """
+    if kind is None:
+        kind = 'hls' if urlparse(url).path.endswith('.m3u8') else 'mp4'
+    path = '/hls/playlist.m3u8' if kind == 'hls' else '/mp4/video.mp4'
+    return f'http://127.0.0.1:{port}{path}?{_encode(url, headers or {})}'
+
+
+
+def rewrite_playlist(text, playlist_url, headers, playlist_key):
+    """Point every URI of a playlist at the proxy
+
+    Variant playlists of a master go through /hls/, media segments through
+    /seg/ with their position so the following segments can be prefetched.
+
+    Args:
+        text (str): Playlist text
+        playlist_url (str): Playlist URL, used to resolve relative URIs
+        headers (dict): Upstream headers to forward
+        playlist_key (str): Key under which the segment list is registered
+
+    Returns:
+        tuple: (rewritten text, list of absolute segment URLs)
+    """
+    is_master = '#EXT-X-STREAM-INF' in text
+    segments = []
+    lines = []
+
+    def playlist_uri(uri):
+        return '/hls/playlist.m3u8?' + _encode(urljoin(playlist_url, uri), headers)
+
+    def resource_uri(uri):
+        return '/seg/segment.ts?' + _encode(urljoin(playlist_url, uri), headers)
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            lines.append(line)
+        elif stripped.startswith('#'):
+            if 'URI="' in stripped:
+                rewrite = playlist_uri if stripped.startswith('#EXT-X-MEDIA') or \
+                    stripped.startswith('#EXT-X-I-FRAME-STREAM-INF') else resource_uri
+                line = _URI_ATTRIBUTE.sub(lambda m: f'URI="{rewrite(m.group(1))}"', stripped)
+            lines.append(line)
+        elif is_master:
+            lines.append(playlist_uri(stripped))
+        else:
+            segment_url = urljoin(playlist_url, stripped)
+            lines.append(f'/seg/segment.ts?{_encode(segment_url, headers)}'
+                         f'&p={playlist_key}&n={len(segments)}')
+            segments.append(segment_url)
+
+    return '\n'.join(lines) + '\n', segments
+
+
+
+def _parse_range(header, size):
+    """Parse a Range header against a file size
+
+    Returns:
+        tuple: (start, end) inclusive, or None if the range cannot be satisfied
+    """
+    if not header:
+        return 0, size - 1
+    match = _RANGE_HEADER.match(header.strip())
+    if not match or not (match.group(1) or match.group(2)):
+        return 0, size - 1
+    if not match.group(1):
+        # Suffix range: the last N bytes
+        return max(0, size - int(match.group(2))), size - 1
+    start = int(match.group(1))
+    end = min(int(match.group(2)), size - 1) if match.group(2) else size - 1
+    if start >= size or start > end:
+        return None
+    return start, end
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves /hls/, /seg/ and /mp4/ requests from the read-ahead buffer"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        utils.log('Proxy: ' + format % args, level=utils.LOGDEBUG)
+
+    def do_HEAD(self):
+        self._dispatch(head=True)
+
+    def do_GET(self):
+        self._dispatch(head=False)
+
+    def _dispatch(self, head):
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        url = query.get('u', [None])[0]
+        if not url:
+            self.send_error(400)
+            return
+
+        headers = _decode_headers(query)
+        read_ahead = self.server.read_ahead
+        try:
+            if parsed.path.startswith('/hls/'):
+                self._send_playlist(read_ahead, url, headers, head)
+            elif parsed.path.startswith('/seg/'):
+                self._send_segment(read_ahead, url, headers, query, head)
+            elif parsed.path.startswith('/mp4/'):
+                self._send_file(read_ahead, url, headers, head)
+            else:
+                self.send_error(404)
+        except (BrokenPipeError, ConnectionResetError):
+            # The player closed the connection (seek or stop)
+            self.close_connection = True
+        except requests.exceptions.HTTPError as e:
+            status = e.response.status_code if e.response is not None else 502
+            utils.log(f"Proxy: upstream {status} for {url}", level=utils.LOGWARNING)
+            self._send_error_safe(status)
+        except Exception as e:
+            utils.log(f"Proxy: error serving {url}: {e}", level=utils.LOGERROR)
+            self._send_error_safe(502)
+
+    def _send_error_safe(self, status):
+        try:
+            self.send_error(status)
+        except OSError:
+            pass
+        self.close_connection = True
+
+    def _send_body(self, status, data, content_type, head, extra_headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (extra_headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if not head:
+            self.wfile.write(data)
+
+    def _send_playlist(self, read_ahead, url, headers, head):
+        text, final_url = read_ahead.get_playlist(url, headers)
+        playlist_key = hashlib.sha1(final_url.encode('utf-8')).hexdigest()[:12]
+        body, segments = rewrite_playlist(text, final_url, headers, playlist_key)
+        if segments:
+            read_ahead.set_segments(playlist_key, segments)
+            read_ahead.prefetch_segments(playlist_key, headers, 0)
+        self._send_body(200, body.encode('utf-8'), 'application/vnd.apple.mpegurl', head)
+
+    def _send_segment(self, read_ahead, url, headers, query, head):
+        playlist_key = query.get('p', [None])[0]
+        if playlist_key and query.get('n', [''])[0].isdigit():
+            read_ahead.prefetch_segments(playlist_key, headers, int(query['n'][0]) + 1)
+        data, content_type = read_ahead.get_segment(url, headers)
+        self._send_body(200, data, content_type, head)
+
+    def _send_file(self, read_ahead, url, headers, head):
+        if not read_ahead.supports_ranges(url):
+            self._relay(read_ahead, url, headers, head)
+            return
+        try:
+            size, content_type = read_ahead.get_file_info(url, headers)
+        except RangeNotSupported:
+            self._relay(read_ahead, url, headers, head)
+            return
+
+        byte_range = _parse_range(self.headers.get('Range'), size)
+        if byte_range is None:
+            self._send_body(416, b'', content_type, head, {'Content-Range': f'bytes */{size}'})
+            return
+
+        start, end = byte_range
+        ranged = bool(self.headers.get('Range'))
+        self.send_response(206 if ranged else 200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(end - start + 1))
+        self.send_header('Accept-Ranges', 'bytes')
+        if ranged:
+            self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+        self.end_headers()
+        if head:
+            return
+
+        last_chunk = (size - 1) // CHUNK_SIZE
+        for index in range(start // CHUNK_SIZE, end // CHUNK_SIZE + 1):
+            read_ahead.prefetch_chunks(url, headers, index + 1, last_chunk)
+            data, _ = read_ahead.get_chunk(url, headers, index)
+            offset = index * CHUNK_SIZE
+            low = max(start, offset) - offset
+            high = min(end, offset + len(data) - 1) - offset + 1
+            self.wfile.write(data[low:high])
+
+    def _relay(self, read_ahead, url, headers, head):
+        """Pass a stream through unbuffered, for servers without range support"""
+        upstream_headers = dict(headers)
+        if self.headers.get('Range'):
+            upstream_headers['Range'] = self.headers['Range']
+
+        response = read_ahead.session.get(url, headers=upstream_headers, stream=True, timeout=UPSTREAM_TIMEOUT)
+        try:
+            response.raise_for_status()
+            self.send_response(response.status_code)
+            for name in ('Content-Type', 'Content-Length', 'Content-Range', 'Accept-Ranges'):
+                if response.headers.get(name):
+                    self.send_header(name, response.headers[name])
+            if not response.headers.get('Content-Length'):
+                self.send_header('Connection', 'close')
+                self.close_connection = True
+            self.end_headers()
+            if not head:
+                for block in response.iter_content(WRITE_BLOCK):
+                    self.wfile.write(block)
+        finally:
+            response.close()
+
+
+class ProxyServer(object):
+    """Threaded HTTP server on localhost in front of a ReadAhead"""
+
+    def __init__(self, port=0, prefetch=DEFAULT_PREFETCH, buffer_bytes=DEFAULT_BUFFER_MB * 1024 * 1024):
+        self.read_ahead = ReadAhead(prefetch, buffer_bytes)
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), _Handler)
+        self._server.daemon_threads = True
+        self._server.read_ahead = self.read_ahead
+        self._thread = None
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def start(self):
+        """Serve in a background thread
+
+        Returns:
+            int: Port the proxy listens on
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, name='dorabash-proxy', daemon=True)
+        self._thread.start()
+        utils.log(f"Proxy listening on 127.0.0.1:{self.port}")
+        return self.port
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self.read_ahead.close()
+        stats = self.read_ahead.stats
+        utils.log(
+            f"Proxy stopped: hits={stats['hits']} joined={stats['joined']} misses={stats['misses']} "
+            f"prefetched={stats['prefetched']} downloaded={stats['bytes'] // 1024}KB "
+            f"evictions={self.read_ahead.buffer.evictions}"
+        )
+
+
+
+def is_enabled():
+    """Check whether playback through the local proxy is enabled in settings"""
+    return utils.get_setting('proxy_enabled') == 'true'
+
+
+
+def get_prefetch():
+    """Get the number of segments / chunks to read ahead from settings"""
+    try:
+        return int(utils.get_setting('proxy_prefetch'))
+    except ValueError:
+        return DEFAULT_PREFETCH
+
+
+
+def get_buffer_bytes():
+    """Get the read-ahead buffer size in bytes from settings"""
+    try:
+        megabytes = int(utils.get_setting('proxy_buffer_mb'))
+    except ValueError:
+        megabytes = DEFAULT_BUFFER_MB
+    return megabytes * 1024 * 1024
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash Resolve Ahead Module
+Speculatively resolves the top and focused items of the shown directory
+"""
+
+
+import json
+import time
+import threading
+from urllib.parse import urlparse, parse_qsl
+import xbmc
+import xbmcgui
+from . import utils
+
+
+# Home window property the plugin publishes a rendered directory in
+PROPERTY = 'dorabash.resolve_ahead'
+HOME_WINDOW = 10000
+
+DEFAULT_COUNT = 3
+
+# Seconds between checks of the shown directory and the focused item
+POLL_INTERVAL = 0.5
+
+# The focus has to rest on an item this long before it is resolved
+FOCUS_DELAY = 1.0
+
+# Time Kodi gets to show a published directory before it counts as left
+SHOW_GRACE = 5
+
+
+
+def is_enabled():
+    """Check whether speculative resolving is enabled in settings"""
+    return utils.get_setting('resolve_ahead') == 'true'
+
+
+
+def get_count():
+    """Get the number of top items to resolve from settings"""
+    try:
+        return max(0, int(utils.get_setting('resolve_ahead_count')))
+    except ValueError:
+        return DEFAULT_COUNT
+
+
+
+def publish(folder_url, items):
+    """Hand a rendered directory to the service for resolving ahead
+
+    Args:
+        folder_url (str): Plugin URL of the directory
+        items (list): Card records in display order
+    """
+    request = {
+        'folder': folder_url,
+        'urls': [item['url'] for item in items[:get_count()]],
+        'published': time.time()
+    }
+    xbmcgui.Window(HOME_WINDOW).setProperty(PROPERTY, json.dumps(request))
+
+
+
+def _params(url):
+    parsed = urlparse(url)
+    return parsed.netloc, dict(parse_qsl(parsed.query))
+
+
+
+def _content_url(item_path):
+    """Content URL of a directory item, or None if it is not a playable one of ours"""
+    netloc, params = _params(item_path)
+    if netloc != utils.get_addon().getAddonInfo('id') or params.get('mode') != 'play':
+        return None
+    return params.get('url')
+
+
+class ResolveAhead(object):
+    """Service worker resolving the shown directory's items one at a time
+
+    The focused item goes first once the focus has rested on it, then the
+    top items the plugin published. A single thread does the polling and the
+    resolving, so at most one resolve runs at a time and pending work is
+    dropped as soon as the user leaves the directory. Nothing runs while a
+    video plays, or on a metered connection unless prefetching is allowed
+    there.
+    """
+
+    def __init__(self, monitor):
+        self.monitor = monitor
+        self._stopped = threading.Event()
+        self._thread = None
+        self._request = None
+        self._seen = None
+        self._pending = []
+        self._done = set()
+        self._focused = None
+        self._focused_since = 0.0
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stopped.is_set() and not self.monitor.abortRequested():
+            try:
+                self._poll()
+            except Exception as e:
+                utils.log(f"Resolve ahead: {e}", level=utils.LOGERROR)
+            if self.monitor.waitForAbort(POLL_INTERVAL):
+                break
+
+    def _take_request(self):
+        """Pick up a newly published directory"""
+        value = xbmcgui.Window(HOME_WINDOW).getProperty(PROPERTY)
+        if not value or value == self._seen:
+            return
+        self._seen = value
+        try:
+            self._request = json.loads(value)
+        except ValueError:
+            self._request = None
+            return
+        self._pending = list(self._request.get('urls', []))
+        self._done = set()
+        self._focused = None
+
+    def _is_shown(self):
+        """Check that the published directory is still the one shown
+
+        Returns:
+            bool: False if the user navigated away (the request is dropped then)
+        """
+        if _params(xbmc.getInfoLabel('Container.FolderPath')) == _params(self._request['folder']):
+            return True
+        if time.time() - self._request['published'] < SHOW_GRACE:
+            # Not shown yet, Kodi is still loading it
+            return False
+        if self._pending:
+            utils.log(f"Resolve ahead: directory left, dropping {len(self._pending)} item(s)",
+                      level=utils.LOGDEBUG)
+        self._request = None
+        self._pending = []
+        return False
+
+    def _next_url(self):
+        """Pick the focused item once it has rested, else the next top item"""
+        focused = _content_url(xbmc.getInfoLabel('ListItem.FileNameAndPath'))
+        now = time.time()
+        if focused != self._focused:
+            self._focused = focused
+            self._focused_since = now
+
+        if focused and focused not in self._done and now - self._focused_since >= FOCUS_DELAY:
+            return focused
+        while self._pending:
+            url = self._pending.pop(0)
+            if url not in self._done:
+                return url
+        return None
+
+    def _poll(self):
+        self._take_request()
+        if self._request is None or not self._is_shown():
+            return
+        if xbmc.Player().isPlaying():
+            return
+        if utils.is_metered() and utils.get_setting('prefetch_on_metered') != 'true':
+            return
+
+        url = self._next_url()
+        if url is None:
+            return
+        self._done.add(url)
+        self._resolve(url)
+
+    def _resolve(self, url):
+        from . import resolve_cache
+        preferred_quality = utils.get_setting('preferred_quality')
+        if resolve_cache.get(url, preferred_quality):
+            return
+
+        from . import scraper
+        started = time.time()
+        try:
+            result = scraper.extract_video_url(url, preferred_quality)
+        finally:
+            utils.flush_spans('resolve_ahead')
+        utils.log(f"Resolve ahead: {url} {'resolved' if result else 'failed'} in {time.time() - started:.1f}s",
+                  level=utils.LOGDEBUG)
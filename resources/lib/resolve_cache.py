@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash Resolved Stream Cache Module
+Persists the result of extract_video_url() keyed by content URL
+"""
+
+
+import time
+import threading
+from urllib.parse import urlparse, parse_qs
+from . import utils
+
+
+CACHE_FILE = 'resolved.json'
+
+# Used when the stream URL carries no recognisable expiry parameter
+DEFAULT_LIFETIME = 30 * 60
+
+# Never trust an entry for longer than this, whatever the URL claims
+MAX_LIFETIME = 6 * 60 * 60
+
+# Stop reusing a URL this long before its token actually expires
+SAFETY_MARGIN = 2 * 60
+
+MAX_ENTRIES = 200
+
+# Query parameters holding an absolute expiry timestamp
+EXPIRY_PARAMS = ('expire', 'expires', 'expiry', 'exp')
+
+
+_lock = threading.Lock()
+_entries = None
+_entries_mtime = 0
+
+
+
+def _key(content_url, preferred_quality):
+    # With adaptive HLS the result is the master playlist, not a single variant
+    adaptive = 'adaptive|' if utils.get_setting('hls_adaptive') == 'true' else ''
+    return f'{preferred_quality}|{adaptive}{content_url}'
+
+
+
+def _load():
+    global _entries, _entries_mtime
+    path = utils.get_profile_path(CACHE_FILE)
+    mtime = utils.get_mtime(path)
+    if _entries is None or mtime != _entries_mtime:
+        _entries_mtime = mtime
+        _entries = utils.read_json(path, None)
+        if not isinstance(_entries, dict):
+            _entries = {}
+    return _entries
+
+
+
+def _save():
+    now = time.time()
+    for key in [k for k, v in _entries.items() if v.get('expires', 0) <= now]:
+        del _entries[key]
+
+    if len(_entries) > MAX_ENTRIES:
+        oldest = sorted(_entries, key=lambda k: _entries[k].get('stored', 0))
+        for key in oldest[:len(_entries) - MAX_ENTRIES]:
+            del _entries[key]
+
+    global _entries_mtime
+    path = utils.get_profile_path(CACHE_FILE)
+    try:
+        utils.write_json(path, _entries)
+        _entries_mtime = utils.get_mtime(path)
+    except OSError as e:
+        utils.log(f"Error saving resolved stream cache: {e}", level=utils.LOGERROR)
+
+
+
+def compute_expiry(stream_url, now=None):
+    """Work out when a resolved stream URL stops being usable
+
+    Looks for absolute expiry timestamps (``expire=``, ``expires=``, ...) and
+    the start/lifetime pair used by Filemoon tokens (``s=<epoch>&e=<seconds>``).
+    Falls back to a conservative default lifetime.
+
+    Args:
+        stream_url (str): Resolved stream URL
+        now (float): Current time (defaults to time.time())
+
+    Returns:
+        float: Expiry as a UNIX timestamp
+    """
+    if now is None:
+        now = time.time()
+
+    expires = None
+    try:
+        params = parse_qs(urlparse(stream_url).query)
+    except ValueError:
+        params = {}
+
+    for name in EXPIRY_PARAMS:
+        value = params.get(name, [''])[0]
+        if value.isdigit() and int(value) > 1000000000:
+            expires = int(value)
+            break
+
+    if expires is None:
+        start = params.get('s', [''])[0]
+        lifetime = params.get('e', [''])[0]
+        if start.isdigit() and lifetime.isdigit() and int(start) > 1000000000:
+            expires = int(start) + int(lifetime)
+
+    if expires is None:
+        return now + DEFAULT_LIFETIME
+
+    return min(expires - SAFETY_MARGIN, now + MAX_LIFETIME)
+
+
+
+def get(content_url, preferred_quality):
+    """Get a cached resolution if it has not expired
+
+    Args:
+        content_url (str): Content page URL
+        preferred_quality (str): Preferred quality used for the resolution
+
+    Returns:
+        dict: Cached extract_video_url() result or None
+    """
+    with _lock:
+        entry = _load().get(_key(content_url, preferred_quality))
+        if not entry or entry.get('expires', 0) <= time.time():
+            return None
+        return dict(entry['result'])
+
+
+
+def put(content_url, preferred_quality, result):
+    """Store a resolution result
+
+    Args:
+        content_url (str): Content page URL
+        preferred_quality (str): Preferred quality used for the resolution
+        result (dict): extract_video_url() result
+    """
+    now = time.time()
+    with _lock:
+        _load()[_key(content_url, preferred_quality)] = {
+            'result': result,
+            'stored': now,
+            'expires': compute_expiry(result['url'], now)
+        }
+        _save()
+
+
+
+def invalidate(content_url, preferred_quality):
+    """Drop a cached resolution (e.g. after a failed validity check)
+
+    Args:
+        content_url (str): Content page URL
+        preferred_quality (str): Preferred quality used for the resolution
+    """
+    with _lock:
+        if _load().pop(_key(content_url, preferred_quality), None) is not None:
+            _save()
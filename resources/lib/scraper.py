@@ -6,9 +6,27 @@ Handles all web scraping operations
 
 
 import re
+import time
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin
 import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from . import utils
+from . import artwork
+from . import cache
+from . import cards
+from . import catalog
+from . import extractors
+from . import health
+from . import listings
+from . import m3u8scan
+from . import pagescan
+from . import resolve_cache
+from . import hls
 
 
 BASE_URL = 'https://dorabash.com'
@@ -23,21 +41,78 @@ HEADERS = {
 }
 
 
+# Listing pages fetched at once when prefetching
+PREFETCH_WORKERS = 2
+
+# Listing pages fetched at once for one directory page
+PAGE_WORKERS = 5
+
+
+# Filemoon candidate probing
+PROBE_WORKERS = 4
+PROBE_TIMEOUT = 5
+MAX_PLAYLIST_BYTES = 1024 * 1024
+
+SCRIPT_SRC_PATTERN = re.compile(r'<script[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE)
+
+
+# Player links tried from an info page when the rewritten player URL fails
+MAX_INFO_PAGE_LINKS = 3
+
+
+# Pooled connections idle for longer are dropped before the next request.
+# Servers close keep-alive connections after a while (nginx: 75s), and with
+# reuselanguageinvoker the session outlives a single plugin call.
+SESSION_IDLE_TIMEOUT = 50
+
 # Create a session for connection pooling and better performance
 _session = None
 
+# Session without retries for probes, a dead candidate should fail once
+_probe_session = None
+
+_request_count = 0
+_request_count_lock = threading.Lock()
+
+
+
+def _track_activity(session):
+    """Record the time of the last response on the session itself
+
+    Each session has its own pool, so each is expired against its own idle time.
+    """
+    session.last_activity = 0.0
+
+    def hook(response, *args, **kwargs):
+        session.last_activity = time.monotonic()
+
+    session.hooks['response'].append(hook)
+
+
+
+def _expire_idle_connections(session):
+    """Close the pooled connections of a session that has been idle too long"""
+    if session.last_activity and time.monotonic() - session.last_activity > SESSION_IDLE_TIMEOUT:
+        utils.log("Session idle, dropping pooled connections", level=utils.LOGDEBUG)
+        for adapter in session.adapters.values():
+            adapter.close()
+        session.last_activity = 0.0
+
 
 
 def get_session():
-    """Get or create requests session for connection pooling"""
+    """Get or create requests session for connection pooling
+    
+    The session and its keep-alive connections are kept for the life of the
+    interpreter, which spans many plugin calls under reuselanguageinvoker.
+    """
     global _session
-    if _session is None:
-        _session = requests.Session()
+    if _session is not None:
+        _expire_idle_connections(_session)
+    else:
+        _session = health.GuardedSession()
         _session.headers.update(HEADERS)
         # Set max retries and timeouts
-        from requests.adapters import HTTPAdapter
-        from requests.packages.urllib3.util.retry import Retry
-        
         retry_strategy = Retry(
             total=2,
             backoff_factor=0.5,
@@ -46,78 +121,113 @@ def get_session():
         adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=5)
         _session.mount("http://", adapter)
         _session.mount("https://", adapter)
+        _session.hooks['response'].append(_count_request)
+        _track_activity(_session)
     return _session
 
 
 
+def get_probe_session():
+    """Get or create the session used for playlist probes and stream checks
+    
+    It has no retries: a candidate that fails is simply not used, and retrying
+    it only multiplies the time spent on a dead host.
+    """
+    global _probe_session
+    if _probe_session is not None:
+        _expire_idle_connections(_probe_session)
+    else:
+        _probe_session = health.GuardedSession()
+        _probe_session.headers.update(HEADERS)
+        adapter = HTTPAdapter(max_retries=0, pool_maxsize=PROBE_WORKERS * 2)
+        _probe_session.mount("http://", adapter)
+        _probe_session.mount("https://", adapter)
+        _probe_session.hooks['response'].append(_count_request)
+        _track_activity(_probe_session)
+    return _probe_session
+
+
+
+def _count_request(response, *args, **kwargs):
+    """Response hook counting every request made through the session"""
+    global _request_count
+    with _request_count_lock:
+        _request_count += 1
+    
+    current = utils.current_span()
+    if current is not None:
+        current.add_response(response.status_code)
+        _count_body(response, current)
+
+
+
+def _count_body(response, span):
+    """Add a response's body bytes to a span as they are read
+    
+    Content-Length is missing from chunked responses and is the compressed
+    size of gzip ones, and streamed pages are not read to the end, so the
+    bytes are counted as the body is consumed (.content goes through
+    iter_content too).
+    """
+    iter_content = response.iter_content
+    
+    def counted(*args, **kwargs):
+        for chunk in iter_content(*args, **kwargs):
+            span.add_bytes(len(chunk))
+            yield chunk
+    
+    response.iter_content = counted
+
+
+
+def get_request_count():
+    """Get the number of requests made through the session so far"""
+    with _request_count_lock:
+        return _request_count
+
+
+
 def get_timeout():
     """Get timeout from settings"""
     try:
-        import xbmcaddon
-        addon = xbmcaddon.Addon()
-        return int(addon.getSetting('timeout'))
+        return int(utils.get_setting('timeout'))
     except:
         return 15
 
 
 
-def get_movies(page=1, category='hindi-dubbed-movies'):
+@utils.timed('get_movies')
+def get_movies(page=1, category='hindi-dubbed-movies', refresh=False, ttl=None):
     """Scrape movies from DoraBash by category
     
+    Parsed pages are kept in the listing store, so pages that were prefetched
+    or recently viewed are served without fetching or parsing.
+    
     Args:
         page (int): Page number to fetch
         category (str): Movie category ('hindi-dubbed-movies' or 'english-subbed-movies')
+        refresh (bool): Ignore the listing store and revalidate the page with the site
+        ttl (int): Lifetime of the stored page in seconds (default: listing cache TTL)
         
     Returns:
         list: List of movie dictionaries with title, url, thumbnail, etc.
     """
-    utils.log(f"Scraping {category} - Page {page}")
+    timer = utils.current_span()
     
-    url = f'{BASE_URL}/tag/{category}/page/{page}/' if page > 1 else f'{BASE_URL}/tag/{category}/'
+    if not refresh:
+        movies = listings.get(category, page)
+        if movies is not None:
+            timer.set(cache='hit')
+            utils.log(f"Using stored {category} - Page {page} ({len(movies)} movies)")
+            return movies
+    
+    timer.set(cache='miss')
     
     try:
-        session = get_session()
-        response = session.get(url, timeout=get_timeout())
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        cards = soup.find_all('article', class_='bs')
-        movies = []
-        
-        for card in cards:
-            try:
-                link_tag = card.find('a', class_='tip')
-                if not link_tag:
-                    continue
-                    
-                movie_url = link_tag.get('href', '')
-                if not movie_url:
-                    continue
-                
-                title_tag = card.find('h2', itemprop='headline')
-                title = title_tag.get_text(strip=True) if title_tag else 'Unknown'
-                
-                img_tag = card.find('img', class_='ts-post-image')
-                thumbnail = img_tag.get('src', '') if img_tag else ''
-                
-                status_tag = card.find('span', class_='epx')
-                status = status_tag.get_text(strip=True) if status_tag else 'N/A'
-                
-                type_tag = card.find('div', class_='typez')
-                content_type = type_tag.get_text(strip=True) if type_tag else 'Movie'
-                
-                movies.append({
-                    'title': title,
-                    'url': movie_url,
-                    'thumbnail': thumbnail,
-                    'status': status,
-                    'type': content_type
-                })
-            except Exception as e:
-                utils.log(f"Error parsing movie card: {e}", level=utils.LOGERROR)
-                continue
-        
-        utils.log(f"Found {len(movies)} movies")
+        movies = fetch_movies(page, category, revalidate=refresh)
+        if movies:
+            listings.put(category, page, movies, ttl)
+            catalog.add_cards(movies, category)
         return movies
         
     except Exception as e:
@@ -126,6 +236,125 @@ def get_movies(page=1, category='hindi-dubbed-movies'):
 
 
 
+def fetch_movies(page=1, category='hindi-dubbed-movies', revalidate=False):
+    """Fetch and parse one listing page, without touching the listing store or catalog
+    
+    Args:
+        page (int): Page number to fetch
+        category (str): Movie category
+        revalidate (bool): Revalidate a cached page with the site even if it is fresh
+        
+    Returns:
+        list: List of movie dictionaries
+        
+    Raises:
+        requests.exceptions.HTTPError: On HTTP errors (404 past the last page)
+    """
+    utils.log(f"Scraping {category} - Page {page}")
+    
+    url = f'{BASE_URL}/tag/{category}/page/{page}/' if page > 1 else f'{BASE_URL}/tag/{category}/'
+    
+    session = get_session()
+    with utils.span('get_movies.fetch'):
+        content = cache.fetch(session, url, 'listing', get_timeout(), revalidate=revalidate)
+    cache.log_stats()
+    with utils.span('get_movies.parse'):
+        movies = cards.parse_cards(content, default_type='Movie')
+    
+    utils.log(f"Found {len(movies)} movies")
+    return movies
+
+
+
+def get_movies_pages(pages, category='hindi-dubbed-movies'):
+    """Fetch several listing pages concurrently and merge them in page order
+    
+    Duplicate titles (a card moving between pages while they are fetched) are
+    dropped. A failure on the first page is raised; a later page that fails or
+    is empty ends the listing there.
+    
+    Args:
+        pages (list): Consecutive page numbers
+        category (str): Movie category
+        
+    Returns:
+        tuple: (movies, has_more) where has_more is False once the end of the
+        listing was reached
+    """
+    pages = list(pages)
+    
+    with ThreadPoolExecutor(max_workers=min(PAGE_WORKERS, len(pages))) as executor:
+        futures = [executor.submit(utils.bind_spans(get_movies), page, category) for page in pages]
+    
+    movies = []
+    seen = set()
+    for index, future in enumerate(futures):
+        try:
+            page_movies = future.result()
+        except Exception:
+            if index == 0:
+                raise
+            return movies, False
+        
+        if not page_movies:
+            return movies, False
+        
+        for movie in page_movies:
+            if movie['url'] not in seen:
+                seen.add(movie['url'])
+                movies.append(movie)
+    
+    return movies, True
+
+
+
+def prefetch_movies(pages, category='hindi-dubbed-movies'):
+    """Fetch and parse listing pages into the listing store ahead of time
+    
+    Pages that are already stored and fresh are skipped. Errors are logged and
+    otherwise ignored, prefetching is only ever speculative.
+    
+    Args:
+        pages (list): Page numbers to prefetch
+        category (str): Movie category
+    """
+    pages = [page for page in pages if listings.get(category, page) is None]
+    if not pages:
+        return
+    
+    utils.log(f"Prefetching {category} pages {pages}", level=utils.LOGDEBUG)
+    
+    def prefetch(page):
+        try:
+            prefetch_artwork([movie.get('thumbnail', '') for movie in get_movies(page, category)])
+        except Exception as e:
+            utils.log(f"Prefetch of page {page} failed: {e}", level=utils.LOGDEBUG)
+    
+    with ThreadPoolExecutor(max_workers=min(PREFETCH_WORKERS, len(pages))) as executor:
+        list(executor.map(utils.bind_spans(prefetch), pages))
+
+
+
+@utils.timed('artwork')
+def prefetch_artwork(urls):
+    """Download listing thumbnails into the artwork cache
+    
+    Args:
+        urls (list): Thumbnail URLs, cached ones are skipped
+        
+    Returns:
+        int: Number of thumbnails downloaded
+    """
+    downloaded = artwork.download(urls, get_session(), get_timeout())
+    current = utils.current_span()
+    if current is not None:
+        current.set(cache='miss' if downloaded else 'hit', downloaded=downloaded)
+    artwork.log_stats()
+    return downloaded
+
+
+
+@utils.timed('search')
 def search(query):
     """Search for content on DoraBash
     
@@ -141,47 +370,14 @@ def search(query):
     
     try:
         session = get_session()
-        response = session.get(search_url, timeout=get_timeout())
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        cards = soup.find_all('article', class_='bs')
-        results = []
-        
-        for card in cards:
-            try:
-                link_tag = card.find('a', class_='tip')
-                if not link_tag:
-                    continue
-                    
-                result_url = link_tag.get('href', '')
-                if not result_url:
-                    continue
-                
-                title_tag = card.find('h2', itemprop='headline')
-                title = title_tag.get_text(strip=True) if title_tag else 'Unknown'
-                
-                img_tag = card.find('img', class_='ts-post-image')
-                thumbnail = img_tag.get('src', '') if img_tag else ''
-                
-                status_tag = card.find('span', class_='epx')
-                status = status_tag.get_text(strip=True) if status_tag else 'N/A'
-                
-                type_tag = card.find('div', class_='typez')
-                content_type = type_tag.get_text(strip=True) if type_tag else 'N/A'
-                
-                results.append({
-                    'title': title,
-                    'url': result_url,
-                    'thumbnail': thumbnail,
-                    'status': status,
-                    'type': content_type
-                })
-            except Exception as e:
-                utils.log(f"Error parsing search result: {e}", level=utils.LOGERROR)
-                continue
+        with utils.span('search.fetch'):
+            content = cache.fetch(session, search_url, 'search', get_timeout())
+        cache.log_stats()
+        with utils.span('search.parse'):
+            results = cards.parse_cards(content, default_type='N/A')
         
         utils.log(f"Found {len(results)} search results")
+        catalog.add_cards(results)
         return results
         
     except Exception as e:
@@ -190,92 +386,157 @@ def search(query):
 
 
 
-def extract_video_url(content_url, preferred_quality='720'):
-    """Extract video streaming URL from content page"""
+@utils.timed('resolve')
+def extract_video_url(content_url, preferred_quality='720', use_cache=True):
+    """Extract video streaming URL from content page
+    
+    Recently resolved streams are reused from the resolved stream cache after a
+    cheap validity check. A cached HLS variant that no longer answers falls
+    back to its master playlist; anything else expired or dead is re-resolved.
+    
+    Args:
+        content_url (str): Content (info or player) page URL
+        preferred_quality (str): Preferred video quality
+        use_cache (bool): Whether to consult the resolved stream cache
+        
+    Returns:
+        dict: Video URL info or None
+    """
+    timer = utils.current_span()
+    
+    if use_cache:
+        cached = resolve_cache.get(content_url, preferred_quality)
+        if cached:
+            if _is_stream_alive(cached['url']):
+                utils.log(f"Using cached stream for: {content_url}")
+                timer.set(cache='hit')
+                return cached
+            master = cached.get('master')
+            if master and master != cached['url'] and _is_stream_alive(master):
+                utils.log("Cached HLS variant no longer valid - falling back to the master playlist")
+                timer.set(cache='hit')
+                cached.update(url=master, quality='auto')
+                resolve_cache.put(content_url, preferred_quality, cached)
+                return cached
+            utils.log("Cached stream no longer valid - re-resolving")
+            resolve_cache.invalidate(content_url, preferred_quality)
+    
+    timer.set(cache='miss')
+    requests_before = get_request_count()
+    scanned_before = pagescan.get_counters()
+    result = _resolve_video_url(content_url, preferred_quality)
+    scanned = pagescan.get_counters()
+    bytes_saved = scanned['saved'] - scanned_before['saved']
+    timer.set(bytes_saved=bytes_saved)
+    utils.log(f"Resolve took {get_request_count() - requests_before} request(s), read "
+              f"{(scanned['read'] - scanned_before['read']) // 1024}KB of pages, skipped {bytes_saved // 1024}KB",
+              level=utils.LOGDEBUG)
+    
+    if result and use_cache:
+        resolve_cache.put(content_url, preferred_quality, result)
+    
+    return result
+
+
+
+@utils.timed('resolve.stream_check')
+def _is_stream_alive(stream_url):
+    """Check that a stream URL still answers, using a ranged HEAD request
+    
+    Args:
+        stream_url (str): Resolved stream URL
+        
+    Returns:
+        bool: True if the URL looks playable
+    """
+    response = None
+    try:
+        check_headers = HEADERS.copy()
+        check_headers['Range'] = 'bytes=0-0'
+        session = get_probe_session()
+        response = session.head(stream_url, headers=check_headers, timeout=5, allow_redirects=True)
+        if response.status_code == 405:
+            response.close()
+            response = session.get(stream_url, headers=check_headers, timeout=5, stream=True)
+        return response.status_code in (200, 206)
+    except requests.exceptions.RequestException as e:
+        utils.log(f"Stream check failed: {e}")
+        return False
+    finally:
+        if response is not None:
+            response.close()
+
+
+
+def _resolve_video_url(content_url, preferred_quality):
+    """Resolve the video streaming URL by scraping the content page"""
     utils.log(f"=== EXTRACTING VIDEO ===", level=utils.LOGERROR)
     utils.log(f"Content URL: {content_url}", level=utils.LOGERROR)
     utils.log(f"Preferred quality: {preferred_quality}p", level=utils.LOGERROR)
     
     session = None
-    response = None
     
     try:
         session = get_session()
         timeout = get_timeout()
         
-        # ===== STEP 1: Fetch the main content page =====
-        utils.log("Fetching content page...", level=utils.LOGERROR)
-        response = session.get(content_url, timeout=timeout, allow_redirects=True)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        response.close()
-        response = None
-        
-        player_url = content_url
-        
-        # ===== STEP 2: Check if this is an info page (has /anime/) =====
+        # ===== STEP 1: Work out the player page =====
         if '/anime/' in content_url:
+            # Info page: go straight to the player page, the info page itself
+            # is only needed when the rewritten player URL does not work
             utils.log("INFO PAGE detected - constructing player URL", level=utils.LOGERROR)
             player_url = content_url.replace('/anime/', '/')
             utils.log(f"Player URL: {player_url}", level=utils.LOGERROR)
             
-            # Fetch player page
-            response = session.get(player_url, timeout=timeout, allow_redirects=True)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            response.close()
-            response = None
+            page = _fetch_player_page(session, player_url, timeout)
+            
+            if page is None:
+                utils.log("Player URL failed - falling back to info page", level=utils.LOGERROR)
+                player_url, page = _find_player_from_info_page(session, content_url, timeout)
+                if page is None:
+                    utils.log("ERROR: No player page found!", level=utils.LOGERROR)
+                    return None
         else:
             utils.log("PLAYER PAGE detected (no /anime/ in URL)", level=utils.LOGERROR)
+            player_url = content_url
+            
+            # ===== STEP 2: Fetch the player page =====
+            utils.log("Fetching content page...", level=utils.LOGERROR)
+            with utils.span('resolve.player_page'):
+                status, page = pagescan.fetch(session, content_url, timeout)
+            if page is None:
+                utils.log(f"ERROR: Content page returned {status}", level=utils.LOGERROR)
+                return None
         
         # ===== STEP 3: Check for direct video tag =====
         utils.log("Looking for direct video tag...", level=utils.LOGERROR)
-        video_tag = soup.find('video')
         
-        if video_tag:
+        if page.has_video:
             utils.log("Found direct video tag!", level=utils.LOGERROR)
-            sources = video_tag.find_all('source')
+            video_urls = page.get_video_urls()
             
-            if sources:
-                video_urls = {}
-                for source in sources:
-                    src = source.get('src')
-                    quality = source.get('size', 'unknown')
-                    if src and quality != 'unknown':
-                        if src.startswith('//'):
-                            src = 'https:' + src
-                        video_urls[quality] = src
-                
-                if video_urls:
-                    utils.log(f"Found direct video qualities: {list(video_urls.keys())}", level=utils.LOGERROR)
-                    return _select_quality(video_urls, preferred_quality)
+            if video_urls:
+                utils.log(f"Found direct video qualities: {list(video_urls.keys())}", level=utils.LOGERROR)
+                return _select_quality(video_urls, preferred_quality)
         
         # ===== STEP 4: Look for iframe =====
         utils.log("No direct video - looking for iframe...", level=utils.LOGERROR)
-        iframe = soup.find('iframe')
         
-        if not iframe:
+        if page.iframe_src is None:
             utils.log("ERROR: No iframe found!", level=utils.LOGERROR)
             return None
         
-        iframe_src = iframe.get('src', '')
+        iframe_src = page.iframe_src
         if not iframe_src:
             utils.log("ERROR: Empty iframe src!", level=utils.LOGERROR)
             return None
         
         utils.log(f"Found iframe: {iframe_src}", level=utils.LOGERROR)
         
-        # ===== STEP 5: Route to appropriate extractor =====
-        if 'blogspot' in iframe_src.lower():
-            utils.log(">>> ROUTING TO BLOGSPOT EXTRACTOR", level=utils.LOGERROR)
-            return _extract_from_blogspot(iframe_src, player_url, session, timeout, preferred_quality)
-        elif 'filemoon' in iframe_src.lower():
-            utils.log(">>> ROUTING TO FILEMOON EXTRACTOR", level=utils.LOGERROR)
-            return _extract_from_filemoon(iframe_src, player_url, session, timeout, preferred_quality)
-        else:
-            utils.log(f"ERROR: Unsupported iframe provider: {iframe_src}", level=utils.LOGERROR)
-            return None
+        # ===== STEP 5: Route to the registered extractor for the host =====
+        return extractors.extract(
+            extractors.ExtractionContext(iframe_src, player_url, session, timeout, preferred_quality)
+        )
         
     except requests.exceptions.Timeout:
         utils.log("ERROR: Request timeout!", level=utils.LOGERROR)
@@ -285,244 +546,435 @@ def extract_video_url(content_url, preferred_quality='720'):
         return None
     except Exception as e:
         utils.log(f"ERROR: Exception: {e}", level=utils.LOGERROR)
-        import traceback
         utils.log(f"Traceback: {traceback.format_exc()}", level=utils.LOGERROR)
         return None
-    finally:
-        try:
-            if response is not None:
-                response.close()
-        except:
-            pass
 
-def _extract_from_blogspot(iframe_src, player_url, session, timeout, preferred_quality):
-    """Extract video from Blogspot iframe (used for Movies)
+@utils.timed('resolve.player_page')
+def _fetch_player_page(session, player_url, timeout):
+    """Fetch a candidate player page, reading only as far as its player
     
     Args:
-        iframe_src (str): Blogspot iframe URL
-        player_url (str): The player page URL (for referer)
         session: Requests session
+        player_url (str): Candidate player page URL
         timeout (int): Request timeout
-        preferred_quality (str): Preferred video quality
         
     Returns:
-        dict: Video URL info or None
+        pagescan.PlayerPage: Player elements if the page has a video or iframe, otherwise None
     """
-    utils.log("Fetching Blogspot iframe content")
+    if health.is_negative(player_url):
+        return None
     
-    iframe_response = None
     try:
-        iframe_headers = HEADERS.copy()
-        iframe_headers['Referer'] = player_url
+        utils.log(f"Fetching player page: {player_url}", level=utils.LOGERROR)
+        status, page = pagescan.fetch(session, player_url, timeout)
+        if page is None:
+            utils.log(f"Player page returned {status}", level=utils.LOGERROR)
+            if health.is_dead_status(status):
+                health.add_negative(player_url, f'status {status}')
+            return None
+    except requests.exceptions.RequestException as e:
+        utils.log(f"Player page failed: {e}", level=utils.LOGERROR)
+        return None
+    
+    if not page.has_player:
+        return None
+    return page
+
+
+@utils.timed('resolve.info_page')
+def _find_player_from_info_page(session, info_url, timeout):
+    """Find the player page through an info (/anime/) page
+    
+    The info page is used directly if it embeds a player. Otherwise the player
+    links it lists are fetched concurrently and the first usable one, in the
+    order of the page, wins.
+    
+    Args:
+        session: Requests session
+        info_url (str): Info page URL
+        timeout (int): Request timeout
+        
+    Returns:
+        tuple: (player_url, pagescan.PlayerPage) or (None, None)
+    """
+    response = session.get(info_url, timeout=timeout, allow_redirects=True)
+    try:
+        response.raise_for_status()
+        soup = BeautifulSoup(response.content, 'html.parser')
+    finally:
+        response.close()
+    
+    page = pagescan.PlayerPage.from_soup(soup)
+    if page.has_player:
+        return info_url, page
+    
+    links = []
+    for link in soup.select('.eplister a[href], .lastend a[href], .inepcx a[href]'):
+        href = urljoin(info_url, link['href'])
+        if href != info_url and '/anime/' not in href and href not in links:
+            links.append(href)
+    links = links[:MAX_INFO_PAGE_LINKS]
+    
+    if not links:
+        return None, None
+    
+    utils.log(f"Trying {len(links)} player link(s) from info page", level=utils.LOGERROR)
+    # Fetched concurrently, but picked in page order so the same title always
+    # plays the same episode; the fetches still running are not waited for
+    executor = ThreadPoolExecutor(max_workers=len(links))
+    futures = [executor.submit(utils.bind_spans(_fetch_player_page), session, link, timeout) for link in links]
+    try:
+        for link, future in zip(links, futures):
+            player_page = future.result()
+            if player_page is not None:
+                return link, player_page
+        return None, None
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+@extractors.register
+class BlogspotExtractor(extractors.Extractor):
+    """Blogspot video iframes (used for Movies)"""
+    
+    name = 'blogspot'
+    hosts = ('blogspot',)
+    
+    def strategies(self):
+        return [('video_tag', self.video_tag)]
+    
+    def video_tag(self, context):
+        """Read the qualities from the <source> tags of the iframe's video
         
-        iframe_response = session.get(iframe_src, headers=iframe_headers, timeout=timeout, allow_redirects=True)
-        iframe_response.raise_for_status()
-        iframe_soup = BeautifulSoup(iframe_response.content, 'html.parser')
+        Args:
+            context (ExtractionContext): Extraction inputs
+            
+        Returns:
+            dict: Video URL info or None
+        """
+        utils.log("Fetching Blogspot iframe content")
         
-        iframe_response.close()
-        iframe_response = None
+        iframe_headers = HEADERS.copy()
+        iframe_headers['Referer'] = context.player_url
         
-        video_tag = iframe_soup.find('video')
-        if not video_tag:
+        with utils.span('blogspot.iframe'):
+            status, iframe_page = pagescan.fetch(context.session, context.iframe_src, context.timeout,
+                                                 headers=iframe_headers)
+        if iframe_page is None:
+            utils.log(f"Blogspot iframe returned {status}", level=utils.LOGERROR)
+            return None
+        
+        if not iframe_page.has_video:
             utils.log("No video tag in Blogspot iframe", level=utils.LOGERROR)
             return None
         
-        sources = video_tag.find_all('source')
-        if not sources:
+        if not iframe_page.sources:
             utils.log("No video sources in Blogspot iframe", level=utils.LOGERROR)
             return None
         
-        video_urls = {}
-        for source in sources:
-            src = source.get('src')
-            quality = source.get('size', 'unknown')
-            if src and quality != 'unknown':
-                if src.startswith('//'):
-                    src = 'https:' + src
-                video_urls[quality] = src
+        video_urls = iframe_page.get_video_urls()
         
         utils.log(f"Found Blogspot qualities: {list(video_urls.keys())}")
-        return _select_quality(video_urls, preferred_quality)
-        
-    except Exception as e:
-        utils.log(f"Error extracting from Blogspot: {e}", level=utils.LOGERROR)
-        return None
-    finally:
-        if iframe_response is not None:
-            try:
-                iframe_response.close()
-            except:
-                pass
+        return _select_quality(video_urls, context.preferred_quality)
+
 
 
-def _extract_from_filemoon(iframe_src, player_url, session, timeout, preferred_quality):
-    """Extract video from Filemoon - find the HLS master.m3u8 URL"""
-    utils.log("=== FILEMOON EXTRACTION START ===", level=utils.LOGERROR)
-    utils.log(f"Iframe URL: {iframe_src}", level=utils.LOGERROR)
+@extractors.register
+class FilemoonExtractor(extractors.Extractor):
+    """Filemoon embeds (used for Episodes): find the HLS master.m3u8 URL
     
-    if iframe_src.startswith('//'):
-        iframe_src = 'https:' + iframe_src
+    prepare() fetches the embed page once. The playlist URLs written in the
+    page are probed concurrently, the first valid one wins with method priority
+    (master > tokenized) breaking ties. Scanning the page's JavaScript files is
+    the other strategy.
+    """
     
-    try:
-        import re
-        from urllib.parse import urlparse, urljoin
+    name = 'filemoon'
+    hosts = ('filemoon',)
+    
+    def prepare(self, context):
+        utils.log("=== FILEMOON EXTRACTION START ===", level=utils.LOGERROR)
+        utils.log(f"Iframe URL: {context.iframe_src}", level=utils.LOGERROR)
         
-        # Fetch the embed page
         filemoon_headers = HEADERS.copy()
-        filemoon_headers['Referer'] = player_url
+        filemoon_headers['Referer'] = context.player_url
         filemoon_headers['Accept'] = 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
         
         utils.log("Fetching Filemoon embed page...", level=utils.LOGERROR)
-        response = session.get(iframe_src, headers=filemoon_headers, timeout=timeout, allow_redirects=True)
-        response.raise_for_status()
-        
-        html = response.text
-        response.close()
+        with utils.span('filemoon.embed'):
+            response = context.session.get(context.iframe_src, headers=filemoon_headers,
+                                           timeout=context.timeout, allow_redirects=True)
+            try:
+                response.raise_for_status()
+                html = response.text
+            finally:
+                response.close()
         
         utils.log(f"Page HTML length: {len(html)} chars", level=utils.LOGERROR)
         
-        # METHOD 1: Search for master.m3u8 URLs directly in the page
-        # These would be the full URLs with tokens
-        master_m3u8_pattern = r'(https?://[a-z0-9\.\-]+\.com/hls[0-9]?/[^"\'\s<>]+/master\.m3u8[^"\'\s<>]*)'
-        master_matches = re.findall(master_m3u8_pattern, html, re.IGNORECASE)
+        context.html = html
+        context.embed_headers = filemoon_headers
+        # Candidate URLs already probed by any strategy
+        context.seen = set()
+    
+    def strategies(self):
+        return [('page_playlists', self.page_playlists), ('js_scan', self.js_scan)]
+    
+    def page_playlists(self, context):
+        """METHOD 1 (master.m3u8 URLs with tokens) and METHOD 2 (any .m3u8 URL
+        with query parameters) from the embed page, probed together"""
+        master_headers = HEADERS.copy()
+        master_headers['Referer'] = context.iframe_src
+        master_headers['Origin'] = 'https://filemoon.in'
+        
+        tokenized_headers = HEADERS.copy()
+        tokenized_headers['Referer'] = context.iframe_src
+        
+        # Ranked best first, the rank breaks ties between probes finishing together
+        candidates = []
+        for rank, (kind, m3u8_url) in enumerate(m3u8scan.find_candidates(context.html, exclude=context.seen)):
+            context.seen.add(m3u8_url)
+            if kind == m3u8scan.MASTER:
+                candidates.append((rank, m3u8_url, master_headers, True))
+            else:
+                candidates.append((rank, m3u8_url, tokenized_headers, False))
+        
+        utils.log(f"Found {len(candidates)} M3U8 candidate(s) in HTML", level=utils.LOGERROR)
+        
+        # Expired tokens are ranked last and only probed when nothing else works
+        fresh = [candidate for candidate in candidates if not m3u8scan.is_expired(candidate[1])]
+        for tier in (fresh, candidates[len(fresh):]):
+            if not tier:
+                continue
+            found = _probe_candidates(get_probe_session(), tier)
+            if found:
+                return _hls_result(*found, preferred_quality=context.preferred_quality)
+        return None
+    
+    def js_scan(self, context):
+        """METHOD 3: fetch the page's JavaScript files and search them"""
+        utils.log("Searching JavaScript files...", level=utils.LOGERROR)
         
-        if master_matches:
-            utils.log(f"Found {len(master_matches)} master.m3u8 URL(s) in HTML", level=utils.LOGERROR)
-            
-            for m3u8_url in master_matches:
-                # Clean up the URL
-                m3u8_url = m3u8_url.split('\\')[0].split('"')[0].split("'")[0]
-                
-                utils.log(f"Testing: {m3u8_url[:100]}...", level=utils.LOGERROR)
-                
-                try:
-                    test_headers = HEADERS.copy()
-                    test_headers['Referer'] = iframe_src
-                    test_headers['Origin'] = 'https://filemoon.in'
-                    
-                    test_resp = session.get(m3u8_url, headers=test_headers, timeout=5)
-                    
-                    if test_resp.status_code == 200:
-                        content = test_resp.text
-                        
-                        # Check if it's a valid M3U8 playlist
-                        if '#EXTM3U' in content and '#EXT-X-STREAM-INF' in content:
-                            utils.log(f"SUCCESS: Valid M3U8 playlist found!", level=utils.LOGERROR)
-                            utils.log(f"Full URL: {m3u8_url}", level=utils.LOGERROR)
-                            test_resp.close()
-                            
-                            return {
-                                'url': m3u8_url,
-                                'quality': 'auto',
-                                'type': 'hls'
-                            }
-                    
-                    test_resp.close()
-                    utils.log(f"Not valid (status {test_resp.status_code})", level=utils.LOGERROR)
-                    
-                except Exception as e:
-                    utils.log(f"Test failed: {e}", level=utils.LOGERROR)
-                    continue
+        js_urls = []
+        for js_url in SCRIPT_SRC_PATTERN.findall(context.html):
+            if not js_url.startswith('http'):
+                js_url = urljoin(context.iframe_src, js_url)
+            if js_url not in js_urls:
+                js_urls.append(js_url)
         
-        # METHOD 2: Search for ANY .m3u8 URLs (not just master.m3u8)
-        utils.log("Searching for any .m3u8 URLs...", level=utils.LOGERROR)
+        if not js_urls:
+            return None
+        found = _scan_js_files(context.session, js_urls, context.embed_headers, context.timeout,
+                               context.iframe_src, context.seen)
+        return _hls_result(*found, preferred_quality=context.preferred_quality) if found else None
+
+
+
+@utils.timed('filemoon.probe')
+def _probe_m3u8(session, m3u8_url, headers, require_variants, cancelled):
+    """Fetch a candidate playlist and check that it is a usable M3U8
+    
+    Args:
+        session: Requests session
+        m3u8_url (str): Candidate playlist URL
+        headers (dict): Request headers
+        require_variants (bool): Also require #EXT-X-STREAM-INF (master playlist)
+        cancelled (threading.Event): Set when another probe has already won
         
-        any_m3u8_pattern = r'(https?://[^\s"\'<>]+\.m3u8[^\s"\'<>]*)'
-        any_matches = re.findall(any_m3u8_pattern, html)
+    Returns:
+        str: Playlist text if valid, otherwise None
+    """
+    if cancelled.is_set() or health.is_negative(m3u8_url):
+        return None
+    
+    response = None
+    try:
+        utils.log(f"Testing: {m3u8_url[:100]}...", level=utils.LOGERROR)
+        response = session.get(m3u8_url, headers=headers, timeout=PROBE_TIMEOUT, stream=True)
         
-        if any_matches:
-            utils.log(f"Found {len(any_matches)} .m3u8 URL(s)", level=utils.LOGERROR)
-            
-            for m3u8_url in any_matches:
-                m3u8_url = m3u8_url.split('\\')[0].split('"')[0].split("'")[0]
-                
-                # Prioritize URLs with query parameters (they likely have auth tokens)
-                if '?' in m3u8_url:
-                    utils.log(f"Testing (has params): {m3u8_url[:100]}...", level=utils.LOGERROR)
-                    
-                    try:
-                        test_headers = HEADERS.copy()
-                        test_headers['Referer'] = iframe_src
-                        
-                        test_resp = session.get(m3u8_url, headers=test_headers, timeout=5)
-                        
-                        if test_resp.status_code == 200 and '#EXTM3U' in test_resp.text:
-                            utils.log(f"SUCCESS: Working M3U8 with auth!", level=utils.LOGERROR)
-                            test_resp.close()
-                            
-                            return {
-                                'url': m3u8_url,
-                                'quality': 'auto',
-                                'type': 'hls'
-                            }
-                        
-                        test_resp.close()
-                    except:
-                        continue
-        
-        # METHOD 3: Fetch JavaScript files and search there
-        utils.log("Searching JavaScript files...", level=utils.LOGERROR)
+        if response.status_code != 200:
+            utils.log(f"Not valid (status {response.status_code})", level=utils.LOGERROR)
+            if health.is_dead_status(response.status_code):
+                health.add_negative(m3u8_url, f'status {response.status_code}')
+            return None
         
-        js_urls = re.findall(r'<script[^>]+src=["\']([^"\']+)["\']', html)
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=8192):
+            if cancelled.is_set():
+                return None
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > MAX_PLAYLIST_BYTES:
+                break
+        
+        content = b''.join(chunks).decode('utf-8', 'replace')
+        if '#EXTM3U' not in content:
+            health.add_negative(m3u8_url, 'invalid playlist')
+            return None
+        if require_variants and '#EXT-X-STREAM-INF' not in content:
+            return None
+        return content
         
-        for js_url in js_urls:
-            # Make full URL
-            if not js_url.startswith('http'):
-                js_url = urljoin(iframe_src, js_url)
-            
-            utils.log(f"Fetching JS: {js_url[:80]}...", level=utils.LOGERROR)
+    except Exception as e:
+        utils.log(f"Test failed: {e}", level=utils.LOGERROR)
+        return None
+    finally:
+        if response is not None:
+            try:
+                response.close()
+            except:
+                pass
+
+
+
+def _probe_candidates(session, candidates, executor=None, cancelled=None):
+    """Probe M3U8 candidates concurrently and return the first valid one
+    
+    Args:
+        session: Requests session
+        candidates (list): Tuples of (priority, url, headers, require_variants)
+        executor: Optional ThreadPoolExecutor to reuse
+        cancelled (threading.Event): Optional shared cancellation flag
+        
+    Returns:
+        tuple: (playlist_url, playlist_text) of the winner, or None
+    """
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(candidates)))
+    if cancelled is None:
+        cancelled = threading.Event()
+    
+    futures = {
+        executor.submit(utils.bind_spans(_probe_m3u8), session, url, headers, require_variants, cancelled): (priority, url)
+        for priority, url, headers, require_variants in candidates
+    }
+    
+    try:
+        for future in as_completed(futures):
+            if not future.result():
+                continue
             
+            # Probes that finished at the same time: prefer the higher priority method
+            winners = [futures[f] + (f.result(),) for f in futures if f.done() and not f.cancelled() and f.result()]
+            priority, url, content = min(winners)
+            utils.log("SUCCESS: Valid M3U8 playlist found!", level=utils.LOGERROR)
+            utils.log(f"Full URL: {url}", level=utils.LOGERROR)
+            return url, content
+        return None
+    finally:
+        cancelled.set()
+        for future in futures:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=False)
+
+
+
+def _scan_js_files(session, js_urls, js_headers, timeout, iframe_src, seen):
+    """Fetch JavaScript files concurrently and probe master.m3u8 URLs found in them
+    
+    Args:
+        session: Requests session
+        js_urls (list): Absolute script URLs
+        js_headers (dict): Headers for script requests
+        timeout (int): Script request timeout
+        iframe_src (str): Embed page URL (used as Referer for probes)
+        seen (set): Candidate URLs already probed
+        
+    Returns:
+        tuple: (playlist_url, playlist_text) of the winner, or None
+    """
+    executor = ThreadPoolExecutor(max_workers=PROBE_WORKERS)
+    cancelled = threading.Event()
+    
+    def fetch_js(js_url):
+        if cancelled.is_set() or health.is_negative(js_url):
+            return ''
+        utils.log(f"Fetching JS: {js_url[:80]}...", level=utils.LOGERROR)
+        with utils.span('filemoon.js'):
+            js_resp = session.get(js_url, headers=js_headers, timeout=timeout)
             try:
-                js_resp = session.get(js_url, headers=filemoon_headers, timeout=timeout)
-                
-                if js_resp.status_code == 200:
-                    js_content = js_resp.text
-                    
-                    # Search for M3U8 URLs in JavaScript
-                    js_m3u8_matches = re.findall(any_m3u8_pattern, js_content)
-                    
-                    if js_m3u8_matches:
-                        utils.log(f"Found {len(js_m3u8_matches)} M3U8 in JS", level=utils.LOGERROR)
-                        
-                        for m3u8_url in js_m3u8_matches:
-                            m3u8_url = m3u8_url.split('\\')[0].split('"')[0]
-                            
-                            if '?' in m3u8_url and 'master.m3u8' in m3u8_url:
-                                utils.log(f"Found master.m3u8 in JS: {m3u8_url[:100]}", level=utils.LOGERROR)
-                                
-                                try:
-                                    test_resp = session.get(m3u8_url, headers={'Referer': iframe_src}, timeout=5)
-                                    if test_resp.status_code == 200 and '#EXTM3U' in test_resp.text:
-                                        utils.log("SUCCESS from JS!", level=utils.LOGERROR)
-                                        test_resp.close()
-                                        js_resp.close()
-                                        
-                                        return {
-                                            'url': m3u8_url,
-                                            'quality': 'auto',
-                                            'type': 'hls'
-                                        }
-                                    test_resp.close()
-                                except:
-                                    continue
-                    
+                if js_resp.status_code != 200:
+                    if health.is_dead_status(js_resp.status_code):
+                        health.add_negative(js_url, f'status {js_resp.status_code}')
+                    return ''
+                return js_resp.content.decode(js_resp.encoding or 'utf-8', 'replace')
+            finally:
                 js_resp.close()
-                
+    
+    futures = [executor.submit(utils.bind_spans(fetch_js), js_url) for js_url in js_urls]
+    try:
+        for future in as_completed(futures):
+            try:
+                js_content = future.result()
             except Exception as e:
                 utils.log(f"JS fetch failed: {e}", level=utils.LOGERROR)
                 continue
-        
-        # If nothing found, log the page for debugging
-        utils.log("FAILED: No M3U8 URL found", level=utils.LOGERROR)
-        utils.log(f"Page preview: {html[:1000]}", level=utils.LOGERROR)
-        
+            
+            candidates = []
+            for rank, (kind, m3u8_url) in enumerate(
+                    m3u8scan.find_candidates(js_content, kinds=(m3u8scan.MASTER,), exclude=seen)):
+                if '?' not in m3u8_url:
+                    continue
+                seen.add(m3u8_url)
+                utils.log(f"Found master.m3u8 in JS: {m3u8_url[:100]}", level=utils.LOGERROR)
+                candidates.append((rank, m3u8_url, {'Referer': iframe_src}, False))
+            
+            if candidates:
+                found = _probe_candidates(get_probe_session(), candidates, executor, threading.Event())
+                if found:
+                    utils.log("SUCCESS from JS!", level=utils.LOGERROR)
+                    return found
         return None
+    finally:
+        cancelled.set()
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+
+def _hls_result(master_url, master_text, preferred_quality):
+    """Build the extraction result for an HLS master playlist
+    
+    The variant matching the preferred quality and measured bandwidth is handed
+    to Kodi directly. The master URL and parsed variants are cached with it:
+    when the variant stops answering, extract_video_url() falls back to the
+    master and lets the player pick a variant.
+    
+    Args:
+        master_url (str): Master playlist URL
+        master_text (str): Master playlist text
+        preferred_quality (str): Preferred video quality
         
-    except Exception as e:
-        utils.log(f"FILEMOON ERROR: {e}", level=utils.LOGERROR)
-        import traceback
-        utils.log(traceback.format_exc(), level=utils.LOGERROR)
-        return None
+    Returns:
+        dict: Video URL info
+    """
+    variants = hls.parse_master(master_text, master_url)
+    variant = hls.select_variant(variants, preferred_quality, hls.get_throughput())
+    
+    if not variant or utils.get_setting('hls_adaptive') == 'true':
+        return {
+            'url': master_url,
+            'quality': 'auto',
+            'type': 'hls',
+            'master': master_url,
+            'variants': variants
+        }
+    
+    utils.log(f"Selected HLS variant {variant['resolution']} @ {variant['bandwidth'] // 1000}kbps "
+              f"out of {len(variants)}", level=utils.LOGERROR)
+    return {
+        'url': variant['url'],
+        'quality': str(variant['height']) if variant['height'] else 'auto',
+        'type': 'hls',
+        'master': master_url,
+        'variants': variants
+    }
 
 
 
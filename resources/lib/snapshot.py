@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+DoraBash Snapshot Module
+Compact memory-mapped files of card records: fixed-size records over a string table
+"""
+
+
+import os
+import mmap
+import struct
+import threading
+from collections.abc import Sequence
+
+
+FIELDS = ('title', 'url', 'thumbnail', 'status', 'type')
+
+# Windows cannot replace a file that any process has mapped, and the plugin
+# and the service each keep the pages they use open, so files are read there
+USE_MMAP = os.name != 'nt'
+
+MAGIC = b'DBSN'
+VERSION = 1
+
+# magic, version, field count, stored, expires, record count, string count
+_HEADER = struct.Struct('<4sHHddII')
+
+# One string table index per field
+_RECORD = struct.Struct(f'<{len(FIELDS)}I')
+
+# Strings are delimited by a table of offsets into the string data
+_OFFSET_SIZE = 4
+
+
+class Card(object):
+    """Card record decoded from a snapshot
+
+    Reads like the dictionaries cards.parse_cards() returns (card['title'],
+    card.get('status', 'N/A')), but holds its five strings in slots.
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, title, url, thumbnail, status, card_type):
+        self.title = title
+        self.url = url
+        self.thumbnail = thumbnail
+        self.status = status
+        self.type = card_type
+
+    def __getitem__(self, key):
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in FIELDS
+
+    def __eq__(self, other):
+        if isinstance(other, (Card, dict)):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f'Card({self.to_dict()!r})'
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in FIELDS else default
+
+    def keys(self):
+        return FIELDS
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in FIELDS}
+
+
+class Snapshot(Sequence):
+    """Card records of a snapshot file, memory-mapped or read into bytes
+
+    Opening one reads only the header. A record is decoded when it is
+    indexed, so checking whether a page is fresh, or showing its first items,
+    does not touch the rest of the file.
+    """
+
+    def __init__(self, mapped):
+        magic, version, fields, self.stored, self.expires, self._count, strings = _HEADER.unpack_from(mapped)
+        if magic != MAGIC or version != VERSION or fields != len(FIELDS):
+            raise ValueError('not a card snapshot')
+        self._map = mapped
+        self._strings = strings
+        self._offsets = _HEADER.size + self._count * _RECORD.size
+        self._data = self._offsets + (strings + 1) * _OFFSET_SIZE
+        self._spans = None
+        if self._data > len(mapped):
+            raise ValueError('truncated card snapshot')
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._record(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('snapshot index out of range')
+        return self._record(index)
+
+    def _record(self, index):
+        if self._spans is None:
+            # The string offsets are read once, on the first record decoded
+            self._spans = struct.unpack_from(f'<{self._strings + 1}I', self._map, self._offsets)
+        spans = self._spans
+        data = self._data
+        mapped = self._map
+        return Card(*[str(mapped[data + spans[i]:data + spans[i + 1]], 'utf-8')
+                      for i in _RECORD.unpack_from(mapped, _HEADER.size + index * _RECORD.size)])
+
+
+
+def encode(records, stored, expires):
+    """Encode card records into a snapshot
+
+    Every distinct string is stored once, so repeated values (status, type)
+    cost four bytes per record.
+
+    Args:
+        records (list): Card records (missing fields are stored as '')
+        stored (float): Time the records were parsed
+        expires (float): Time the records expire
+
+    Returns:
+        bytes: Snapshot file contents
+    """
+    strings = {}
+    data = []
+    offsets = [0]
+    record_table = []
+    for record in records:
+        indexes = []
+        for field in FIELDS:
+            value = record.get(field) or ''
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(data)
+                data.append(value.encode('utf-8'))
+                offsets.append(offsets[-1] + len(data[-1]))
+            indexes.append(index)
+        record_table.append(_RECORD.pack(*indexes))
+
+    header = _HEADER.pack(MAGIC, VERSION, len(FIELDS), stored, expires, len(record_table), len(data))
+    return b''.join([header, b''.join(record_table),
+                     struct.pack(f'<{len(offsets)}I', *offsets), b''.join(data)])
+
+
+
+def write(path, records, stored, expires):
+    """Atomically write card records to a snapshot file
+
+    Args:
+        path (str): File path
+        records (list): Card records
+        stored (float): Time the records were parsed
+        expires (float): Time the records expire
+    """
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(encode(records, stored, expires))
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        os.remove(tmp_path)
+        raise
+
+
+
+def load(path):
+    """Open a snapshot file
+
+    The file is mapped, except on Windows (see USE_MMAP) where it is read.
+    A mapping stays valid when the file is replaced (the new file is a new
+    inode), and is closed once the Snapshot is no longer referenced.
+
+    Args:
+        path (str): File path
+
+    Returns:
+        Snapshot: Card records, or None if the file is missing or not a snapshot
+    """
+    try:
+        with open(path, 'rb') as f:
+            if USE_MMAP:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                mapped = f.read()
+    except (OSError, ValueError):
+        # Missing, unreadable or empty
+        return None
+    try:
+        return Snapshot(mapped)
+    except (ValueError, struct.error):
+        if USE_MMAP:
+            mapped.close()
+        return None
@@ -3,10 +3,17 @@
 Utility functions for Dora Bash addon
 """
 
+import os
 import sys
+import math
+import json
+import time
+import threading
+import functools
 import xbmc
 import xbmcgui
 import xbmcaddon
+import xbmcvfs
 
 # Log levels
 LOGDEBUG = xbmc.LOGDEBUG
@@ -18,6 +25,31 @@ _addon = xbmcaddon.Addon()
 _addon_name = _addon.getAddonInfo('name')
 
 
+def get_addon():
+    """Get the shared Addon instance
+    
+    Returns:
+        xbmcaddon.Addon: Addon instance, re-created by refresh_addon()
+    """
+    return _addon
+
+
+def refresh_addon():
+    """Re-create the shared Addon instance
+    
+    Called at the start of every plugin call and every service loop. With
+    reuselanguageinvoker the plugin interpreter outlives a single call, and
+    the service's lives as long as Kodi; an old Addon instance could keep
+    returning the settings it was created with.
+    
+    Returns:
+        xbmcaddon.Addon: New addon instance
+    """
+    global _addon
+    _addon = xbmcaddon.Addon()
+    return _addon
+
+
 def log(message, level=LOGINFO):
     """Log a message to Kodi log
     
@@ -86,6 +118,15 @@ def get_icon():
     return _addon.getAddonInfo('icon')
 
 
+def is_metered():
+    """Check whether the user marked the connection as metered
+    
+    Returns:
+        bool: True if speculative downloads should be avoided
+    """
+    return _addon.getSetting('metered_connection') == 'true'
+
+
 def get_setting(setting_id):
     """Get addon setting value
     
@@ -106,3 +147,273 @@ def set_setting(setting_id, value):
         value (str): Setting value
     """
     _addon.setSetting(setting_id, value)
+
+
+def get_profile_path(*parts):
+    """Get a path inside the addon profile directory
+    
+    The parent directory of the returned path is created if it does not exist.
+    
+    Args:
+        *parts (str): Path components relative to the profile directory
+        
+    Returns:
+        str: Absolute filesystem path
+    """
+    profile = xbmcvfs.translatePath(_addon.getAddonInfo('profile'))
+    path = os.path.join(profile, *parts)
+    directory = os.path.dirname(path) if parts else path
+    if not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
+    return path
+
+
+def read_json(path, default=None):
+    """Read a JSON file, returning a default value if it is missing or invalid
+    
+    Args:
+        path (str): File path
+        default: Value returned when the file cannot be read
+        
+    Returns:
+        Parsed JSON data or default
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def get_mtime(path):
+    """Get the modification time of a file, or 0 if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def write_json(path, data):
+    """Atomically write data to a JSON file
+    
+    Args:
+        path (str): File path
+        data: JSON-serialisable data
+    """
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+# ---------------------------------------------------------------------------
+# Timing spans
+# ---------------------------------------------------------------------------
+
+TIMINGS_FILE = 'timings.jsonl'
+MAX_TIMINGS_BYTES = 256 * 1024
+
+# Finished spans wait in a per-thread buffer until that thread flushes them;
+# work handed to helper threads is bound to the buffer of its submitter
+_spans_lock = threading.Lock()
+_span_state = threading.local()
+
+
+
+def _span_buffer():
+    buffer = getattr(_span_state, 'buffer', None)
+    if buffer is None:
+        buffer = _span_state.buffer = []
+    return buffer
+
+
+class Span(object):
+    """Timer for one stage of work
+    
+    Use as a context manager. Requests made through the scraper session while
+    the span is current (on the same thread) add their status and size to it.
+    """
+    
+    def __init__(self, name, **fields):
+        self.name = name
+        self.fields = fields
+        self.statuses = []
+        self.bytes = 0
+        self.started = None
+    
+    def set(self, **fields):
+        """Attach extra fields (e.g. cache='hit') to the span"""
+        self.fields.update(fields)
+    
+    def add_response(self, status, size=0):
+        """Record an HTTP response made during the span"""
+        self.statuses.append(status)
+        self.bytes += size
+    
+    def add_bytes(self, size):
+        """Record bytes downloaded during the span"""
+        self.bytes += size
+    
+    def __enter__(self):
+        self.started = time.perf_counter()
+        stack = getattr(_span_state, 'stack', None)
+        if stack is None:
+            stack = _span_state.stack = []
+        stack.append(self)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = (time.perf_counter() - self.started) * 1000
+        stack = _span_state.stack
+        if stack and stack[-1] is self:
+            stack.pop()
+        
+        record = dict(self.fields)
+        record['stage'] = self.name
+        record['ms'] = round(elapsed, 1)
+        record['bytes'] = self.bytes
+        if self.statuses:
+            record['status'] = self.statuses
+        if exc_type is not None:
+            record['error'] = exc_type.__name__
+        
+        if _addon.getSetting('record_timings') != 'true':
+            # Nothing would be written, and threads that never flush would
+            # keep their spans for as long as the interpreter lives
+            return False
+        with _spans_lock:
+            _span_buffer().append(record)
+        return False
+
+
+def span(name, **fields):
+    """Create a timing span for a stage
+    
+    Args:
+        name (str): Stage name, e.g. 'resolve.player_page'
+        **fields: Extra fields stored with the span
+        
+    Returns:
+        Span: Context manager
+    """
+    return Span(name, **fields)
+
+
+def timed(name):
+    """Decorator running the whole function inside a timing span
+    
+    Args:
+        name (str): Stage name
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def current_span():
+    """Get the innermost open span on this thread, or None"""
+    stack = getattr(_span_state, 'stack', None)
+    return stack[-1] if stack else None
+
+
+def bind_spans(func):
+    """Bind a function to the calling thread's pending spans
+    
+    Spans the function records on a helper thread (e.g. in an executor) are
+    then flushed with those of the thread that submitted it.
+    
+    Args:
+        func (callable): Function to run on another thread
+        
+    Returns:
+        callable: Wrapped function
+    """
+    buffer = _span_buffer()
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        previous = getattr(_span_state, 'buffer', None)
+        _span_state.buffer = buffer
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _span_state.buffer = previous
+    return wrapper
+
+
+def flush_spans(invocation):
+    """Write the spans recorded by this invocation as one JSON line
+    
+    Only the calling thread's spans (and those of work bound to it with
+    bind_spans) are written, so service workers flushing on their own
+    threads do not pick up each other's spans. Nothing is written unless
+    timing recording is enabled in settings. The file is rotated once it
+    grows beyond MAX_TIMINGS_BYTES.
+    
+    Args:
+        invocation (str): Name of the invocation (e.g. the plugin mode)
+    """
+    with _spans_lock:
+        buffer = _span_buffer()
+        spans = list(buffer)
+        del buffer[:]
+    
+    if not spans or _addon.getSetting('record_timings') != 'true':
+        return
+    
+    try:
+        path = get_profile_path(TIMINGS_FILE)
+        if os.path.exists(path) and os.path.getsize(path) > MAX_TIMINGS_BYTES:
+            os.replace(path, f'{path}.1')
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'ts': int(time.time()), 'invocation': invocation, 'spans': spans}) + '\n')
+    except OSError as e:
+        log(f"Error writing timings: {e}", level=LOGERROR)
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    index = max(0, math.ceil(percent / 100.0 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def get_timing_summary():
+    """Summarise recorded spans per stage
+    
+    Returns:
+        list: Dictionaries with stage, count, p50, p95, avg_bytes and hit_rate
+        (None when the stage never recorded cache use), sorted by stage
+    """
+    path = get_profile_path(TIMINGS_FILE)
+    stages = {}
+    for filename in (f'{path}.1', path):
+        try:
+            with open(filename, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+        except OSError:
+            continue
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            for record in entry.get('spans', []):
+                stages.setdefault(record.get('stage', '?'), []).append(record)
+    
+    summary = []
+    for stage, records in sorted(stages.items()):
+        durations = [r.get('ms', 0) for r in records]
+        cached = [r['cache'] for r in records if 'cache' in r]
+        summary.append({
+            'stage': stage,
+            'count': len(records),
+            'p50': _percentile(durations, 50),
+            'p95': _percentile(durations, 95),
+            'avg_bytes': sum(r.get('bytes', 0) for r in records) // len(records),
+            'hit_rate': (sum(1 for c in cached if c != 'miss') * 100.0 / len(cached)) if cached else None
+        })
+    return summary
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""
+Dora Bash Kodi Addon
+Background service that warms the listing caches while Kodi is idle,
+runs the read-ahead proxy, resolves play queues and listings ahead
+and runs offline downloads
+"""
+
+import time
+import xbmc
+import xbmcgui
+
+from resources.lib import utils
+
+
+CATEGORIES = ('hindi-dubbed-movies', 'english-subbed-movies')
+
+STATE_FILE = 'service.json'
+
+# Seconds between checks whether a refresh is due
+CHECK_INTERVAL = 60
+
+HOME_WINDOW = 10000
+
+# Player receiving the events that resolve the next "Play from here" item.
+# Nothing calls it, but Kodi only delivers events while it is referenced.
+_queue_player = None
+
+
+def _get_int_setting(setting_id, default):
+    """Read an integer setting, falling back to a default"""
+    try:
+        return int(utils.get_setting(setting_id))
+    except ValueError:
+        return default
+
+
+def _is_due(state):
+    """Check whether the schedule and the idle condition allow a refresh"""
+    if utils.get_setting('service_enabled') == 'false':
+        return False
+
+    interval = _get_int_setting('service_interval', 6) * 3600
+    if time.time() - state.get('last_run', 0) < interval:
+        return False
+
+    idle = _get_int_setting('service_idle', 5) * 60
+    if xbmc.getGlobalIdleTime() < idle:
+        return False
+
+    return not xbmc.Player().isPlaying()
+
+
+def warm_listings(monitor):
+    """Refresh the first pages of every category into the listing store
+
+    Args:
+        monitor (xbmc.Monitor): Monitor used to stop on abort
+
+    Returns:
+        bool: True if every page was processed
+    """
+    from resources.lib import scraper
+
+    pages = _get_int_setting('service_pages', 3)
+    # Keep warmed pages until the next scheduled refresh
+    ttl = (_get_int_setting('service_interval', 6) + 1) * 3600
+
+    utils.log(f"Service: warming {pages} page(s) per category")
+
+    for category in CATEGORIES:
+        for page in range(1, pages + 1):
+            if monitor.abortRequested():
+                return False
+            try:
+                if not scraper.get_movies(page, category, refresh=True, ttl=ttl):
+                    break
+            except Exception as e:
+                utils.log(f"Service: error warming {category} page {page}: {e}", level=xbmc.LOGWARNING)
+                break
+
+    return True
+
+
+def _stop_proxy(server):
+    """Withdraw the proxy port so new playback goes direct, then stop the proxy"""
+    from resources.lib import proxy
+    xbmcgui.Window(HOME_WINDOW).clearProperty(proxy.PORT_PROPERTY)
+    server.stop()
+
+
+def _sync_proxy(server):
+    """Start or stop the read-ahead proxy to match the settings
+
+    The port of a running proxy is published as a home window property, which
+    play_video() reads to route playback through it.
+
+    Args:
+        server (proxy.ProxyServer): Running proxy, or None
+
+    Returns:
+        proxy.ProxyServer: Running proxy, or None
+    """
+    from resources.lib import proxy
+    enabled = proxy.is_enabled()
+
+    if server is not None and not enabled:
+        _stop_proxy(server)
+        return None
+
+    if server is None and enabled:
+        try:
+            server = proxy.ProxyServer(prefetch=proxy.get_prefetch(), buffer_bytes=proxy.get_buffer_bytes())
+        except OSError as e:
+            utils.log(f"Service: could not start proxy: {e}", level=xbmc.LOGERROR)
+            return None
+        xbmcgui.Window(HOME_WINDOW).setProperty(proxy.PORT_PROPERTY, str(server.start()))
+
+    return server
+
+
+def _sync_resolve_ahead(worker, monitor):
+    """Start or stop the speculative resolve worker to match the settings
+
+    Args:
+        worker (resolve_ahead.ResolveAhead): Running worker, or None
+        monitor (xbmc.Monitor): Monitor used to stop on abort
+
+    Returns:
+        resolve_ahead.ResolveAhead: Running worker, or None
+    """
+    from resources.lib import resolve_ahead
+    enabled = resolve_ahead.is_enabled()
+
+    if worker is not None and not enabled:
+        worker.stop()
+        return None
+
+    if worker is None and enabled:
+        worker = resolve_ahead.ResolveAhead(monitor)
+        worker.start()
+
+    return worker
+
+
+def run():
+    """Service main loop"""
+    global _queue_player
+    utils.log("Service started")
+
+    monitor = xbmc.Monitor()
+    from resources.lib import playqueue
+    _queue_player = playqueue.QueuePlayer(monitor)
+    # Runs queued downloads, resuming any that Kodi's exit interrupted
+    from resources.lib import downloads
+    download_worker = downloads.DownloadWorker(monitor)
+    download_worker.start()
+    state_path = utils.get_profile_path(STATE_FILE)
+    state = utils.read_json(state_path, {})
+    proxy_server = None
+    resolve_worker = None
+
+    try:
+        while not monitor.abortRequested():
+            # The service interpreter lives as long as Kodi, so pick up settings changes
+            utils.refresh_addon()
+            proxy_server = _sync_proxy(proxy_server)
+            resolve_worker = _sync_resolve_ahead(resolve_worker, monitor)
+
+            if _is_due(state):
+                started = time.time()
+                warmed = warm_listings(monitor)
+                utils.flush_spans('service')
+                if warmed:
+                    state['last_run'] = time.time()
+                    utils.write_json(state_path, state)
+                    utils.log(f"Service: listings warmed in {state['last_run'] - started:.1f}s")
+
+            if monitor.waitForAbort(CHECK_INTERVAL):
+                break
+    finally:
+        if proxy_server is not None:
+            _stop_proxy(proxy_server)
+        if resolve_worker is not None:
+            resolve_worker.stop()
+        download_worker.stop()
+
+    utils.log("Service stopped")
+
+
+if __name__ == '__main__':
+    run()